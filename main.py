@@ -23,7 +23,7 @@ from src.ui.styles.stylesheets import StyleSheets
 from src.utils.clear_db_startup import clear_database_on_startup
 from src.utils.ensure_nl_db import ensure_nl_database_schema
 from src.utils.print_filter import mute_print
-from src.utils.path_resolver import get_resource_path, get_data_path
+from src.utils.path_resolver import get_resource_path, ensure_data_dir
 from src.utils.nl_sql_server import NLServerManager
 from src.utils.api_key_manager import APIKeyManager
 
@@ -38,9 +38,9 @@ def ensure_ports_free():
     # We don't need to keep it, just use its port checking method
     temp_manager = NLServerManager()
     
-    # Check and free both ports
-    port_8000_free = temp_manager._check_and_free_port(8000)
-    port_8001_free = temp_manager._check_and_free_port(8001)
+    # Check and free both ports (bind probe first; reclaim only when taken)
+    port_8000_free = temp_manager._probe_port_free(8000) or temp_manager._check_and_free_port(8000)
+    port_8001_free = temp_manager._probe_port_free(8001) or temp_manager._check_and_free_port(8001)
     
     if port_8000_free and port_8001_free:
         print("[Main] Ports 8000 and 8001 are free and ready")
@@ -76,7 +76,7 @@ if __name__ == "__main__":
     mute_print() 
 
     # Ensure data/logs exists (Windows/frozen build: same app base as exe so all log files write here)
-    get_data_path("logs").mkdir(parents=True, exist_ok=True)
+    ensure_data_dir("logs")
 
     # Clear database before starting application
     clear_database_on_startup()
@@ -772,9 +772,11 @@ async def nl_to_chart_config(
 
         content = response.choices[0].message.content.strip()
         log.info("llm_raw_response: %s", content)
+        # Shared by the first parse and the retry parse
+        valid_col_set = frozenset(request.columns)
 
         def _parse():
-            return parse_chart_config(content, request.columns)
+            return parse_chart_config(content, request.columns, valid_col_set=valid_col_set)
 
         try:
             options = _parse()
@@ -801,7 +803,7 @@ async def nl_to_chart_config(
                 content = retry_response.choices[0].message.content.strip()
                 log.info("llm_retry_response: %s", content)
                 try:
-                    options = parse_chart_config(content, request.columns)
+                    options = parse_chart_config(content, request.columns, valid_col_set=valid_col_set)
                 except ValueError:
                     options = get_heuristic_config(request.columns, request.dtypes)
                     log.info("nl_to_chart_config using heuristic fallback")
@@ -1102,6 +1102,7 @@ def load_all_gui(instances, parent, league, mode=None):
                 print("Updated leaderboard league reference")
             if hasattr(parent, 'refresh'):
                 parent.refresh.league = league
+                parent.refresh.invalidate()
                 print("Updated refresh league reference")
         except Exception as e:
             print(f"Warning: Could not update all league references: {e}")
@@ -96,14 +96,7 @@ class VizViewerDialog(QDialog):
         if not hasattr(self, "_scroll_layout") or self._scroll_layout is None:
             return
         self._image_bytes = data
-        if self._figure and HAS_MATPLOTLIB:
-            import matplotlib.pyplot as plt
-            plt.close(self._figure)
-            self._figure = None
-        if self._canvas:
-            self._scroll_layout.removeWidget(self._canvas)
-            self._canvas.deleteLater()
-            self._canvas = None
+        self._release_figure()
         if self._image_label:
             self._scroll_layout.removeWidget(self._image_label)
             self._image_label.deleteLater()
@@ -153,11 +146,24 @@ class VizViewerDialog(QDialog):
             logger.exception("Export image failed")
             QMessageBox.warning(self, "Export failed", str(e))
 
-    def closeEvent(self, event: QCloseEvent):
-        """Close the figure to avoid resource warnings."""
+    def _release_figure(self):
+        """Remove the canvas and return the figure to build_figure's pool for reuse."""
+        if self._canvas:
+            self._scroll_layout.removeWidget(self._canvas)
+            self._canvas.deleteLater()
+            self._canvas = None
         if self._figure and HAS_MATPLOTLIB:
-            import matplotlib.pyplot as plt
-            plt.close(self._figure)
+            from src.visualization.viz_plot_builder import release_figure
+            release_figure(self._figure)
             self._figure = None
+
+    def done(self, result: int):
+        """Accept/reject (Close button, Esc) do not send closeEvent; release here too."""
+        self._release_figure()
+        super().done(result)
+
+    def closeEvent(self, event: QCloseEvent):
+        """Release the figure and drop the displayed image."""
+        self._release_figure()
         self._image_bytes = None
         super().closeEvent(event)
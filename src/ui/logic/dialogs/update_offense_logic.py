@@ -158,43 +158,36 @@ def sort_leaderboard(lst: List[Tuple]) -> List[Tuple]:
     return lst
 
 
-def stat_lst(stat: str, val: int) -> Union[List, str]:
-    """Build stat update list for complex stats; returns list or plain stat string."""
+def stat_lst(stat: str, val: int) -> Union[Tuple, str]:
+    """Build stat update tuple for complex stats; returns tuple or plain stat string."""
     def check(s: str) -> bool:
         lst = ["hit", "bb", "hbp", "so", "put out", "sac fly", "fielder's choice"]
         return s in lst
     
-    one = ["pa"]
-    two = ["pa", "at_bat"]
+    one = ("pa",)
+    two = ("pa", "at_bat")
     if check(stat):
         if stat == "hit":
-            two += [val, "hit"]
-            return two
+            return two + (val, "hit")
         elif stat == "bb":
-            one += [val, "bb"]
-            return one
+            return one + (val, "bb")
         elif stat == "hbp":
-            one += [val, "hbp"]
-            return one
+            return one + (val, "hbp")
         elif stat == "so":
-            two += [val, "so"]
-            return two
+            return two + (val, "so")
         elif stat == "sac fly":
-            two += [val, "sac_fly"]
-            return two
+            return two + (val, "sac_fly")
         elif stat == "fielder's choice":
-            two += [val, "fielder_choice"]
-            return two
+            return two + (val, "fielder_choice")
         elif stat == "put out":
-            two += [val, "put_out"]
-            return two
+            return two + (val, "put_out")
     
     return stat
 
 
-def build_offense_undo_payload(stat_result: Union[List, str]) -> str:
+def build_offense_undo_payload(stat_result: Union[Tuple, str]) -> str:
     """Extract stat type from stat_lst result for undo stack payload."""
-    return stat_result[-1] if isinstance(stat_result, list) else stat_result
+    return stat_result[-1] if isinstance(stat_result, tuple) else stat_result
 
 
 def refresh_leaderboard_logic(league, team_upd, leaderboard_avg: List[Tuple]) -> List[Tuple]:
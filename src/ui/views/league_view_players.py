@@ -57,6 +57,9 @@ class LeagueViewPlayers(QWidget):
 
         self.tree1_top.setObjectName("players - tree1 - top")
         self.tree2_top.setObjectName("players - tree2 - top")
+        # text-only rows: let the view size rows from one item instead of measuring every row
+        self.tree1_top.setUniformRowHeights(True)
+        self.tree2_top.setUniformRowHeights(True)
 
         self.selected_players = None
         self.selected_leaderboard = None
@@ -16,7 +16,11 @@ The manager:
 
 import sys
 import os
+import re
+import codecs
+import functools
 import shutil
+import signal
 import socket
 import subprocess
 import threading
@@ -24,8 +28,9 @@ import time
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, List, Tuple, Any
-from PySide6.QtCore import QProcess, QTimer, Signal, QObject
+from typing import Optional, Callable, List, NamedTuple, Tuple, Any
+from PySide6.QtCore import QProcess, QProcessEnvironment, QTimer, QUrl, Signal, QObject
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
 from src.utils.path_resolver import get_app_base_path, get_database_path
 
@@ -57,8 +62,213 @@ except ImportError:
     test_write = None
     log_event = None
 
-# server_fail_7 (F1b): Only first NLServerManager in process configures file logging and logs init
-_nl_server_logging_configured = False
+# Optional: psutil answers "who is listening on this port" without shelling out to lsof
+_psutil_available = False
+try:
+    import psutil
+    _psutil_available = True
+except ImportError:
+    psutil = None
+
+# server_fail_7 (F1b): Each server logger is configured (handlers + init header) once per process,
+# on first use rather than at manager construction, so app start-up does no log file I/O
+_nl_server_loggers_configured: set = set()
+
+# Network-related environment variables passed to the FastAPI subprocess for proxy/SSL support
+_NETWORK_VARS = (
+    "HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy",
+    "NO_PROXY", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR",
+    "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE",
+)
+
+class _ServerSpec(NamedTuple):
+    """Fixed launch settings for one NL-SQL server; all per-run state lives on NLServerManager."""
+    label: str  # display name in logs and messages
+    port: int
+    script: str  # startup script in nl_sql
+    uvicorn_target: str  # app used with "python -m uvicorn" when the script is missing
+    health_path: str  # readiness endpoint
+    packages: Tuple[str, ...]  # pip packages named in install hints
+
+
+# Per-server settings keyed by server name; handlers take the name and look up the rest here
+_SERVERS = {
+    "fastapi": _ServerSpec("FastAPI", 8000, "start_server.py", "api_call:app", "/docs", ("fastapi", "uvicorn", "openai")),
+    "mcp": _ServerSpec("MCP", 8001, "start_mcp_server.py", "mcp_server:app", "/health", ("fastapi", "uvicorn")),
+}
+
+# Failure causes in a crashed server's combined output, scanned in one pass by _classify_exit; package
+# names are those listed in _SERVERS install hints
+_EXIT_MARKERS_RE = re.compile(
+    r"(?P<uvicorn_missing>uvicorn is not installed|no module named 'uvicorn')"
+    r"|(?P<not_found>not installed|no module named)"
+    r"|(?P<failed_import>failed to import)"
+    r"|(?P<import>import)"
+    r"|(?P<error>error)"
+    r"|(?P<package>" + "|".join(sorted({pkg for spec in _SERVERS.values() for pkg in spec.packages})) + ")",
+    re.IGNORECASE,
+)
+
+
+def _classify_exit(output: str, packages: Tuple[str, ...]) -> Optional[str]:
+    """
+    Classify the output of a server that exited with an error.
+
+    Returns the name of a missing package from packages (uvicorn first), "import" for
+    another import error, or None when the raw output should be shown instead.
+    """
+    tags, named = set(), set()
+    for m in _EXIT_MARKERS_RE.finditer(output):
+        tags.add(m.lastgroup)
+        if m.lastgroup == "package":
+            named.add(m.group().lower())
+    if "uvicorn_missing" in tags:
+        return "uvicorn"
+    if "not_found" in tags:
+        missing = next((pkg for pkg in packages if pkg != "uvicorn" and pkg in named), None)
+        if missing:
+            return missing
+    if "failed_import" in tags or {"import", "error"} <= tags:
+        return "import"
+    return None
+
+
+# uvicorn logs this (to stderr) once the listening socket is bound: the earliest moment a
+# readiness GET can succeed, so verification starts on it instead of waiting for a timer
+_READY_PHRASE = "Uvicorn running on"
+
+# Server stderr is scanned as raw bytes with case-insensitive patterns: every phrase is ASCII, and
+# IGNORECASE on a bytes pattern folds ASCII only, so no decoded or lower-cased copy is needed
+
+# Keywords that mark a stderr chunk as a real error rather than uvicorn INFO output
+_ACTUAL_ERR_RE = re.compile(rb"error|exception|traceback|failed|fatal|critical|cannot|unable", re.IGNORECASE)
+
+# Startup-failure markers as one alternation, so each chunk is scanned once; the name of the
+# group that matched is the marker tag (see _stderr_markers)
+_STDERR_MARKERS_RE = re.compile(
+    rb"(?P<uvicorn_missing>uvicorn is not installed|no module named 'uvicorn')"
+    rb"|(?P<module_missing>module not found|no module named)"
+    rb"|(?P<port_in_use>address already in use)"
+    rb"|port (?P<port_mention>\d+)",
+    re.IGNORECASE,
+)
+
+
+def _stderr_markers(raw: bytes) -> set:
+    """Return the startup-failure marker tags found in raw stderr bytes; a port mention is tagged port_<number>."""
+    tags = set()
+    for m in _STDERR_MARKERS_RE.finditer(raw):
+        tag = m.lastgroup
+        tags.add(f"port_{m.group(tag).decode()}" if tag == "port_mention" else tag)
+    return tags
+
+
+# Server stdout/stderr decoder factory: incremental, so a multi-byte character split across two reads
+# is decoded once complete instead of being dropped by errors='ignore'
+_new_stream_decoder = functools.partial(codecs.getincrementaldecoder("utf-8"), errors="ignore")
+
+
+# Output ring sizes per stream: a server whose output is also written to its log file keeps only
+# enough for exit classification and the 2000-char failure message
+_RING_CAPACITY = 64 * 1024
+_RING_CAPACITY_FILE_LOGGED = 8 * 1024
+
+
+class _RingLogBuffer:
+    """
+    Fixed-capacity byte ring holding the most recent output of one server stream.
+
+    Writes copy into a preallocated bytearray and drop the oldest bytes on overflow, so
+    memory stays at capacity however long the server runs. snapshot() returns the
+    retained bytes in order; the exit handlers decode it once for error reporting.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int = _RING_CAPACITY):
+        self._buf = bytearray(capacity)
+        self._capacity = capacity
+        self._head = 0  # next write position
+        self._size = 0  # bytes retained (<= capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        n = len(view)
+        cap = self._capacity
+        if n >= cap:
+            self._buf[:] = view[n - cap:]
+            self._head, self._size = 0, cap
+            return
+        end = self._head + n
+        if end <= cap:
+            self._buf[self._head:end] = view
+        else:
+            split = cap - self._head
+            self._buf[self._head:] = view[:split]
+            self._buf[:n - split] = view[split:]
+        self._head = end % cap
+        self._size = min(self._size + n, cap)
+
+    def snapshot(self) -> bytes:
+        if self._size < self._capacity:
+            return bytes(self._buf[:self._size])
+        return bytes(self._buf[self._head:] + self._buf[:self._head])
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_nl_sql_dir() -> Path:
+    """
+    Locate and resolve the nl_sql directory once per process (exists/resolve stat the filesystem).
+
+    When running as a frozen exe, nl_sql is under the bundle root (sys._MEIPASS).
+    Raises FileNotFoundError if it is missing (not cached, so a later call retries).
+    """
+    if getattr(sys, "frozen", False):
+        project_root = Path(sys._MEIPASS)
+    else:
+        # Path structure: project_root/src/utils/nl_sql_server.py
+        project_root = Path(__file__).parent.parent.parent
+    nl_sql_dir = project_root / "nl_sql"
+
+    if not nl_sql_dir.exists():
+        raise FileNotFoundError(
+            f"NL-SQL directory not found: {nl_sql_dir}\n"
+            "Please ensure the nl_sql directory exists in the project root (or is bundled)."
+        )
+
+    if _server_pc_logic_available and normalize_server_paths and getattr(sys, "frozen", False):
+        resolved_nl, resolved_meipass = normalize_server_paths(
+            nl_sql_dir, getattr(sys, "_MEIPASS", None), frozen=True
+        )
+        return resolved_nl
+    return nl_sql_dir.resolve()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_logs_dir() -> Path:
+    """Return data/logs under the app base, created once per process. Raises OSError if not writable."""
+    logs_dir = Path(get_app_base_path()) / "data" / "logs"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    return logs_dir
+
+
+def _read_complete_lines(process: QProcess, channel: QProcess.ProcessChannel) -> bytes:
+    """
+    Drain the complete lines buffered on one output channel of process.
+
+    A trailing partial line stays in QProcess's buffer until its newline arrives (or is read by
+    the finished handler), so the output scanners only ever see whole lines and a phrase such as
+    _READY_PHRASE is never split across two reads.
+    """
+    process.setReadChannel(channel)
+    lines = []
+    while process.canReadLine():
+        lines.append(bytes(process.readLine()))
+    return b"".join(lines)
 
 
 class NLServerManager(QObject):
@@ -92,13 +302,20 @@ class NLServerManager(QObject):
     # Issue 6: port check result from worker thread (queued to main thread)
     _port_check_fastapi_done = Signal(bool)
     _port_check_mcp_done = Signal(bool)
-    # Verification result from worker thread (queued to main thread)
-    _verify_fastapi_done = Signal(bool, object)  # success, error_msg
-    _verify_mcp_done = Signal(bool, object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.nl_sql_dir = self._get_nl_sql_directory()
+        # Subprocess environment parts that do not change between starts (see _build_child_env)
+        self._pythonpath = os.pathsep.join((str(self.nl_sql_dir), str(self.nl_sql_dir.parent)))
+        # When frozen, server subprocess (system Python) must use same app base and DB as main app
+        self._frozen_env = (
+            {"STATMANG_APP_BASE": get_app_base_path(), "STATMANG_DB_PATH": str(get_database_path())}
+            if getattr(sys, "frozen", False)
+            else {}
+        )
+        # Proxy/SSL settings present at startup, captured once for every FastAPI start
+        self._inherited_network_env = {k: os.environ[k] for k in _NETWORK_VARS if k in os.environ}
         
         # FastAPI server process (Port 8000)
         self.fastapi_process: Optional[QProcess] = None
@@ -111,7 +328,7 @@ class NLServerManager(QObject):
         # Track server readiness
         self._fastapi_ready_flag = False
         self._mcp_ready_flag = False
-        self._all_servers_ready_emitted = False  # Prevent multiple emissions
+        self._all_servers_ready = False  # Published combined state; changed only by _set_ready
         # Verification timeout: max retries before emitting failed (stops UI staying stuck)
         self._fastapi_verify_retries = 0
         self._mcp_verify_retries = 0
@@ -127,10 +344,15 @@ class NLServerManager(QObject):
         self.mcp_error_callback: Optional[Callable[[str], None]] = None
         
         # Store accumulated output/error for better error reporting
-        self._fastapi_stdout_buffer: list = []
-        self._fastapi_stderr_buffer: list = []
-        self._mcp_stdout_buffer: list = []
-        self._mcp_stderr_buffer: list = []
+        self._fastapi_stdout_buffer = _RingLogBuffer()
+        self._fastapi_stderr_buffer = _RingLogBuffer()
+        self._mcp_stdout_buffer = _RingLogBuffer()
+        self._mcp_stderr_buffer = _RingLogBuffer()
+        # One incremental decoder per stream so a UTF-8 sequence split across reads is not dropped
+        self._fastapi_stdout_decoder = _new_stream_decoder()
+        self._fastapi_stderr_decoder = _new_stream_decoder()
+        self._mcp_stdout_decoder = _new_stream_decoder()
+        self._mcp_stderr_decoder = _new_stream_decoder()
         
         # In-process servers (Solution 3: when frozen, run uvicorn in threads to use bundled deps)
         self._fastapi_server: Any = None
@@ -140,14 +362,30 @@ class NLServerManager(QObject):
         # Issue 8: cancellable safety timers so we can cancel on verify success
         self._safety_timer_fastapi: Optional[QTimer] = None
         self._safety_timer_mcp: Optional[QTimer] = None
+        # Reusable single-shot timers per server (_{name}_verify_timer, _{name}_restart_timer): the first
+        # readiness check and its retries coalesce on one timer, and a port-in-use restart reads the
+        # stored callbacks when it fires
+        for name in _SERVERS:
+            verify_timer = QTimer(self)
+            verify_timer.setSingleShot(True)
+            verify_timer.timeout.connect(lambda n=name: self._on_verify_timeout(n))
+            setattr(self, f"_{name}_verify_timer", verify_timer)
+            restart_timer = QTimer(self)
+            restart_timer.setSingleShot(True)
+            restart_timer.timeout.connect(lambda n=name: self._start_server(
+                n, getattr(self, f"{n}_output_callback"), getattr(self, f"{n}_error_callback")
+            ))
+            setattr(self, f"_{name}_restart_timer", restart_timer)
         
-        # Setup file logging
-        self._setup_file_logging()
         # Issue 6: port check callbacks run on main thread when emitted from worker
         self._port_check_fastapi_done.connect(self._on_fastapi_port_check_done)
         self._port_check_mcp_done.connect(self._on_mcp_port_check_done)
-        self._verify_fastapi_done.connect(self._on_fastapi_verify_done)
-        self._verify_mcp_done.connect(self._on_mcp_verify_done)
+        # One pooled QNetworkAccessManager for readiness probes: keep-alive connections are reused
+        # per host and replies arrive on the event loop, so no worker thread or blocking HTTP call
+        self._nam = QNetworkAccessManager(self)
+        self._nam.setTransferTimeout(2000)
+        self._nam.finished.connect(self._on_probe_finished)
+        self._server_by_port = {spec.port: name for name, spec in _SERVERS.items()}
     
     def _get_nl_sql_directory(self) -> Path:
         """
@@ -159,27 +397,9 @@ class NLServerManager(QObject):
         - start_server.py (FastAPI startup script)
         - start_mcp_server.py (MCP startup script)
 
-        When running as a frozen exe, nl_sql is under the bundle root (sys._MEIPASS).
+        Resolved once per process (see _resolve_nl_sql_dir).
         """
-        if getattr(sys, "frozen", False):
-            project_root = Path(sys._MEIPASS)
-        else:
-            # Path structure: project_root/src/utils/nl_sql_server.py
-            project_root = Path(__file__).parent.parent.parent
-        nl_sql_dir = project_root / "nl_sql"
-
-        if not nl_sql_dir.exists():
-            raise FileNotFoundError(
-                f"NL-SQL directory not found: {nl_sql_dir}\n"
-                "Please ensure the nl_sql directory exists in the project root (or is bundled)."
-            )
-
-        if _server_pc_logic_available and normalize_server_paths and getattr(sys, "frozen", False):
-            resolved_nl, resolved_meipass = normalize_server_paths(
-                nl_sql_dir, getattr(sys, "_MEIPASS", None), frozen=True
-            )
-            return resolved_nl
-        return nl_sql_dir.resolve()
+        return _resolve_nl_sql_dir()
 
     def _is_windows_store_python_stub(self, exe_path: str) -> bool:
         """Return True if exe_path is the Windows Store 'python' stub (not real Python)."""
@@ -231,160 +451,208 @@ class NLServerManager(QObject):
             return False
         return not self._is_windows_store_python_stub(python_exe)
 
-    def _setup_file_logging(self):
-        """Setup file logging for server output. Logs go to data/logs under app base.
-        server_fail_7 (F1b): Only the first manager in this process adds handlers and logs init; later instances reuse loggers.
+    def _build_child_env(self, process: QProcess, forward_api_env: bool = False) -> QProcessEnvironment:
+        """
+        Build the environment for a server subprocess (shared by FastAPI and MCP).
+
+        PYTHONPATH gets the nl_sql directory first (server modules) and the project root
+        second (src.utils imports), keeping any existing PYTHONPATH. forward_api_env also
+        passes OPENAI_API_KEY and the proxy/SSL variables (FastAPI only).
+        """
+        env = process.processEnvironment()
+        current_pythonpath = env.value("PYTHONPATH", "")
+        env.insert(
+            "PYTHONPATH",
+            os.pathsep.join((self._pythonpath, current_pythonpath)) if current_pythonpath else self._pythonpath,
+        )
+        # Disable reload by default (causes issues with QProcess)
+        env.insert("STATMANG_ENABLE_RELOAD", "false")
+        # Flush child output immediately so readiness messages arrive without delay
+        env.insert("PYTHONUNBUFFERED", "1")
+        for key, value in self._frozen_env.items():
+            env.insert(key, value)
+        if forward_api_env:
+            # IMPORTANT: Pass OPENAI_API_KEY from parent process environment to subprocess
+            # This allows the API key set in the dialog to be available in the server subprocess
+            parent_openai_key = os.getenv("OPENAI_API_KEY")
+            if parent_openai_key:
+                env.insert("OPENAI_API_KEY", parent_openai_key)
+                print("[NL Server Manager] Passing OPENAI_API_KEY to FastAPI server subprocess")
+            for var, value in self._inherited_network_env.items():
+                env.insert(var, value)
+            if self._inherited_network_env:
+                self._fastapi_logger.debug(
+                    "Passing %s to FastAPI server subprocess", ", ".join(self._inherited_network_env)
+                )
+        return env
+
+    @property
+    def _fastapi_logger(self) -> logging.Logger:
+        return self._ensure_logger("fastapi")
+
+    @property
+    def _mcp_logger(self) -> logging.Logger:
+        return self._ensure_logger("mcp")
+
+    def _ensure_logger(self, name: str) -> logging.Logger:
+        """Return the file logger for a server ("fastapi" or "mcp"), building it on first use.
+        Logs go to data/logs/<name>_server.log under app base.
+        server_fail_7 (F1b): Handlers and the init header are added once per process; later calls and instances reuse the logger.
         server_fail_12 P2/P3: On failure (e.g. exe dir not writable), use stream handler only so manager does not raise.
         """
-        global _nl_server_logging_configured
-        if _nl_server_logging_configured:
-            self._fastapi_logger = logging.getLogger("fastapi_server")
-            self._mcp_logger = logging.getLogger("mcp_server")
-            return
-        self._fastapi_logger = logging.getLogger("fastapi_server")
-        self._mcp_logger = logging.getLogger("mcp_server")
-        self._fastapi_logger.setLevel(logging.DEBUG)
-        self._mcp_logger.setLevel(logging.DEBUG)
-        self._fastapi_logger.handlers.clear()
-        self._mcp_logger.handlers.clear()
+        logger = logging.getLogger(f"{name}_server")
+        if name in _nl_server_loggers_configured:
+            return logger
+        _nl_server_loggers_configured.add(name)
+        logger.setLevel(logging.DEBUG)
+        logger.handlers.clear()
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
         try:
-            logs_dir = Path(get_app_base_path()) / "data" / "logs"
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            fastapi_log_file = logs_dir / "fastapi_server.log"
-            fastapi_handler = logging.FileHandler(fastapi_log_file, mode='a', encoding='utf-8')
-            fastapi_handler.setLevel(logging.DEBUG)
-            fastapi_handler.setFormatter(formatter)
-            self._fastapi_logger.addHandler(fastapi_handler)
-            mcp_log_file = logs_dir / "mcp_server.log"
-            mcp_handler = logging.FileHandler(mcp_log_file, mode='a', encoding='utf-8')
-            mcp_handler.setLevel(logging.DEBUG)
-            mcp_handler.setFormatter(formatter)
-            self._mcp_logger.addHandler(mcp_handler)
+            log_file = _resolve_logs_dir() / f"{name}_server.log"
+            handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+            handler.setLevel(logging.DEBUG)
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
             # server_summary_plan_1 §2.5: verify log directory writable
             if _server_pc_logic_available and test_write:
-                test_write(fastapi_log_file, lambda msg: self._fastapi_logger.info(msg))
+                test_write(log_file, lambda msg: logger.info(msg))
+            # Console echo of server output, on the same STATMANG_DEBUG switch that print_filter uses for print
+            if os.environ.get("STATMANG_DEBUG", "0") == "1":
+                console = logging.StreamHandler(sys.stdout)
+                console.setLevel(logging.INFO)
+                console.setFormatter(logging.Formatter(f"[NL {_SERVERS[name].label} Server %(levelname)s] %(message)s"))
+                logger.addHandler(console)
         except (OSError, PermissionError) as e:
             stream = logging.StreamHandler()
             stream.setLevel(logging.DEBUG)
             stream.setFormatter(formatter)
-            self._fastapi_logger.addHandler(stream)
-            self._mcp_logger.addHandler(stream)
-            self._fastapi_logger.warning(f"File logging unavailable ({e}); using stderr only.")
-        self._fastapi_logger.propagate = False
-        self._mcp_logger.propagate = False
-        self._fastapi_logger.info("=" * 80)
-        self._fastapi_logger.info(f"FastAPI Server Logging Initialized - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self._fastapi_logger.info(f"NLServerManager instance created - PID: {os.getpid()}")
-        self._mcp_logger.info("=" * 80)
-        self._mcp_logger.info(f"MCP Server Logging Initialized - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self._mcp_logger.info(f"NLServerManager instance created - PID: {os.getpid()}")
-        # P15: log [server_startup_platform] only once per process (here, when logging is first configured)
-        if _server_pc_logic_available and get_resolved_paths_log_line and getattr(sys, "frozen", False):
+            logger.addHandler(stream)
+            logger.warning(f"File logging unavailable ({e}); using stderr only.")
+        logger.propagate = False
+        logger.info("=" * 80)
+        logger.info(f"{_SERVERS[name].label} Server Logging Initialized - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"NLServerManager logging started - PID: {os.getpid()}")
+        # P15: log [server_startup_platform] only once per process (here, when the FastAPI logger is first configured)
+        if name == "fastapi" and _server_pc_logic_available and get_resolved_paths_log_line and getattr(sys, "frozen", False):
             meipass_path = Path(getattr(sys, "_MEIPASS", "")).resolve() if getattr(sys, "_MEIPASS", None) else None
             line = get_resolved_paths_log_line(self.nl_sql_dir, meipass_path)
-            self._fastapi_logger.info(f"[server_startup_platform] {line}")
-        _nl_server_logging_configured = True
-    
+            logger.info(f"[server_startup_platform] {line}")
+        return logger
+
+    def _probe_port_free(self, port: int) -> bool:
+        """
+        Return True if port can be bound on 127.0.0.1 (nothing is listening on it).
+
+        Single bind attempt used as the fast path before server start; the port is
+        free almost every time, so the heavier _check_and_free_port (listener scan,
+        kill, wait) only runs when this returns False.
+
+        SO_REUSEADDR makes the probe match how uvicorn binds: connections left in
+        TIME_WAIT by a killed server do not block it, only a live listener does.
+        Windows is excluded because SO_REUSEADDR there lets a bind succeed over an
+        active listener.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if not sys.platform.startswith("win"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("127.0.0.1", port))
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+    def _kill_pids(self, pids: List[int]) -> None:
+        """Force-kill each pid with a direct syscall (no kill subprocess). Never kills this process,
+        which owns the port itself when servers run in-process (frozen)."""
+        # Windows has no SIGKILL; os.kill(pid, SIGTERM) calls TerminateProcess there
+        sig = getattr(signal, "SIGKILL", signal.SIGTERM)
+        own_pid = os.getpid()
+        for pid in pids:
+            if pid == own_pid:
+                continue
+            try:
+                os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError, OSError):
+                pass
+
+    def _wait_port_free(self, port: int, timeout_s: float = 2.0, interval_s: float = 0.02) -> bool:
+        """Poll the bind probe until port is free or timeout_s elapses. Returns True as soon as the port binds."""
+        deadline = time.monotonic() + timeout_s
+        while True:
+            if self._probe_port_free(port):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval_s)
+
+    def _listening_pids(self, port: int) -> Optional[List[int]]:
+        """
+        Return pids listening on TCP port via psutil (cross-platform, no subprocess).
+
+        Returns None when psutil is unavailable or cannot answer (e.g. AccessDenied on macOS,
+        or a listener owned by another user whose pid is hidden); callers then fall back to lsof.
+        """
+        if not _psutil_available:
+            return None
+        try:
+            listeners = [
+                c for c in psutil.net_connections(kind='tcp')
+                if c.laddr and c.laddr.port == port and c.status == psutil.CONN_LISTEN
+            ]
+        except (psutil.Error, OSError):
+            return None
+        if any(not c.pid for c in listeners):
+            return None
+        return sorted({c.pid for c in listeners})
+
+    def _pids_on_port(self, port: int) -> Optional[List[int]]:
+        """
+        Return pids listening on port from a single scan: psutil when usable, else one lsof call.
+
+        Returns None when the owner cannot be determined (Windows without psutil, lsof missing
+        or timed out); an empty list means nothing is listening.
+        """
+        pids = self._listening_pids(port)
+        if pids is not None or sys.platform == 'win32':
+            return pids
+        try:
+            # Listeners only, so clients connected to the port (including this app) are never reported
+            result = subprocess.run(
+                ['lsof', '-ti', f'tcp:{port}', '-sTCP:LISTEN'],
+                capture_output=True,
+                timeout=2
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        # lsof -t prints ASCII pids, one per line; exit code 1 with no output means no match
+        return [int(pid) for pid in result.stdout.split()]
+
     def _check_and_free_port(self, port: int) -> bool:
         """
         Check if a port is in use and free it if necessary.
-        
+
+        One listener scan, one kill pass, then an adaptive bind-probe wait.
         Returns True if port is free (or was successfully freed), False otherwise.
         """
         try:
-            # First, try to use lsof to check if anything is using the port
-            # This is more reliable than trying to connect/bind
-            if sys.platform != 'win32':
-                try:
-                    result = subprocess.run(
-                        ['lsof', '-ti', f':{port}'],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        # Port is in use - kill the process(es)
-                        pids = result.stdout.strip().split('\n')
-                        print(f"[NL Server Manager] Port {port} is in use by process(es): {', '.join(pids)}")
-                        for pid in pids:
-                            if pid.strip():
-                                print(f"[NL Server Manager] Killing process {pid} using port {port}")
-                                subprocess.run(
-                                    ['kill', '-9', pid.strip()],
-                                    check=False,
-                                    timeout=5
-                                )
-                        # Wait for cleanup
-                        time.sleep(1.5)
-                        # Verify port is now free
-                        result2 = subprocess.run(
-                            ['lsof', '-ti', f':{port}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2
-                        )
-                        if result2.returncode == 0 and result2.stdout.strip():
-                            print(f"[NL Server Manager] Warning: Port {port} still in use after kill attempt")
-                            return False
-                        else:
-                            print(f"[NL Server Manager] Port {port} successfully freed")
-                            return True
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    # lsof not available or timeout - fall back to socket check
-                    pass
-            
-            # Fallback: Check if port is in use by trying to connect to it
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex(('localhost', port))
-            sock.close()
-            
-            if result == 0:
-                # Port is in use (connection succeeded), but lsof didn't find it
-                # This might be a TIME_WAIT state or the process died
-                # Try lsof one more time with a longer wait
-                print(f"[NL Server Manager] Port {port} appears in use (connection check), attempting to free...")
-                if sys.platform != 'win32':
-                    try:
-                        time.sleep(0.5)  # Brief wait for TIME_WAIT to clear
-                        result = subprocess.run(
-                            ['lsof', '-ti', f':{port}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2
-                        )
-                        if result.returncode == 0 and result.stdout.strip():
-                            pids = result.stdout.strip().split('\n')
-                            for pid in pids:
-                                if pid.strip():
-                                    print(f"[NL Server Manager] Killing process {pid} using port {port}")
-                                    subprocess.run(
-                                        ['kill', '-9', pid.strip()],
-                                        check=False,
-                                        timeout=5
-                                    )
-                            time.sleep(1.5)
-                            # Verify
-                            result2 = subprocess.run(
-                                ['lsof', '-ti', f':{port}'],
-                                capture_output=True,
-                                text=True,
-                                timeout=2
-                            )
-                            if result2.returncode == 0 and result2.stdout.strip():
-                                return False
-                            else:
-                                print(f"[NL Server Manager] Port {port} freed after connection check")
-                                return True
-                    except Exception:
-                        pass
-                # If we can't free it, return False
-                print(f"[NL Server Manager] Could not free port {port} (may be in TIME_WAIT state)")
+            pids = self._pids_on_port(port)
+            if pids is None:
+                # Owner unknown: the bind probe is the only check available
+                if self._probe_port_free(port):
+                    return True
+                print(f"[NL Server Manager] Could not free port {port} (owner unknown)")
                 return False
-            else:
-                # Port is free
+            if not pids:
+                return True
+            print(f"[NL Server Manager] Port {port} is in use by process(es): {', '.join(map(str, pids))}")
+            self._kill_pids(pids)
+            if self._wait_port_free(port):
+                print(f"[NL Server Manager] Port {port} successfully freed")
                 return True
+            print(f"[NL Server Manager] Warning: Port {port} still in use after kill attempt")
+            return False
         except Exception as e:
             print(f"[NL Server Manager] Error checking port {port}: {e}")
             # If we can't check, assume it's okay and let the server try
@@ -415,8 +683,7 @@ class NLServerManager(QObject):
     def _run_fastapi_inprocess(self):
         """Target for FastAPI uvicorn thread (Solution 3: in-process when frozen). server_summary_plan_2 §2.2: deep instrumentation."""
         def _log(msg: str) -> None:
-            if hasattr(self, "_fastapi_logger"):
-                self._fastapi_logger.info(msg)
+            self._fastapi_logger.info(msg)
         try:
             if _server_pc_logic_available and log_event:
                 log_event(_log, "server thread start")
@@ -495,8 +762,7 @@ class NLServerManager(QObject):
     def _run_mcp_inprocess(self):
         """Target for MCP uvicorn thread (Solution 3: in-process when frozen). server_summary_plan_2 §2.2: deep instrumentation."""
         def _log(msg: str) -> None:
-            if hasattr(self, "_mcp_logger"):
-                self._mcp_logger.info(msg)
+            self._mcp_logger.info(msg)
         try:
             if _server_pc_logic_available and log_event:
                 log_event(_log, "server thread start")
@@ -578,15 +844,14 @@ class NLServerManager(QObject):
         self._fastapi_server = None
         self._fastapi_thread = threading.Thread(target=self._run_fastapi_inprocess, daemon=True)
         self._fastapi_thread.start()
-        QTimer.singleShot(0, self._on_fastapi_started)
+        QTimer.singleShot(0, lambda: self._on_started("fastapi"))
         # P3 (server_fail_5) / server_startup_platform: first verification delay from platform config
         first_verify_ms = (
             self._timing["first_verify_ms"]
             if self._timing
             else (10000 if sys.platform.startswith("win") else 6000)
         )
-        QTimer.singleShot(first_verify_ms, self._verify_fastapi_ready)
-        QTimer.singleShot(first_verify_ms, self._do_main_thread_verify_fastapi)  # server_fail_6 (1a)
+        self._fastapi_verify_timer.start(first_verify_ms)
 
     def _start_mcp_inprocess(self, output_callback=None, error_callback=None):
         """Start MCP server in-process (uvicorn in a thread) when frozen. Heavy imports happen in the thread."""
@@ -594,15 +859,14 @@ class NLServerManager(QObject):
         self._mcp_server = None
         self._mcp_thread = threading.Thread(target=self._run_mcp_inprocess, daemon=True)
         self._mcp_thread.start()
-        QTimer.singleShot(0, self._on_mcp_started)
+        QTimer.singleShot(0, lambda: self._on_started("mcp"))
         # P3 (server_fail_5) / server_startup_platform: first verification delay from platform config
         first_verify_ms = (
             self._timing["first_verify_ms"]
             if self._timing
             else (10000 if sys.platform.startswith("win") else 6000)
         )
-        QTimer.singleShot(first_verify_ms, self._verify_mcp_ready)
-        QTimer.singleShot(first_verify_ms, self._do_main_thread_verify_mcp)  # server_fail_6 (1a)
+        self._mcp_verify_timer.start(first_verify_ms)
     
     def _on_fastapi_port_check_done(self, port_ok: bool):
         """Issue 6: Called on main thread after port check worker finishes. Schedule start or emit failed."""
@@ -620,8 +884,7 @@ class NLServerManager(QObject):
             return
         deferred_ms = self._timing["deferred_fastapi_ms"] if self._timing else 800
         safety_ms = self._timing["safety_timeout_ms"] if self._timing else 35000
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info(f"[server_fail_1] Scheduling deferred FastAPI start in {deferred_ms} ms")
+        self._fastapi_logger.info(f"[server_fail_1] Scheduling deferred FastAPI start in {deferred_ms} ms")
         print(f"[NL Server Manager] Scheduling deferred FastAPI start in {deferred_ms} ms")
         output_cb = getattr(self, 'fastapi_output_callback', None)
         error_cb = getattr(self, 'fastapi_error_callback', None)
@@ -654,8 +917,7 @@ class NLServerManager(QObject):
             return
         deferred_ms = self._timing["deferred_mcp_ms"] if self._timing else 300
         safety_ms = self._timing["safety_timeout_ms"] if self._timing else 35000
-        if hasattr(self, '_mcp_logger'):
-            self._mcp_logger.info(f"[server_fail_1] Scheduling deferred MCP start in {deferred_ms} ms")
+        self._mcp_logger.info(f"[server_fail_1] Scheduling deferred MCP start in {deferred_ms} ms")
         print(f"[NL Server Manager] Scheduling deferred MCP start in {deferred_ms} ms")
         output_cb = getattr(self, 'mcp_output_callback', None)
         error_cb = getattr(self, 'mcp_error_callback', None)
@@ -671,215 +933,134 @@ class NLServerManager(QObject):
         self._safety_timer_mcp.timeout.connect(self._safety_timeout_mcp)
         self._safety_timer_mcp.start(safety_ms)
     
-    def start_fastapi_server(self, output_callback=None, error_callback=None):
+    def _start_server(self, name: str, output_callback=None, error_callback=None):
         """
-        Start the FastAPI server for NL-to-SQL (Port 8000).
-        
-        The FastAPI server:
-        - Converts natural language to SQL queries using OpenAI
-        - Communicates with MCP server to get database schema
-        - Validates generated SQL queries
-        - Endpoint: POST /nl_to_sql
-        - API docs: http://localhost:8000/docs
-        
-        Args:
-            output_callback: Optional callback for stdout output (str) -> None
-            error_callback: Optional callback for stderr output (str) -> None
+        Start one NL-SQL server; name is a key of _SERVERS ('fastapi' or 'mcp').
+
+        Frozen (non-Windows) builds run the server in-process after a port check on a worker
+        thread; otherwise the nl_sql startup script (or uvicorn directly, if the script is
+        missing) is launched with QProcess and readiness verification is scheduled.
+        Per-server state lives in the {name}_process, {name}_starting and _{name}_* attributes.
         """
+        label, port, script_name, uvicorn_target = _SERVERS[name][:4]
+        # First start builds this server's log handlers and writes its init header
+        logger = self._ensure_logger(name)
+        failed_signal = getattr(self, f"{name}_failed")
+        process = getattr(self, f"{name}_process")
+        
         # Log server start attempt
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info("\n\n" + "=" * 80)
-            self._fastapi_logger.info(f"Attempting to start FastAPI server - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            self._fastapi_logger.info(f"Current process state: {self.fastapi_process.state() if self.fastapi_process else 'No process'}")
-            self._fastapi_logger.info(f"Already starting: {self.fastapi_starting}")
+        logger.info("\n\n" + "=" * 80)
+        logger.info(f"Attempting to start {label} server - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Current process state: {process.state() if process else 'No process'}")
+        logger.info(f"Already starting: {getattr(self, f'{name}_starting')}")
         
         # Solution 3: when frozen (non-Windows), run server in-process. server_summary_plan_2 §2.7: Windows frozen uses QProcess to avoid uvicorn/PyInstaller quirks.
         if getattr(sys, "frozen", False) and not sys.platform.startswith("win"):
             # Issue 5: clear dead thread so new start can proceed
-            if self._fastapi_thread is not None and not self._fastapi_thread.is_alive():
-                self._fastapi_thread = None
-                self._fastapi_server = None
-                self.fastapi_starting = False
-            if self._fastapi_thread and self._fastapi_thread.is_alive():
-                if hasattr(self, '_fastapi_logger'):
-                    self._fastapi_logger.info("FastAPI in-process server already running, skipping start")
+            thread = getattr(self, f"_{name}_thread")
+            if thread is not None and not thread.is_alive():
+                setattr(self, f"_{name}_thread", None)
+                setattr(self, f"_{name}_server", None)
+                setattr(self, f"{name}_starting", False)
+            elif thread is not None:
+                logger.info(f"{label} in-process server already running, skipping start")
                 return
-            if self.fastapi_starting:
+            if getattr(self, f"{name}_starting"):
                 return
             # Issue 1 & 2: pre-start validation
             ok, err = self._validate_frozen_bundle()
             if not ok:
-                self.fastapi_failed.emit(err or "Bundle validation failed.")
+                failed_signal.emit(err or "Bundle validation failed.")
                 return
             self._ensure_bundle_path()
-            self.fastapi_starting = True
-            self._fastapi_verify_retries = 0
-            self.fastapi_output_callback = output_callback
-            self.fastapi_error_callback = error_callback
-            self._fastapi_stdout_buffer = []
-            self._fastapi_stderr_buffer = []
+            self._reset_start_state(name, output_callback, error_callback)
+            port_check_done = getattr(self, f"_port_check_{name}_done")
             # Issue 6: port check off main thread; signal queues callback to main thread
-            def do_fastapi_port_check():
-                port_ok = self._check_and_free_port(8000)
-                self._port_check_fastapi_done.emit(port_ok)
-            threading.Thread(target=do_fastapi_port_check, daemon=True).start()
+            def do_port_check():
+                port_ok = self._probe_port_free(port) or self._check_and_free_port(port)
+                port_check_done.emit(port_ok)
+            threading.Thread(target=do_port_check, daemon=True).start()
             return
         
-        if self.fastapi_process and self.fastapi_process.state() == QProcess.ProcessState.Running:
-            if hasattr(self, '_fastapi_logger'):
-                self._fastapi_logger.info("FastAPI server already running, skipping start")
+        if process and process.state() == QProcess.ProcessState.Running:
+            logger.info(f"{label} server already running, skipping start")
             return  # Already running
         
-        if self.fastapi_starting:
-            if hasattr(self, '_fastapi_logger'):
-                self._fastapi_logger.info("FastAPI server already starting, skipping start")
+        if getattr(self, f"{name}_starting"):
+            logger.info(f"{label} server already starting, skipping start")
             return  # Already starting
         
-        # Check and free port 8000 before starting
-        port_freed = self._check_and_free_port(8000)
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info(f"Port 8000 check result: {'Freed' if port_freed else 'Already free or could not free'}")
-        # Small delay to ensure port is fully released
-        time.sleep(0.3)
-        
-        self.fastapi_starting = True
-        self._fastapi_verify_retries = 0
-        self.fastapi_output_callback = output_callback
-        self.fastapi_error_callback = error_callback
-        
-        # Clear output buffers for new server start
-        self._fastapi_stdout_buffer = []
-        self._fastapi_stderr_buffer = []
+        # Single bind probe on the fast path; only reclaim the port when it is actually taken
+        if not self._probe_port_free(port):
+            port_freed = self._check_and_free_port(port)
+            logger.info(f"Port {port} check result: {'Freed' if port_freed else 'Could not free'}")
+            if not port_freed:
+                # Don't fail here - let the server try and handle the error if it occurs
+                print(f"[NL Server Manager] Warning: Port {port} might be in use, but proceeding with server start")
         
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info("FastAPI server startup initiated")
+        self._reset_start_state(name, output_callback, error_callback)
+        logger.info(f"{label} server startup initiated")
         
-        # Create QProcess for FastAPI server
-        self.fastapi_process = QProcess(self)
-        self.fastapi_process.setWorkingDirectory(str(self.nl_sql_dir))
+        # Create QProcess for the server
+        process = QProcess(self)
+        setattr(self, f"{name}_process", process)
+        process.setWorkingDirectory(str(self.nl_sql_dir))
         
         # Connect signals to monitor server startup
-        self.fastapi_process.readyReadStandardOutput.connect(self._on_fastapi_output)
-        self.fastapi_process.readyReadStandardError.connect(self._on_fastapi_error)
-        self.fastapi_process.finished.connect(self._on_fastapi_finished)
-        self.fastapi_process.started.connect(self._on_fastapi_started)
-        
-        # Set environment - add both nl_sql directory and project root to PYTHONPATH
-        # This ensures api_call.py and src modules can be imported
-        env = self.fastapi_process.processEnvironment()
-        project_root = self.nl_sql_dir.parent
-        
-        # Get current PYTHONPATH
-        current_pythonpath = env.value("PYTHONPATH", "")
-        pythonpath_parts = []
-        
-        # Add nl_sql directory first (for api_call.py)
-        pythonpath_parts.append(str(self.nl_sql_dir))
-        # Add project root (for src.utils imports)
-        pythonpath_parts.append(str(project_root))
-        
-        # Preserve existing PYTHONPATH if present
-        if current_pythonpath:
-            pythonpath_parts.append(current_pythonpath)
-        
-        # Set new PYTHONPATH
-        new_pythonpath = os.pathsep.join(pythonpath_parts)
-        env.insert("PYTHONPATH", new_pythonpath)
-        
-        # Disable reload by default (causes issues with QProcess)
-        env.insert("STATMANG_ENABLE_RELOAD", "false")
-        
-        # When frozen, server subprocess (system Python) must use same app base and DB as main app
-        if getattr(sys, "frozen", False):
-            env.insert("STATMANG_APP_BASE", get_app_base_path())
-            env.insert("STATMANG_DB_PATH", str(get_database_path()))
-        
-        # IMPORTANT: Pass OPENAI_API_KEY from parent process environment to subprocess
-        # This allows the API key set in the dialog to be available in the server subprocess
-        parent_openai_key = os.getenv("OPENAI_API_KEY")
-        if parent_openai_key:
-            env.insert("OPENAI_API_KEY", parent_openai_key)
-            print(f"[NL Server Manager] Passing OPENAI_API_KEY to FastAPI server subprocess")
-        
-        # Pass network-related environment variables for proxy/SSL support
-        network_vars = [
-            "HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy",
-            "NO_PROXY", "no_proxy",
-            "SSL_CERT_FILE", "SSL_CERT_DIR",
-            "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE"
-        ]
-        for var in network_vars:
-            if var in os.environ:
-                env.insert(var, os.environ[var])
-                print(f"[NL Server Manager] Passing {var} to FastAPI server subprocess")
-        
-        self.fastapi_process.setProcessEnvironment(env)
-        
-        # Start the server using start_server.py script
+        process.readyReadStandardOutput.connect(lambda n=name: self._on_output(n))
+        process.readyReadStandardError.connect(lambda n=name: self._on_error(n))
+        process.finished.connect(lambda code, status, n=name: self._on_finished(n, code, status))
+        process.started.connect(lambda n=name: self._on_started(n))
+        # FailedToStart (missing interpreter, bad permissions, ...) is reported here; a crash after start goes through finished
+        process.errorOccurred.connect(lambda err, n=name: self._on_process_error(n, err))
+        
+        # Set environment: PYTHONPATH (server module + src modules), reload off; FastAPI also gets API key and proxy/SSL vars
+        env = self._build_child_env(process, forward_api_env=(name == "fastapi"))
+        process.setProcessEnvironment(env)
+        
+        # Start the server using its startup script
         python_exe, py_prefix = self._get_python_executable()
         if not self._is_safe_python_for_subprocess(python_exe):
             hint = get_subprocess_python_hint() if _server_pc_logic_available and get_subprocess_python_hint else (
                 "No valid Python found for the server. Install Python, add to PATH, or set STATMANG_PYTHON_EXE to the path to python.exe."
             )
-            self.fastapi_failed.emit(hint)
+            failed_signal.emit(hint)
             return
-        server_script = self.nl_sql_dir / "start_server.py"
-        project_root = self.nl_sql_dir.parent
-        new_pythonpath = env.value("PYTHONPATH", "")
+        server_script = self.nl_sql_dir / script_name
         
-        print("\n\n[NL Server Manager] FastAPI Server Startup:")
+        print(f"\n\n[NL Server Manager] {label} Server Startup:")
         print(f"  Working directory: {self.nl_sql_dir}")
         print(f"  Python executable: {python_exe}")
         print(f"  Script path: {server_script}")
         print(f"  Script exists: {server_script.exists()}")
-        print(f"  Project root: {project_root}")
-        print(f"  PYTHONPATH: {new_pythonpath}")
+        print(f"  Project root: {self.nl_sql_dir.parent}")
+        print(f"  PYTHONPATH: {env.value('PYTHONPATH', '')}")
         
         if server_script.exists():
             # Use the startup script (recommended)
-            # start_server.py handles:
+            # start_server.py / start_mcp_server.py handle:
             # - Adding nl_sql directory to Python path
-            # - Verifying uvicorn and api_call can be imported
+            # - Verifying uvicorn and the server app can be imported
             # - Supporting reload mode (disabled by default for subprocess)
-            print(f"[NL Server Manager] Starting FastAPI server: {server_script}")
+            print(f"[NL Server Manager] Starting {label} server: {server_script}")
             # Use absolute path to script; py launcher needs args like ["-3", script_path]
-            script_path = str(server_script.resolve())
-            launch_args = py_prefix + [script_path]
-            # Final port check right before starting
-            if not self._check_and_free_port(8000):
-                print("[NL Server Manager] Warning: Port 8000 may still be in use, attempting server start anyway")
-            time.sleep(0.2)  # Brief delay to ensure port is free
+            launch_args = py_prefix + [str(server_script.resolve())]
             # server_summary_plan_1 §2.4: subprocess echo test before launch (log-only)
-            if _server_pc_logic_available and test_subprocess and hasattr(self, "_fastapi_logger"):
-                test_subprocess(python_exe, lambda msg: self._fastapi_logger.info(msg))
-            success = self.fastapi_process.start(python_exe, launch_args)
+            if _server_pc_logic_available and test_subprocess:
+                test_subprocess(python_exe, lambda msg: logger.info(msg))
+            process.start(python_exe, launch_args)
         else:
-            # Fallback: use uvicorn directly
-            if hasattr(self, '_fastapi_logger'):
-                self._fastapi_logger.warning("Script not found, using uvicorn directly")
+            # Fallback: use uvicorn directly (working directory is nl_sql, so the module path resolves)
+            logger.warning("Script not found, using uvicorn directly")
             print(f"[NL Server Manager] Script not found, using uvicorn directly")
-            success = self.fastapi_process.start(
+            process.start(
                 python_exe,
-                py_prefix + ["-m", "uvicorn", "api_call:app", "--host", "127.0.0.1", "--port", "8000"]
+                py_prefix + ["-m", "uvicorn", uvicorn_target, "--host", "127.0.0.1", "--port", str(port)]
             )
         
-        # Log QProcess.start() result
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info(f"QProcess.start() returned: {success}")
-            self._fastapi_logger.info(f"Process state after start: {self.fastapi_process.state()}")
-            if success:
-                self._fastapi_logger.info("Waiting for 'started' signal from QProcess...")
-        
-        # Don't immediately fail - QProcess.start() can return False even if process will start
-        # Instead, wait a moment and check process state, or rely on started/finished signals
-        if not success:
-            # Give process a moment to actually start (QProcess.start() is asynchronous)
-            # Check after 1 second if process actually failed or if it started successfully
-            QTimer.singleShot(1000, lambda: self._check_process_start_result('fastapi'))
-            # Don't return - let the timeout handler check if it actually failed
-            # The started signal will be emitted if it succeeds
-        else:
-            print(f"[NL Server Manager] FastAPI server process start() returned success")
+        # QProcess.start() is asynchronous: the outcome arrives as started or errorOccurred(FailedToStart)
+        logger.info(f"Process state after start: {process.state()}")
+        logger.info("Waiting for 'started' signal from QProcess...")
         
         # Wait for server to start, then verify it's responding (P3 / server_startup_platform: platform config)
         first_verify_ms = (
@@ -887,8 +1068,45 @@ class NLServerManager(QObject):
             if self._timing
             else (10000 if sys.platform.startswith("win") else 6000)
         )
-        QTimer.singleShot(first_verify_ms, self._verify_fastapi_ready)
-        QTimer.singleShot(first_verify_ms, self._do_main_thread_verify_fastapi)  # server_fail_6 (1a)
+        getattr(self, f"_{name}_verify_timer").start(first_verify_ms)
+    
+    def _log_file(self, name: str) -> Optional[str]:
+        """Path of the server's log file, or None when it logs to a stream only (file logging unavailable)."""
+        for handler in self._ensure_logger(name).handlers:
+            if isinstance(handler, logging.FileHandler):
+                return handler.baseFilename
+        return None
+    
+    def _reset_start_state(self, name: str, output_callback, error_callback):
+        """Mark server name as starting: reset verify retries, store callbacks, clear output buffers."""
+        setattr(self, f"{name}_starting", True)
+        setattr(self, f"_{name}_verify_retries", 0)
+        setattr(self, f"{name}_output_callback", output_callback)
+        setattr(self, f"{name}_error_callback", error_callback)
+        # The full output already goes to the log file when there is one; the rings then only need the
+        # tail used to classify an exit and build the failure message
+        capacity = _RING_CAPACITY_FILE_LOGGED if self._log_file(name) else _RING_CAPACITY
+        setattr(self, f"_{name}_stdout_buffer", _RingLogBuffer(capacity))
+        setattr(self, f"_{name}_stderr_buffer", _RingLogBuffer(capacity))
+        setattr(self, f"_{name}_stdout_decoder", _new_stream_decoder())
+        setattr(self, f"_{name}_stderr_decoder", _new_stream_decoder())
+    
+    def start_fastapi_server(self, output_callback=None, error_callback=None):
+        """
+        Start the FastAPI server for NL-to-SQL (Port 8000).
+        
+        The FastAPI server:
+        - Converts natural language to SQL queries using OpenAI
+        - Communicates with MCP server to get database schema
+        - Validates generated SQL queries
+        - Endpoint: POST /nl_to_sql
+        - API docs: http://localhost:8000/docs
+        
+        Args:
+            output_callback: Optional callback for stdout output (str) -> None
+            error_callback: Optional callback for stderr output (str) -> None
+        """
+        self._start_server("fastapi", output_callback, error_callback)
     
     def start_mcp_server(self, output_callback=None, error_callback=None):
         """
@@ -905,168 +1123,63 @@ class NLServerManager(QObject):
             output_callback: Optional callback for stdout output (str) -> None
             error_callback: Optional callback for stderr output (str) -> None
         """
-        # Solution 3: when frozen (non-Windows), run server in-process. server_summary_plan_2 §2.7: Windows frozen uses QProcess to avoid uvicorn/PyInstaller quirks.
-        if getattr(sys, "frozen", False) and not sys.platform.startswith("win"):
-            # Issue 5: clear dead thread so new start can proceed
-            if self._mcp_thread is not None and not self._mcp_thread.is_alive():
-                self._mcp_thread = None
-                self._mcp_server = None
-                self.mcp_starting = False
-            if self._mcp_thread and self._mcp_thread.is_alive():
-                return
-            if self.mcp_starting:
-                return
-            # Issue 1 & 2: pre-start validation
-            ok, err = self._validate_frozen_bundle()
-            if not ok:
-                self.mcp_failed.emit(err or "Bundle validation failed.")
-                return
-            self._ensure_bundle_path()
-            self.mcp_starting = True
-            self._mcp_verify_retries = 0
-            self.mcp_output_callback = output_callback
-            self.mcp_error_callback = error_callback
-            self._mcp_stdout_buffer = []
-            self._mcp_stderr_buffer = []
-            # Issue 6: port check off main thread; signal queues callback to main thread
-            def do_mcp_port_check():
-                port_ok = self._check_and_free_port(8001)
-                self._port_check_mcp_done.emit(port_ok)
-            threading.Thread(target=do_mcp_port_check, daemon=True).start()
-            return
-        
-        if self.mcp_process and self.mcp_process.state() == QProcess.ProcessState.Running:
-            return  # Already running
-        
-        if self.mcp_starting:
-            return  # Already starting
-        
-        # Check and free port 8001 before starting
-        if not self._check_and_free_port(8001):
-            print("[NL Server Manager] Warning: Port 8001 might be in use, but proceeding with server start")
-            # Don't fail here - let the server try and handle the error if it occurs
-        
-        self.mcp_starting = True
-        self._mcp_verify_retries = 0
-        self.mcp_output_callback = output_callback
-        self.mcp_error_callback = error_callback
-        
-        # Clear output buffers for new server start
-        self._mcp_stdout_buffer = []
-        self._mcp_stderr_buffer = []
-        
-        # Create QProcess for MCP server
-        self.mcp_process = QProcess(self)
-        self.mcp_process.setWorkingDirectory(str(self.nl_sql_dir))
-        
-        # Connect signals to monitor server startup
-        self.mcp_process.readyReadStandardOutput.connect(self._on_mcp_output)
-        self.mcp_process.readyReadStandardError.connect(self._on_mcp_error)
-        self.mcp_process.finished.connect(self._on_mcp_finished)
-        self.mcp_process.started.connect(self._on_mcp_started)
-        
-        # Set environment - add both nl_sql directory and project root to PYTHONPATH
-        # This ensures mcp_server.py and src modules can be imported
-        env = self.mcp_process.processEnvironment()
-        project_root = self.nl_sql_dir.parent
-        
-        # Get current PYTHONPATH
-        current_pythonpath = env.value("PYTHONPATH", "")
-        pythonpath_parts = []
-        
-        # Add nl_sql directory first (for mcp_server.py)
-        pythonpath_parts.append(str(self.nl_sql_dir))
-        # Add project root (for src.utils imports)
-        pythonpath_parts.append(str(project_root))
-        
-        # Preserve existing PYTHONPATH if present
-        if current_pythonpath:
-            pythonpath_parts.append(current_pythonpath)
-        
-        # Set new PYTHONPATH
-        new_pythonpath = os.pathsep.join(pythonpath_parts)
-        env.insert("PYTHONPATH", new_pythonpath)
-        
-        # Disable reload by default (causes issues with QProcess)
-        env.insert("STATMANG_ENABLE_RELOAD", "false")
-        
-        # When frozen, server subprocess (system Python) must use same app base and DB as main app
-        if getattr(sys, "frozen", False):
-            env.insert("STATMANG_APP_BASE", get_app_base_path())
-            env.insert("STATMANG_DB_PATH", str(get_database_path()))
-        
-        self.mcp_process.setProcessEnvironment(env)
-        
-        # Start the server using start_mcp_server.py script
-        python_exe, py_prefix = self._get_python_executable()
-        if not self._is_safe_python_for_subprocess(python_exe):
-            hint = get_subprocess_python_hint() if _server_pc_logic_available and get_subprocess_python_hint else (
-                "No valid Python found for the server. Install Python, add to PATH, or set STATMANG_PYTHON_EXE to the path to python.exe."
-            )
-            self.mcp_failed.emit(hint)
+        self._start_server("mcp", output_callback, error_callback)
+    
+    def _terminate_process_async(self, process: QProcess, name: str, kill_after_ms: int = 3000):
+        """
+        Stop a server QProcess without blocking the GUI thread.
+
+        Sends terminate() now and upgrades to kill() after kill_after_ms if the process is still
+        running (the kill timer is a child of the process, so it dies with it). The manager's
+        handlers are disconnected first so an intentional stop is not reported as a crash and a
+        newer process for the same server is not affected. Once finished, the process is deleted
+        and, unless a newer {name} server is starting or running (it may already hold the port),
+        the port is reclaimed on a worker thread.
+        """
+        port = _SERVERS[name].port
+        for sig in (process.readyReadStandardOutput, process.readyReadStandardError,
+                    process.finished, process.started, process.errorOccurred):
+            try:
+                sig.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+        if process.state() == QProcess.ProcessState.NotRunning:
+            process.deleteLater()
             return
-        mcp_script = self.nl_sql_dir / "start_mcp_server.py"
-        
-        project_root = self.nl_sql_dir.parent
-        new_pythonpath = env.value("PYTHONPATH", "")
-        
-        print("\n\n[NL Server Manager] MCP Server Startup:")
-        print(f"  Working directory: {self.nl_sql_dir}")
-        print(f"  Python executable: {python_exe}")
-        print(f"  Script path: {mcp_script}")
-        print(f"  Script exists: {mcp_script.exists()}")
-        print(f"  Project root: {project_root}")
-        print(f"  PYTHONPATH: {new_pythonpath}")
-        
-        if mcp_script.exists():
-            # Use the startup script (recommended)
-            # start_mcp_server.py handles:
-            # - Adding nl_sql directory to Python path
-            # - Verifying uvicorn and mcp_server can be imported
-            # - Supporting reload mode (disabled by default for subprocess)
-            print(f"[NL Server Manager] Starting MCP server: {mcp_script}")
-            # Use absolute path to script; py launcher needs args like ["-3", script_path]
-            script_path = str(mcp_script.resolve())
-            launch_args = py_prefix + [script_path]
-            # Final port check right before starting
-            if not self._check_and_free_port(8001):
-                print("[NL Server Manager] Warning: Port 8001 may still be in use, attempting server start anyway")
-            time.sleep(0.2)  # Brief delay to ensure port is free
-            # server_summary_plan_1 §2.4: subprocess echo test before launch (log-only)
-            if _server_pc_logic_available and test_subprocess and hasattr(self, "_mcp_logger"):
-                test_subprocess(python_exe, lambda msg: self._mcp_logger.info(msg))
-            success = self.mcp_process.start(python_exe, launch_args)
-        else:
-            # Fallback: use uvicorn directly with proper module path
-            print(f"[NL Server Manager] Script not found, using uvicorn directly")
-            # Change to nl_sql directory and run uvicorn
-            success = self.mcp_process.start(
-                python_exe,
-                py_prefix + ["-m", "uvicorn", "mcp_server:app", "--host", "127.0.0.1", "--port", "8001", "--no-reload"]
+
+        def replaced() -> bool:
+            current = getattr(self, f"{name}_process")
+            thread = getattr(self, f"_{name}_thread")
+            return bool(
+                getattr(self, f"{name}_starting")
+                or (current is not None and current.state() != QProcess.ProcessState.NotRunning)
+                or (thread is not None and thread.is_alive())
             )
-        
-        # Don't immediately fail - QProcess.start() can return False even if process will start
-        # Instead, wait a moment and check process state, or rely on started/finished signals
-        if not success:
-            # Give process a moment to actually start (QProcess.start() is asynchronous)
-            # Check after 1 second if process actually failed or if it started successfully
-            QTimer.singleShot(1000, lambda: self._check_process_start_result('mcp'))
-            # Don't return - let the timeout handler check if it actually failed
-            # The started signal will be emitted if it succeeds
-        else:
-            print(f"[NL Server Manager] MCP server process start() returned success")
-        
-        # Wait for server to start, then verify it's responding (P3 / server_startup_platform: platform config)
-        first_verify_ms = (
-            self._timing["first_verify_ms"]
-            if self._timing
-            else (10000 if sys.platform.startswith("win") else 6000)
-        )
-        QTimer.singleShot(first_verify_ms, self._verify_mcp_ready)
-        QTimer.singleShot(first_verify_ms, self._do_main_thread_verify_mcp)  # server_fail_6 (1a)
-    
+
+        def reclaim_port():
+            if not self._probe_port_free(port) and not replaced():
+                self._check_and_free_port(port)
+
+        def on_finished(*_):
+            process.deleteLater()
+            # A restart may have launched the new server before this one exited; never kill it
+            if replaced():
+                return
+            # Kill + wait-for-port polls for up to 2 s, so keep it off the GUI thread
+            threading.Thread(target=reclaim_port, daemon=True).start()
+
+        process.finished.connect(on_finished)
+        kill_timer = QTimer(process)
+        kill_timer.setSingleShot(True)
+        kill_timer.timeout.connect(process.kill)
+        process.terminate()
+        kill_timer.start(kill_after_ms)
+
     def stop_fastapi_server(self):
         """Stop the FastAPI server gracefully."""
+        # No readiness retry or port-in-use restart may fire after an explicit stop
+        self._fastapi_verify_timer.stop()
+        self._fastapi_restart_timer.stop()
         # Solution 3: in-process server (frozen); thread may exist before _fastapi_server is set
         if getattr(sys, "frozen", False) and (self._fastapi_server is not None or self._fastapi_thread is not None):
             if getattr(self, '_safety_timer_fastapi', None) is not None:
@@ -1091,24 +1204,24 @@ class NLServerManager(QObject):
             self._fastapi_thread = None
             self.fastapi_process = None
             self.fastapi_starting = False
-            self._fastapi_ready_flag = False
-            self._all_servers_ready_emitted = False
+            self._set_ready("fastapi", False)
             self._check_and_free_port(8000)
             return
         if self.fastapi_process:
-            self.fastapi_process.terminate()
-            if not self.fastapi_process.waitForFinished(3000):
-                self.fastapi_process.kill()
-                self.fastapi_process.waitForFinished(2000)  # Wait longer after kill
+            # Non-blocking: the port is checked once the process has actually exited
+            self._terminate_process_async(self.fastapi_process, "fastapi")
             self.fastapi_process = None
+        elif not self._probe_port_free(8000):
+            # Ensure port is free after stopping
+            self._check_and_free_port(8000)
         self.fastapi_starting = False
-        self._fastapi_ready_flag = False
-        self._all_servers_ready_emitted = False  # Reset when server stops
-        # Ensure port is free after stopping
-        self._check_and_free_port(8000)
+        self._set_ready("fastapi", False)  # Reset when server stops
     
     def stop_mcp_server(self):
         """Stop the MCP server gracefully."""
+        # No readiness retry or port-in-use restart may fire after an explicit stop
+        self._mcp_verify_timer.stop()
+        self._mcp_restart_timer.stop()
         # Solution 3: in-process server (frozen); thread may exist before _mcp_server is set
         if getattr(sys, "frozen", False) and (self._mcp_server is not None or self._mcp_thread is not None):
             if getattr(self, '_safety_timer_mcp', None) is not None:
@@ -1133,24 +1246,21 @@ class NLServerManager(QObject):
             self._mcp_thread = None
             self.mcp_process = None
             self.mcp_starting = False
-            self._mcp_ready_flag = False
-            self._all_servers_ready_emitted = False
+            self._set_ready("mcp", False)
             self._check_and_free_port(8001)
             return
         if self.mcp_process:
-            self.mcp_process.terminate()
-            if not self.mcp_process.waitForFinished(3000):
-                self.mcp_process.kill()
-                self.mcp_process.waitForFinished(2000)  # Wait longer after kill
+            # Non-blocking: the port is checked once the process has actually exited
+            self._terminate_process_async(self.mcp_process, "mcp")
             self.mcp_process = None
+        elif not self._probe_port_free(8001):
+            # Ensure port is free after stopping
+            self._check_and_free_port(8001)
         self.mcp_starting = False
-        self._mcp_ready_flag = False
-        self._all_servers_ready_emitted = False  # Reset when server stops
-        # Ensure port is free after stopping
-        self._check_and_free_port(8001)
+        self._set_ready("mcp", False)  # Reset when server stops
     
     def stop_all_servers(self):
-        """Stop both servers gracefully."""
+        """Stop both servers gracefully. Returns immediately; processes finish shutting down in the background."""
         print("\n\n[NL Server Manager] Stopping all servers...")
         self.stop_fastapi_server()
         self.stop_mcp_server()
@@ -1191,737 +1301,346 @@ class NLServerManager(QObject):
         Returns:
             True if both FastAPI and MCP servers are ready, False otherwise
         """
-        return self._fastapi_ready_flag and self._mcp_ready_flag
-    
-    def _check_all_servers_ready(self):
-        """Check if both servers are ready and emit all_servers_ready signal if so."""
-        if self._fastapi_ready_flag and self._mcp_ready_flag:
-            if not self._all_servers_ready_emitted:
-                print("\n\n[NL Server Manager] All servers are ready")
-                self._all_servers_ready_emitted = True
-                self.all_servers_ready.emit()
+        return self._all_servers_ready
     
-    def _check_process_start_result(self, server_type: str):
+    def _set_ready(self, name: str, ready: bool):
         """
-        Check if process actually started after initial start() call.
-        
-        This is called 1 second after QProcess.start() returns False to verify
-        if the process actually failed or if it started successfully (since
-        QProcess.start() is asynchronous and can return False even when the
-        process will start successfully).
-        
-        Args:
-            server_type: 'fastapi' or 'mcp'
+        Set one server's ready flag; the only place readiness changes.
+
+        The combined state read by are_all_servers_ready is republished only when it flips,
+        and all_servers_ready is emitted once each time both servers become ready.
         """
-        if server_type == 'fastapi':
-            process = self.fastapi_process
-            starting_flag = self.fastapi_starting
-            failed_signal = self.fastapi_failed
-            script = self.nl_sql_dir / "start_server.py"
-        else:  # mcp
-            process = self.mcp_process
-            starting_flag = self.mcp_starting
-            failed_signal = self.mcp_failed
-            script = self.nl_sql_dir / "start_mcp_server.py"
-        
-        if not process or not starting_flag:
+        setattr(self, f"_{name}_ready_flag", ready)
+        all_ready = self._fastapi_ready_flag and self._mcp_ready_flag
+        if all_ready == self._all_servers_ready:
             return
-        
-        state = process.state()
-        if state == QProcess.ProcessState.NotRunning:
-            # Process is not running - check if it actually failed or is still starting
-            # Sometimes QProcess.start() returns False but process is still initializing
-            # Wait a bit longer before declaring failure
-            QTimer.singleShot(2000, lambda: self._check_process_start_result_delayed(server_type))
-            print(f"[NL Server Manager] {server_type.upper()} server process not running yet, checking again in 2 seconds...")
-        # If state is Starting or Running, the process is starting/started successfully
-        # The started signal will be emitted, so we don't need to do anything here
-        elif state in (QProcess.ProcessState.Starting, QProcess.ProcessState.Running):
-            print(f"[NL Server Manager] {server_type.upper()} server process is {state.name} - waiting for started signal")
+        self._all_servers_ready = all_ready
+        if all_ready:
+            print("\n\n[NL Server Manager] All servers are ready")
+            self.all_servers_ready.emit()
     
-    def _check_process_start_result_delayed(self, server_type: str):
+    def _on_process_error(self, server_type: str, error: QProcess.ProcessError):
         """
-        Delayed check for process start result (called 2 seconds after initial check).
-        
-        This gives the process more time to actually start before declaring failure.
+        Handle QProcess.errorOccurred for a server process.
+
+        Only FailedToStart is handled here: the process never ran, so finished will not be
+        emitted and the start must be failed now. Crashes and other errors after a successful
+        start are reported through the finished handler.
+
+        Args:
+            server_type: 'fastapi' or 'mcp' (key of _SERVERS)
+            error: the QProcess error that occurred
         """
-        if server_type == 'fastapi':
-            process = self.fastapi_process
-            starting_flag = self.fastapi_starting
-            failed_signal = self.fastapi_failed
-            script = self.nl_sql_dir / "start_server.py"
-        else:  # mcp
-            process = self.mcp_process
-            starting_flag = self.mcp_starting
-            failed_signal = self.mcp_failed
-            script = self.nl_sql_dir / "start_mcp_server.py"
-        
-        if not process or not starting_flag:
+        process = getattr(self, f"{server_type}_process")
+        if error != QProcess.ProcessError.FailedToStart or not process or not getattr(self, f"{server_type}_starting"):
             return
-        
-        state = process.state()
-        if state == QProcess.ProcessState.NotRunning:
-            # Process still not running after additional wait - this is a real failure
-            error_msg = process.errorString()
-            if not error_msg or error_msg == "Unknown error":
-                # Try to get more specific error
-                python_exe, _ = self._get_python_executable()
-                exe_exists = (python_exe == "py" and shutil.which("py")) or Path(python_exe).exists()
-                if not exe_exists:
-                    error_msg = f"Python executable not found: {python_exe}. Install Python and add to PATH (or use 'py' launcher on Windows)."
-                elif not script.exists():
-                    error_msg = f"Server script not found: {script}"
-                else:
-                    error_msg = "Process failed to start. Check logs for details."
-            
-            if server_type == 'fastapi':
-                self.fastapi_starting = False
+        script = self.nl_sql_dir / _SERVERS[server_type].script
+        error_msg = process.errorString()
+        if not error_msg or error_msg == "Unknown error":
+            # Try to get more specific error
+            python_exe, _ = self._get_python_executable()
+            exe_exists = (python_exe == "py" and shutil.which("py")) or Path(python_exe).exists()
+            if not exe_exists:
+                error_msg = f"Python executable not found: {python_exe}. Install Python and add to PATH (or use 'py' launcher on Windows)."
+            elif not script.exists():
+                error_msg = f"Server script not found: {script}"
             else:
-                self.mcp_starting = False
-            
-            print(f"\n\n[NL Server Manager] Failed to start {server_type.upper()} server process after delayed check: {error_msg}")
-            failed_signal.emit(f"Failed to start process: {error_msg}")
-        elif state in (QProcess.ProcessState.Starting, QProcess.ProcessState.Running):
-            # Process is starting/running - success, don't emit failure
-            print(f"\n\n[NL Server Manager] {server_type.upper()} server process is {state.name} - startup successful")
+                error_msg = "Process failed to start. Check logs for details."
+        
+        setattr(self, f"{server_type}_starting", False)
+        
+        print(f"\n\n[NL Server Manager] Failed to start {server_type.upper()} server process: {error_msg}")
+        getattr(self, f"{server_type}_failed").emit(f"Failed to start process: {error_msg}")
     
-    # FastAPI server signal handlers
+    # Server signal handlers, shared by FastAPI and MCP (name is a key of _SERVERS)
     
-    def _on_fastapi_started(self):
-        """Called when FastAPI server process starts."""
-        if hasattr(self, '_fastapi_logger'):
-            self._fastapi_logger.info("\n\n" + "=" * 80)
-            self._fastapi_logger.info("FastAPI server process STARTED successfully")
-            # server_fail_7 (F2a): in-process mode has no QProcess; log N/A instead of Unknown
-            if getattr(sys, "frozen", False) and self.fastapi_process is None:
-                self._fastapi_logger.info("In-process mode (no QProcess); PID/state N/A")
-            else:
-                self._fastapi_logger.info(f"Process PID: {self.fastapi_process.processId() if self.fastapi_process else 'Unknown'}")
-                self._fastapi_logger.info(f"Process state: {self.fastapi_process.state() if self.fastapi_process else 'Unknown'}")
-        print("\n\n[NL Server Manager] FastAPI server process started")
-        self.fastapi_started.emit()
+    def _on_started(self, name: str):
+        """Called when a server process starts."""
+        spec = _SERVERS[name]
+        logger = self._ensure_logger(name)
+        process = getattr(self, f"{name}_process")
+        logger.info("\n\n" + "=" * 80)
+        logger.info(f"{spec.label} server process STARTED successfully")
+        # server_fail_7 (F2a): in-process mode has no QProcess; log N/A instead of Unknown
+        if getattr(sys, "frozen", False) and process is None:
+            logger.info("In-process mode (no QProcess); PID/state N/A")
+        else:
+            logger.info(f"Process PID: {process.processId() if process else 'Unknown'}")
+            logger.info(f"Process state: {process.state() if process else 'Unknown'}")
+        print(f"\n\n[NL Server Manager] {spec.label} server process started")
+        getattr(self, f"{name}_started").emit()
     
-    def _on_fastapi_output(self):
-        """Handle FastAPI server stdout output."""
-        if not self.fastapi_process:
+    def _on_output(self, name: str):
+        """Handle server stdout output."""
+        process = getattr(self, f"{name}_process")
+        if not process:
             return
         
-        output = bytes(self.fastapi_process.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if output.strip():
-            # Store output for error reporting
-            self._fastapi_stdout_buffer.append(output)
+        raw = _read_complete_lines(process, QProcess.ProcessChannel.StandardOutput)
+        output = getattr(self, f"_{name}_stdout_decoder").decode(raw)
+        stripped = output.strip()
+        if stripped:
+            # Keep the tail of the stream for error reporting
+            getattr(self, f"_{name}_stdout_buffer").write(raw)
             
-            # Write to log file
-            if hasattr(self, '_fastapi_logger'):
-                self._fastapi_logger.info(output.strip())
+            # Write to log file (and console when STATMANG_DEBUG=1)
+            self._ensure_logger(name).info("%s", stripped)
+            output_callback = getattr(self, f"{name}_output_callback")
+            if output_callback:
+                output_callback(output)
             
-            print(f"[NL FastAPI Server Output] {output.strip()}")
-            if self.fastapi_output_callback:
-                self.fastapi_output_callback(output)
-            
-            # Look for startup confirmation messages
-            # These indicate the server is starting up
-            if any(phrase in output for phrase in [
-                "Application startup complete",
-                "Uvicorn running",
-                "Started server process",
-                "Waiting for application startup"
-            ]):
-                # Server is starting up, verify it's ready
-                QTimer.singleShot(2500, self._verify_fastapi_ready)
+            self._verify_on_ready_output(name, output)
     
-    def _on_fastapi_error(self):
-        """Handle FastAPI server stderr output."""
-        if not self.fastapi_process:
+    def _on_error(self, name: str):
+        """Handle server stderr output."""
+        process = getattr(self, f"{name}_process")
+        if not process:
             return
         
-        error = bytes(self.fastapi_process.readAllStandardError()).decode('utf-8', errors='ignore')
-        if error.strip():
-            # Store error for error reporting
-            self._fastapi_stderr_buffer.append(error)
+        raw = _read_complete_lines(process, QProcess.ProcessChannel.StandardError)
+        error = getattr(self, f"_{name}_stderr_decoder").decode(raw)
+        stripped = error.strip()
+        if stripped:
+            spec = _SERVERS[name]
+            logger = self._ensure_logger(name)
+            # Keep the tail of the stream for error reporting
+            getattr(self, f"_{name}_stderr_buffer").write(raw)
             
             # Check if this is actually an error or just uvicorn INFO messages
             # Uvicorn sends INFO messages to stderr, not stdout
-            error_lower = error.lower()
-            is_actual_error = any(keyword in error_lower for keyword in [
-                'error', 'exception', 'traceback', 'failed', 'fatal', 'critical',
-                'cannot', 'unable', 'failed to', 'error:', 'exception:'
-            ])
-            
-            # Write to log file with appropriate level
-            if hasattr(self, '_fastapi_logger'):
-                if is_actual_error:
-                    self._fastapi_logger.error(error.strip())
-                else:
-                    # Uvicorn INFO messages go to stderr, log as INFO
-                    self._fastapi_logger.info(error.strip())
+            is_actual_error = _ACTUAL_ERR_RE.search(raw) is not None
             
-            # Only print as error if it's actually an error
-            if is_actual_error:
-                print(f"[NL FastAPI Server Error] {error.strip()}")
-            else:
-                print(f"[NL FastAPI Server Output] {error.strip()}")
+            # Write to log file (and console when STATMANG_DEBUG=1) with appropriate level
+            # Uvicorn INFO messages go to stderr, log as INFO
+            logger.log(logging.ERROR if is_actual_error else logging.INFO, "%s", stripped)
             
-            if self.fastapi_error_callback:
-                self.fastapi_error_callback(error)
+            error_callback = getattr(self, f"{name}_error_callback")
+            if error_callback:
+                error_callback(error)
+            self._verify_on_ready_output(name, error)
             
             # Check for specific errors that should stop startup immediately
-            error_lower = error.lower()
-            if "uvicorn is not installed" in error_lower or "no module named 'uvicorn'" in error_lower:
-                self.fastapi_starting = False
-                self.fastapi_failed.emit(
-                    "uvicorn is not installed. Install with: pip install fastapi uvicorn openai"
+            failed_signal = getattr(self, f"{name}_failed")
+            markers = _stderr_markers(raw)
+            if "uvicorn_missing" in markers:
+                setattr(self, f"{name}_starting", False)
+                failed_signal.emit(
+                    f"uvicorn is not installed. Install with: pip install {' '.join(spec.packages)}"
                 )
-            elif "module not found" in error_lower or "no module named" in error_lower:
-                # Missing dependencies - let _on_fastapi_finished handle with full output
-                self.fastapi_starting = False
-            elif "address already in use" in error_lower or "port 8000" in error_lower:
+            elif "module_missing" in markers:
+                # Missing dependencies - let _on_finished handle with full output
+                setattr(self, f"{name}_starting", False)
+            elif "port_in_use" in markers or f"port_{spec.port}" in markers:
                 # Port is in use - try to free it and retry
-                print("[NL Server Manager] Detected 'address already in use' for FastAPI server, attempting to free port 8000...")
-                if self._check_and_free_port(8000):
-                    print("[NL Server Manager] Port 8000 freed, retrying FastAPI server start...")
+                print(f"[NL Server Manager] Detected 'address already in use' for {spec.label} server, attempting to free port {spec.port}...")
+                if self._check_and_free_port(spec.port):
+                    print(f"[NL Server Manager] Port {spec.port} freed, retrying {spec.label} server start...")
                     # Wait a moment, then retry
-                    QTimer.singleShot(2000, lambda: self.start_fastapi_server(
-                        self.fastapi_output_callback,
-                        self.fastapi_error_callback
-                    ))
+                    getattr(self, f"_{name}_restart_timer").start(2000)
                 else:
                     # Could not free port, emit failure
-                    self.fastapi_starting = False
+                    setattr(self, f"{name}_starting", False)
                     base_port_msg = (
-                        "Port 8000 is in use and could not be freed. "
+                        f"Port {spec.port} is in use and could not be freed. "
                         "Please stop other servers or free the port manually."
                     )
                     port_msg = (
-                        format_port_in_use_message(8000, base_port_msg)
+                        format_port_in_use_message(spec.port, base_port_msg)
                         if _server_pc_logic_available and format_port_in_use_message
                         else base_port_msg
                     )
-                    self.fastapi_failed.emit(port_msg)
+                    failed_signal.emit(port_msg)
             # Note: Other errors might be warnings, so we don't stop startup immediately
     
-    def _on_fastapi_finished(self, exit_code, exit_status):
-        """Called when FastAPI server process finishes."""
-        self.fastapi_starting = False
+    def _on_finished(self, name: str, exit_code, exit_status):
+        """Called when a server process finishes."""
+        setattr(self, f"{name}_starting", False)
         # Reset ready flag if server crashed/stopped
         if exit_code != 0 or exit_status != QProcess.ExitStatus.NormalExit:
-            self._fastapi_ready_flag = False
-            self._all_servers_ready_emitted = False
-        if exit_code != 0:
-            # Read both stderr and stdout for complete error information
-            # First, try to read any remaining output from process
-            error_output = ""
-            stdout_output = ""
-            
-            if self.fastapi_process:
-                error_bytes = self.fastapi_process.readAllStandardError()
-                if error_bytes:
-                    error_output = bytes(error_bytes).decode('utf-8', errors='ignore')
-                
-                stdout_bytes = self.fastapi_process.readAllStandardOutput()
-                if stdout_bytes:
-                    stdout_output = bytes(stdout_bytes).decode('utf-8', errors='ignore')
-            
-            # Combine with buffered output (captured during process execution)
-            if self._fastapi_stderr_buffer:
-                buffered_errors = '\n'.join(self._fastapi_stderr_buffer)
-                error_output = (buffered_errors + '\n' + error_output).strip()
-            
-            if self._fastapi_stdout_buffer:
-                buffered_stdout = '\n'.join(self._fastapi_stdout_buffer)
-                stdout_output = (buffered_stdout + '\n' + stdout_output).strip()
-            
-            print(f"\n\n[NL Server Manager] FastAPI server exited with code {exit_code}")
-            
-            # Combine outputs for better error detection
-            combined_output = (error_output + "\n" + stdout_output).strip()
-            
-            if combined_output:
-                print(f"[NL Server Manager] Error output:\n{combined_output}")
-                
-                # Check for common errors and provide helpful messages
-                combined_lower = combined_output.lower()
-                if "uvicorn is not installed" in combined_lower or "no module named 'uvicorn'" in combined_lower:
-                    self.fastapi_failed.emit(
-                        "ERROR: uvicorn is not installed.\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn openai"
-                    )
-                elif "fastapi" in combined_lower and ("not installed" in combined_lower or "no module named" in combined_lower):
-                    self.fastapi_failed.emit(
-                        "ERROR: fastapi is not installed.\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn openai"
-                    )
-                elif "openai" in combined_lower and ("not installed" in combined_lower or "no module named" in combined_lower):
-                    self.fastapi_failed.emit(
-                        "ERROR: openai is not installed.\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn openai"
-                    )
-                elif "failed to import" in combined_lower or ("import" in combined_lower and "error" in combined_lower):
-                    self.fastapi_failed.emit(
-                        f"Import error:\n\n{combined_output[:500]}\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn openai"
-                    )
-                else:
-                    # Show the actual error output (truncate if too long)
-                    error_msg = combined_output[:2000]  # Increased limit for better debugging
-                    if len(combined_output) > 2000:
-                        error_msg += f"\n\n... (truncated, {len(combined_output)} chars total)"
-                    self.fastapi_failed.emit(f"Server exited with code {exit_code}:\n\n{error_msg}")
-            else:
-                # No output captured - this might indicate a very early crash
-                # Check process error string for more info
-                process_error = ""
-                if self.fastapi_process:
-                    process_error = self.fastapi_process.errorString()
-                
-                if process_error and process_error != "Unknown error":
-                    self.fastapi_failed.emit(
-                        f"Server exited with code {exit_code}.\n"
-                        f"Process error: {process_error}\n\n"
-                        f"No output captured - server may have crashed immediately on startup.\n"
-                        f"Check:\n"
-                        f"  - Python executable: {sys.executable}\n"
-                        f"  - Server script exists: {self.nl_sql_dir / 'start_server.py'}\n"
-                        f"  - Required packages installed (fastapi, uvicorn, openai)"
-                    )
-                else:
-                    self.fastapi_failed.emit(
-                        f"Server exited with code {exit_code} (no error output captured).\n\n"
-                        f"Server may have crashed immediately on startup.\n"
-                        f"Check server logs or try running manually:\n"
-                        f"  python3 {self.nl_sql_dir / 'start_server.py'}"
-                    )
-    
-    def _verify_fastapi_ready(self):
-        """
-        Schedule verification of FastAPI server. HTTP check runs in a worker thread so the Qt event loop is not blocked.
-        After max retries, emit fastapi_failed so the UI does not stay stuck.
-        """
-        if not self.fastapi_starting:
-            return
-        # server_summary_plan_2 §2.4 + §2.1: probe returns bool; log LISTENING only when port is open
-        if _server_pc_logic_available and probe_port and hasattr(self, "_fastapi_logger"):
-            log_fn = lambda msg: self._fastapi_logger.info(msg)
-            if probe_port(8000, log_fn):
-                self._fastapi_logger.info("FastAPI server is LISTENING on 127.0.0.1:8000")
-        self._fastapi_verify_retries += 1
-        # Solution 8: log when first verification runs
-        if self._fastapi_verify_retries == 1:
-            if hasattr(self, '_fastapi_logger'):
-                self._fastapi_logger.info("[server_fail_1] First FastAPI verification run")
-            print("[NL Server Manager] First FastAPI verification run")
-
-        def do_check():
-            success = False
-            err_msg = None
-            try:
-                try:
-                    import requests
-                    response = requests.get("http://127.0.0.1:8000/docs", timeout=2)
-                    success = response.status_code == 200
-                except ImportError:
-                    # Issue 3: fallback to urllib when requests not installed
-                    import urllib.request
-                    req = urllib.request.urlopen("http://127.0.0.1:8000/docs", timeout=2)
-                    success = (req.getcode() == 200)
-                    req.close()
-            except Exception as e:
-                err_msg = str(e)
-            if _server_pc_logic_available and log_event and hasattr(self, "_fastapi_logger"):
-                log_event(lambda m: self._fastapi_logger.info(m), "verify_done emitted")
-            self._verify_fastapi_done.emit(success, err_msg)
-
-        threading.Thread(target=do_check, daemon=True).start()
-
-    def _on_fastapi_verify_done(self, success: bool, error_msg: Optional[str]):
-        """Runs on Qt thread with result of FastAPI readiness check (done in worker thread).
-        server_fail_6 (2a): On success always apply ready (no early return on not fastapi_starting). server_summary_plan_2 §2.5: log verify_done result."""
-        if hasattr(self, "_fastapi_logger"):
-            self._fastapi_logger.info(f"verify_done: success={success}, error_msg={error_msg!r}")
-        if _server_pc_logic_available and log_event and hasattr(self, "_fastapi_logger"):
-            log_event(lambda msg: self._fastapi_logger.info(msg), "verify_done received on main thread")
-        if success:
-            if self._fastapi_ready_flag:
-                return  # Already applied (e.g. main-thread fallback ran first)
-            print("\n\n[NL Server Manager] FastAPI server is ready")
-            self.fastapi_starting = False
-            self._fastapi_ready_flag = True
-            # Issue 8: cancel safety timer so it cannot fire later
-            if getattr(self, '_safety_timer_fastapi', None) is not None:
-                try:
-                    self._safety_timer_fastapi.stop()
-                except Exception:
-                    pass
-                self._safety_timer_fastapi = None
-            self.fastapi_ready.emit()
-            self._check_all_servers_ready()
-            return
-        if not self.fastapi_starting:
-            return
-            if self._fastapi_verify_retries >= self._max_verify_retries:
-                self.fastapi_starting = False
-                if hasattr(self, '_fastapi_logger') and error_msg:
-                    self._fastapi_logger.warning(
-                        f"FastAPI verification gave up after {self._max_verify_retries} attempts. Last error: {error_msg}"
-                    )
-                self.fastapi_failed.emit(
-                    format_not_ready_failure_message(
-                        "FastAPI server did not become ready in time. Check the logs folder next to the app."
-                    )
-                    if _server_pc_logic_available and format_not_ready_failure_message
-                    else "FastAPI server did not become ready in time. Check the logs folder next to the app."
-                )
-            else:
-                if hasattr(self, '_fastapi_logger') and error_msg:
-                    self._fastapi_logger.warning(
-                        f"FastAPI verification failed (attempt {self._fastapi_verify_retries}/{self._max_verify_retries}): {error_msg}"
-                    )
-                QTimer.singleShot(2500, self._verify_fastapi_ready)
-    
-    # MCP server signal handlers
-    
-    def _on_mcp_started(self):
-        """Called when MCP server process starts."""
-        if hasattr(self, '_mcp_logger'):
-            self._mcp_logger.info("\n\n" + "=" * 80)
-            self._mcp_logger.info("MCP server process STARTED successfully")
-            # server_fail_7 (F2a): in-process mode has no QProcess; log N/A instead of Unknown
-            if getattr(sys, "frozen", False) and self.mcp_process is None:
-                self._mcp_logger.info("In-process mode (no QProcess); PID/state N/A")
-            else:
-                self._mcp_logger.info(f"Process PID: {self.mcp_process.processId() if self.mcp_process else 'Unknown'}")
-                self._mcp_logger.info(f"Process state: {self.mcp_process.state() if self.mcp_process else 'Unknown'}")
-        print("\n\n[NL Server Manager] MCP server process started")
-        self.mcp_started.emit()
-    
-    def _on_mcp_output(self):
-        """Handle MCP server stdout output."""
-        if not self.mcp_process:
+            self._set_ready(name, False)
+        if exit_code == 0:
             return
-        
-        output = bytes(self.mcp_process.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if output.strip():
-            # Store output for error reporting
-            self._mcp_stdout_buffer.append(output)
-            
-            # Write to log file
-            if hasattr(self, '_mcp_logger'):
-                self._mcp_logger.info(output.strip())
-            
-            print(f"[NL MCP Server Output] {output.strip()}")
-            if self.mcp_output_callback:
-                self.mcp_output_callback(output)
+        spec = _SERVERS[name]
+        process = getattr(self, f"{name}_process")
+        failed_signal = getattr(self, f"{name}_failed")
+        
+        # Read both stderr and stdout for complete error information
+        # First, try to read any remaining output from process
+        error_output = ""
+        stdout_output = ""
+        
+        if process:
+            error_bytes = process.readAllStandardError()
+            if error_bytes:
+                error_output = getattr(self, f"_{name}_stderr_decoder").decode(bytes(error_bytes), final=True)
             
-            # Look for startup confirmation messages
-            # These indicate the server is starting up
-            if any(phrase in output for phrase in [
-                "Application startup complete",
-                "Uvicorn running",
-                "Started server process",
-                "Waiting for application startup"
-            ]):
-                # Server is starting up, verify it's ready
-                QTimer.singleShot(2500, self._verify_mcp_ready)
-    
-    def _on_mcp_error(self):
-        """Handle MCP server stderr output."""
-        if not self.mcp_process:
-            return
+            stdout_bytes = process.readAllStandardOutput()
+            if stdout_bytes:
+                stdout_output = getattr(self, f"_{name}_stdout_decoder").decode(bytes(stdout_bytes), final=True)
         
-        error = bytes(self.mcp_process.readAllStandardError()).decode('utf-8', errors='ignore')
-        if error.strip():
-            # Store error for error reporting
-            self._mcp_stderr_buffer.append(error)
-            
-            # Write to log file
-            if hasattr(self, '_mcp_logger'):
-                self._mcp_logger.error(error.strip())
+        # Combine with buffered output (captured during process execution)
+        stderr_buffer = getattr(self, f"_{name}_stderr_buffer")
+        if stderr_buffer:
+            buffered_errors = stderr_buffer.snapshot().decode('utf-8', errors='ignore')
+            error_output = (buffered_errors + '\n' + error_output).strip()
+        
+        stdout_buffer = getattr(self, f"_{name}_stdout_buffer")
+        if stdout_buffer:
+            buffered_stdout = stdout_buffer.snapshot().decode('utf-8', errors='ignore')
+            stdout_output = (buffered_stdout + '\n' + stdout_output).strip()
+        
+        print(f"\n\n[NL Server Manager] {spec.label} server exited with code {exit_code}")
+        
+        # Combine outputs for better error detection
+        combined_output = (error_output + "\n" + stdout_output).strip()
+        install_hint = f"Install required packages with:\n  pip install {' '.join(spec.packages)}"
+        
+        if combined_output:
+            print(f"[NL Server Manager] {spec.label} server error output:\n{combined_output}")
             
-            print(f"[NL MCP Server Error] {error.strip()}")
-            if self.mcp_error_callback:
-                self.mcp_error_callback(error)
+            # Check for common errors and provide helpful messages
+            cause = _classify_exit(combined_output, spec.packages)
+            if cause == "import":
+                failed_signal.emit(f"Import error:\n\n{combined_output[:500]}\n\n{install_hint}")
+            elif cause:
+                failed_signal.emit(f"ERROR: {cause} is not installed.\n\n{install_hint}")
+            else:
+                # Show the actual error output (truncate if too long)
+                error_msg = combined_output[:2000]  # Increased limit for better debugging
+                if len(combined_output) > 2000:
+                    error_msg += f"\n\n... (truncated, {len(combined_output)} chars total)"
+                    log_file = self._log_file(name)
+                    if log_file:
+                        error_msg += f"\nFull server output: {log_file}"
+                failed_signal.emit(f"Server exited with code {exit_code}:\n\n{error_msg}")
+        else:
+            # No output captured - this might indicate a very early crash
+            # Check process error string for more info
+            process_error = process.errorString() if process else ""
             
-            # Check for specific errors that should stop startup immediately
-            error_lower = error.lower()
-            if "uvicorn is not installed" in error_lower or "no module named 'uvicorn'" in error_lower:
-                self.mcp_starting = False
-                self.mcp_failed.emit(
-                    "uvicorn is not installed. Install with: pip install fastapi uvicorn"
+            if process_error and process_error != "Unknown error":
+                failed_signal.emit(
+                    f"Server exited with code {exit_code}.\n"
+                    f"Process error: {process_error}\n\n"
+                    f"No output captured - server may have crashed immediately on startup.\n"
+                    f"Check:\n"
+                    f"  - Python executable: {sys.executable}\n"
+                    f"  - Server script exists: {self.nl_sql_dir / spec.script}\n"
+                    f"  - Required packages installed ({', '.join(spec.packages)})"
                 )
-            elif "module not found" in error_lower or "no module named" in error_lower:
-                # Missing dependencies - let _on_mcp_finished handle with full output
-                self.mcp_starting = False
-            elif "address already in use" in error_lower or "port 8001" in error_lower:
-                # Port is in use - try to free it and retry
-                print("[NL Server Manager] Detected 'address already in use' for MCP server, attempting to free port 8001...")
-                if self._check_and_free_port(8001):
-                    print("[NL Server Manager] Port 8001 freed, retrying MCP server start...")
-                    # Wait a moment, then retry
-                    QTimer.singleShot(2000, lambda: self.start_mcp_server(
-                        self.mcp_output_callback,
-                        self.mcp_error_callback
-                    ))
-                else:
-                    # Could not free port, emit failure
-                    self.mcp_starting = False
-                    base_port_msg = (
-                        "Port 8001 is in use and could not be freed. "
-                        "Please stop other servers or free the port manually."
-                    )
-                    port_msg = (
-                        format_port_in_use_message(8001, base_port_msg)
-                        if _server_pc_logic_available and format_port_in_use_message
-                        else base_port_msg
-                    )
-                    self.mcp_failed.emit(port_msg)
-            # Note: Other errors might be warnings, so we don't stop startup immediately
-    
-    def _on_mcp_finished(self, exit_code, exit_status):
-        """Called when MCP server process finishes."""
-        self.mcp_starting = False
-        # Reset ready flag if server crashed/stopped
-        if exit_code != 0 or exit_status != QProcess.ExitStatus.NormalExit:
-            self._mcp_ready_flag = False
-            self._all_servers_ready_emitted = False
-        if exit_code != 0:
-            # Read both stderr and stdout for complete error information
-            # First, try to read any remaining output from process
-            error_output = ""
-            stdout_output = ""
-            
-            if self.mcp_process:
-                error_bytes = self.mcp_process.readAllStandardError()
-                if error_bytes:
-                    error_output = bytes(error_bytes).decode('utf-8', errors='ignore')
-                
-                stdout_bytes = self.mcp_process.readAllStandardOutput()
-                if stdout_bytes:
-                    stdout_output = bytes(stdout_bytes).decode('utf-8', errors='ignore')
-            
-            # Combine with buffered output (captured during process execution)
-            if self._mcp_stderr_buffer:
-                buffered_errors = '\n'.join(self._mcp_stderr_buffer)
-                error_output = (buffered_errors + '\n' + error_output).strip()
-            
-            if self._mcp_stdout_buffer:
-                buffered_stdout = '\n'.join(self._mcp_stdout_buffer)
-                stdout_output = (buffered_stdout + '\n' + stdout_output).strip()
-            
-            print(f"\n\n[NL Server Manager] MCP server exited with code {exit_code}")
-            
-            # Combine outputs for better error detection
-            combined_output = (error_output + "\n" + stdout_output).strip()
-            
-            if combined_output:
-                print(f"[NL Server Manager] MCP server error output:\n{combined_output}")
-                
-                # Check for common errors and provide helpful messages
-                combined_lower = combined_output.lower()
-                if "uvicorn is not installed" in combined_lower or "no module named 'uvicorn'" in combined_lower:
-                    self.mcp_failed.emit(
-                        "ERROR: uvicorn is not installed.\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn"
-                    )
-                elif "fastapi" in combined_lower and ("not installed" in combined_lower or "no module named" in combined_lower):
-                    self.mcp_failed.emit(
-                        "ERROR: fastapi is not installed.\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn"
-                    )
-                elif "failed to import" in combined_lower or ("import" in combined_lower and "error" in combined_lower):
-                    self.mcp_failed.emit(
-                        f"Import error:\n\n{combined_output[:500]}\n\n"
-                        "Install required packages with:\n"
-                        "  pip install fastapi uvicorn"
-                    )
-                else:
-                    # Show the actual error output (truncate if too long)
-                    error_msg = combined_output[:2000]  # Increased limit for better debugging
-                    if len(combined_output) > 2000:
-                        error_msg += f"\n\n... (truncated, {len(combined_output)} chars total)"
-                    self.mcp_failed.emit(f"Server exited with code {exit_code}:\n\n{error_msg}")
             else:
-                # No output captured - this might indicate a very early crash
-                # Check process error string for more info
-                process_error = ""
-                if self.mcp_process:
-                    process_error = self.mcp_process.errorString()
-                
-                if process_error and process_error != "Unknown error":
-                    self.mcp_failed.emit(
-                        f"Server exited with code {exit_code}.\n"
-                        f"Process error: {process_error}\n\n"
-                        f"No output captured - server may have crashed immediately on startup.\n"
-                        f"Check:\n"
-                        f"  - Python executable: {sys.executable}\n"
-                        f"  - Server script exists: {self.nl_sql_dir / 'start_mcp_server.py'}\n"
-                        f"  - Required packages installed (fastapi, uvicorn)"
-                    )
-                else:
-                    self.mcp_failed.emit(
-                        f"Server exited with code {exit_code} (no error output captured).\n\n"
-                        f"Server may have crashed immediately on startup.\n"
-                        f"Check server logs or try running manually:\n"
-                        f"  python3 {self.nl_sql_dir / 'start_mcp_server.py'}"
-                    )
+                failed_signal.emit(
+                    f"Server exited with code {exit_code} (no error output captured).\n\n"
+                    f"Server may have crashed immediately on startup.\n"
+                    f"Check server logs or try running manually:\n"
+                    f"  python3 {self.nl_sql_dir / spec.script}"
+                )
     
-    def _verify_mcp_ready(self):
+    def _verify_ready(self, name: str):
         """
-        Schedule verification of MCP server. HTTP check runs in a worker thread so the Qt event loop is not blocked.
-        After max retries, emit mcp_failed so the UI does not stay stuck.
+        Schedule verification of a server. The HTTP check is an async GET on the pooled QNetworkAccessManager,
+        so the Qt event loop is not blocked; the result arrives in _on_verify_done.
+        After max retries, emit {name}_failed so the UI does not stay stuck.
         """
-        if not self.mcp_starting:
+        if not getattr(self, f"{name}_starting"):
             return
+        spec = _SERVERS[name]
+        logger = self._ensure_logger(name)
         # server_summary_plan_2 §2.4 + §2.1: probe returns bool; log LISTENING only when port is open
-        if _server_pc_logic_available and probe_port and hasattr(self, "_mcp_logger"):
-            log_fn = lambda msg: self._mcp_logger.info(msg)
-            if probe_port(8001, log_fn):
-                self._mcp_logger.info("MCP server is LISTENING on 127.0.0.1:8001")
-        self._mcp_verify_retries += 1
+        if _server_pc_logic_available and probe_port:
+            if probe_port(spec.port, lambda msg: logger.info(msg)):
+                logger.info(f"{spec.label} server is LISTENING on 127.0.0.1:{spec.port}")
+        retries = getattr(self, f"_{name}_verify_retries") + 1
+        setattr(self, f"_{name}_verify_retries", retries)
         # Solution 8: log when first verification runs
-        if self._mcp_verify_retries == 1:
-            if hasattr(self, '_mcp_logger'):
-                self._mcp_logger.info("[server_fail_1] First MCP verification run")
-            print("[NL Server Manager] First MCP verification run")
-
-        def do_check():
-            success = False
-            err_msg = None
-            try:
-                try:
-                    import requests
-                    response = requests.get("http://127.0.0.1:8001/health", timeout=2)
-                    success = response.status_code == 200
-                except ImportError:
-                    # Issue 3: fallback to urllib when requests not installed
-                    import urllib.request
-                    req = urllib.request.urlopen("http://127.0.0.1:8001/health", timeout=2)
-                    success = (req.getcode() == 200)
-                    req.close()
-            except Exception as e:
-                err_msg = str(e)
-            if _server_pc_logic_available and log_event and hasattr(self, "_mcp_logger"):
-                log_event(lambda m: self._mcp_logger.info(m), "verify_done emitted")
-            self._verify_mcp_done.emit(success, err_msg)
+        if retries == 1:
+            logger.info(f"[server_fail_1] First {spec.label} verification run")
+            print(f"[NL Server Manager] First {spec.label} verification run")
 
-        threading.Thread(target=do_check, daemon=True).start()
+        self._probe_health(name)
 
-    def _do_main_thread_verify_fastapi(self):
-        """server_fail_6 (1a): Main-thread verification fallback; runs after first delay, does HTTP check on main thread."""
-        if self._fastapi_ready_flag:
-            return
-        success = False
-        try:
-            try:
-                import requests
-                response = requests.get("http://127.0.0.1:8000/docs", timeout=2)
-                success = response.status_code == 200
-            except ImportError:
-                import urllib.request
-                req = urllib.request.urlopen("http://127.0.0.1:8000/docs", timeout=2)
-                success = (req.getcode() == 200)
-                req.close()
-        except Exception:
-            pass
-        if not success:
-            return
-        if self._fastapi_ready_flag:
-            return
-        if _server_pc_logic_available and log_event and hasattr(self, "_fastapi_logger"):
-            log_event(lambda msg: self._fastapi_logger.info(msg), "verify_done received on main thread")
-        print("\n\n[NL Server Manager] FastAPI server is ready (main-thread fallback)")
-        self.fastapi_starting = False
-        self._fastapi_ready_flag = True
-        if getattr(self, '_safety_timer_fastapi', None) is not None:
-            try:
-                self._safety_timer_fastapi.stop()
-            except Exception:
-                pass
-            self._safety_timer_fastapi = None
-        self.fastapi_ready.emit()
-        self._check_all_servers_ready()
+    def _on_verify_timeout(self, name: str):
+        """
+        Slot of _{name}_verify_timer (first check after start, then retries): run _verify_ready.
+        server_fail_6 (1a): if {name}_starting was already cleared but the server is not marked ready, still
+        probe; the async result is applied by _on_verify_done, which marks the server ready on success
+        regardless of the starting flag.
+        """
+        if getattr(self, f"{name}_starting"):
+            self._verify_ready(name)
+        elif not getattr(self, f"_{name}_ready_flag"):
+            self._probe_health(name)
 
-    def _do_main_thread_verify_mcp(self):
-        """server_fail_6 (1a): Main-thread verification fallback; runs after first delay, does HTTP check on main thread."""
-        if self._mcp_ready_flag:
-            return
-        success = False
-        try:
-            try:
-                import requests
-                response = requests.get("http://127.0.0.1:8001/health", timeout=2)
-                success = response.status_code == 200
-            except ImportError:
-                import urllib.request
-                req = urllib.request.urlopen("http://127.0.0.1:8001/health", timeout=2)
-                success = (req.getcode() == 200)
-                req.close()
-        except Exception:
-            pass
-        if not success:
-            return
-        if self._mcp_ready_flag:
+    def _verify_on_ready_output(self, name: str, text: str):
+        """Run the readiness check as soon as the server reports it is listening, rather than
+        on the next first_verify_ms / retry tick."""
+        if getattr(self, f"{name}_starting") and _READY_PHRASE in text:
+            self._verify_ready(name)
+
+    def _probe_health(self, name: str):
+        """Send an async GET to the server's readiness endpoint; the reply is handled by _on_probe_finished."""
+        spec = _SERVERS[name]
+        self._nam.get(QNetworkRequest(QUrl(f"http://127.0.0.1:{spec.port}{spec.health_path}")))
+
+    def _on_probe_finished(self, reply: QNetworkReply):
+        """Dispatch a readiness probe reply to _on_verify_done for the server on that port."""
+        port = reply.url().port()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            success, err_msg = False, reply.errorString()
+        else:
+            success, err_msg = status == 200, None if status == 200 else f"HTTP {status}"
+        reply.deleteLater()
+        name = self._server_by_port.get(port)
+        if name is None:
             return
-        if _server_pc_logic_available and log_event and hasattr(self, "_mcp_logger"):
-            log_event(lambda msg: self._mcp_logger.info(msg), "verify_done received on main thread")
-        print("\n\n[NL Server Manager] MCP server is ready (main-thread fallback)")
-        self.mcp_starting = False
-        self._mcp_ready_flag = True
-        if getattr(self, '_safety_timer_mcp', None) is not None:
-            try:
-                self._safety_timer_mcp.stop()
-            except Exception:
-                pass
-            self._safety_timer_mcp = None
-        self.mcp_ready.emit()
-        self._check_all_servers_ready()
-
-    def _on_mcp_verify_done(self, success: bool, error_msg: Optional[str]):
-        """Runs on Qt thread with result of MCP readiness check (done in worker thread).
-        server_fail_6 (2a): On success always apply ready (no early return on not mcp_starting). server_summary_plan_2 §2.5: log verify_done result."""
-        if hasattr(self, "_mcp_logger"):
-            self._mcp_logger.info(f"verify_done: success={success}, error_msg={error_msg!r}")
-        if _server_pc_logic_available and log_event and hasattr(self, "_mcp_logger"):
-            log_event(lambda msg: self._mcp_logger.info(msg), "verify_done received on main thread")
+        if _server_pc_logic_available and log_event:
+            logger = self._ensure_logger(name)
+            log_event(lambda m: logger.info(m), "verify_done emitted")
+        self._on_verify_done(name, success, err_msg)
+
+    def _on_verify_done(self, name: str, success: bool, error_msg: Optional[str]):
+        """Runs on Qt thread with result of a readiness check (dispatched from _on_probe_finished).
+        server_fail_6 (2a): On success always apply ready (no early return on not {name}_starting). server_summary_plan_2 §2.5: log verify_done result."""
+        spec = _SERVERS[name]
+        logger = self._ensure_logger(name)
+        logger.info(f"verify_done: success={success}, error_msg={error_msg!r}")
+        if _server_pc_logic_available and log_event:
+            log_event(lambda msg: logger.info(msg), "verify_done received on main thread")
         if success:
-            if self._mcp_ready_flag:
+            if getattr(self, f"_{name}_ready_flag"):
                 return  # Already applied (e.g. main-thread fallback ran first)
-            print("\n\n[NL Server Manager] MCP server is ready")
-            self.mcp_starting = False
-            self._mcp_ready_flag = True
+            print(f"\n\n[NL Server Manager] {spec.label} server is ready")
+            setattr(self, f"{name}_starting", False)
             # Issue 8: cancel safety timer so it cannot fire later
-            if getattr(self, '_safety_timer_mcp', None) is not None:
+            safety_timer = getattr(self, f"_safety_timer_{name}", None)
+            if safety_timer is not None:
                 try:
-                    self._safety_timer_mcp.stop()
+                    safety_timer.stop()
                 except Exception:
                     pass
-                self._safety_timer_mcp = None
-            self.mcp_ready.emit()
-            self._check_all_servers_ready()
+                setattr(self, f"_safety_timer_{name}", None)
+            getattr(self, f"{name}_ready").emit()
+            self._set_ready(name, True)
             return
-        if not self.mcp_starting:
+        if not getattr(self, f"{name}_starting"):
             return
-            if self._mcp_verify_retries >= self._max_verify_retries:
-                self.mcp_starting = False
-                if hasattr(self, '_mcp_logger') and error_msg:
-                    self._mcp_logger.warning(
-                        f"MCP verification gave up after {self._max_verify_retries} attempts. Last error: {error_msg}"
-                    )
-                self.mcp_failed.emit(
-                    format_not_ready_failure_message(
-                        "MCP server did not become ready in time. Check the logs folder next to the app."
-                    )
-                    if _server_pc_logic_available and format_not_ready_failure_message
-                    else "MCP server did not become ready in time. Check the logs folder next to the app."
+        retries = getattr(self, f"_{name}_verify_retries")
+        if retries >= self._max_verify_retries:
+            setattr(self, f"{name}_starting", False)
+            if error_msg:
+                logger.warning(
+                    f"{spec.label} verification gave up after {self._max_verify_retries} attempts. Last error: {error_msg}"
                 )
-            else:
-                if hasattr(self, '_mcp_logger') and error_msg:
-                    self._mcp_logger.warning(
-                        f"MCP verification failed (attempt {self._mcp_verify_retries}/{self._max_verify_retries}): {error_msg}"
-                    )
-                QTimer.singleShot(2500, self._verify_mcp_ready)
+            not_ready_msg = f"{spec.label} server did not become ready in time. Check the logs folder next to the app."
+            getattr(self, f"{name}_failed").emit(
+                format_not_ready_failure_message(not_ready_msg)
+                if _server_pc_logic_available and format_not_ready_failure_message
+                else not_ready_msg
+            )
+        else:
+            if error_msg:
+                logger.warning(
+                    f"{spec.label} verification failed (attempt {retries}/{self._max_verify_retries}): {error_msg}"
+                )
+            getattr(self, f"_{name}_verify_timer").start(2500)
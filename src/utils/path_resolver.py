@@ -2,11 +2,16 @@
 Path resolution utilities for development and PyInstaller bundled modes.
 Ensures paths work correctly whether running from source or as a bundled executable.
 """
+import functools
 import os
 import sys
 from pathlib import Path
 
+# Directories already created this run by get_data_path / ensure_data_dir; repeat lookups skip mkdir
+_ensured_dirs = set()
 
+
+@functools.lru_cache(maxsize=1)
 def get_app_base_path():
     """
     Get the base path where the application is running from.
@@ -18,6 +23,9 @@ def get_app_base_path():
     When the process is a server subprocess started by the frozen app, the parent
     sets STATMANG_APP_BASE so the server uses the same data directory as the main app.
 
+    The result is cached for the life of the process; call clear_path_cache() after
+    changing STATMANG_APP_BASE.
+
     Returns:
         str: Absolute path to application base directory
     """
@@ -47,6 +55,7 @@ def get_app_base_path():
         return os.path.abspath(".")
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """
     Get absolute path to resource, works for development and PyInstaller bundle.
@@ -80,13 +89,40 @@ def get_data_path(*relative_paths):
     Returns:
         Path: Path object pointing to the data location
     """
-    app_base = get_app_base_path()
-    data_path = Path(app_base) / "data" / Path(*relative_paths)
-    # Ensure parent directories exist
-    data_path.parent.mkdir(parents=True, exist_ok=True)
+    data_path = _resolve_data_path(relative_paths)
+    # Ensure parent directories exist (once per directory per run)
+    parent = data_path.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
     return data_path
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_data_path(relative_paths):
+    """Join data/ and relative_paths under the app base; cached, no filesystem access."""
+    return Path(get_app_base_path()) / "data" / Path(*relative_paths)
+
+
+def ensure_data_dir(*relative_paths):
+    """
+    Create a directory under data/ (and its parents) if missing.
+    Call once at startup for directories the app writes into, e.g. ensure_data_dir("logs").
+
+    Args:
+        *relative_paths: Directory components relative to data/
+
+    Returns:
+        Path: Path object pointing to the directory
+    """
+    dir_path = _resolve_data_path(relative_paths)
+    if dir_path not in _ensured_dirs:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(dir_path)
+    return dir_path
+
+
+@functools.lru_cache(maxsize=1)
 def get_database_path():
     """
     Get the path to the League database.
@@ -103,6 +139,18 @@ def get_database_path():
     return get_data_path("database", "League.db")
 
 
+def clear_path_cache():
+    """
+    Drop cached path lookups so the next call re-reads STATMANG_APP_BASE / STATMANG_DB_PATH
+    and the frozen/development state (e.g. in tests that change them).
+    """
+    get_app_base_path.cache_clear()
+    get_resource_path.cache_clear()
+    _resolve_data_path.cache_clear()
+    get_database_path.cache_clear()
+    _ensured_dirs.clear()
+
+
 def get_server_tests_log_path():
     """
     Return path to server test findings log: data/logs/server_tests.log under app base.
@@ -1,11 +1,26 @@
 # Silence all print statements unless STATMANG_DEBUG=1 is set
+import logging
 import os
 import sys
 
+# --------------------------------------------------
+# App-wide debug logger; below WARNING its calls return before formatting args,
+# so hot paths should use debug("... %s", value) rather than print(f"...")
+_DEBUG = os.environ.get("STATMANG_DEBUG", "0") == "1"
+
+log = logging.getLogger("statmang")
+log.setLevel(logging.DEBUG if _DEBUG else logging.WARNING)
+if _DEBUG and not log.handlers:
+  _console = logging.StreamHandler(sys.stdout)
+  _console.setFormatter(logging.Formatter("%(message)s"))
+  log.addHandler(_console)
+
+debug = log.debug
+
 # --------------------------------------------------
 def mute_print():
   try:
-      if os.environ.get("STATMANG_DEBUG", "0") != "1":
+      if not _DEBUG:
           import builtins
           builtins.print = lambda *args, **kwargs: None
   except Exception:
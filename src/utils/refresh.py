@@ -1,6 +1,13 @@
+import os
+
 from PySide6.QtCore import (QSize, Qt)
 from PySide6.QtWidgets import (QTreeWidgetItem)
 
+from src.utils.print_filter import debug, log
+
+_ALIGN_CENTER = Qt.AlignCenter
+_ICON_SIZE = QSize(35, 35)
+
 # --------------------------------------------------
 
 class Refresh():
@@ -16,20 +23,54 @@ class Refresh():
     self.teams_wl = self.lv_teams.tree1_bottom
     self.teams_avg = self.lv_teams.tree2_bottom
 
-  def restore_all(self):
-    """Rebuild players/teams/leaderboard views from league aggregates and stats."""
+    # team name -> ((logo path, mtime), QIcon); rebuilt when the file changes
+    self._logo_cache = {}
+    # team name -> Team; rebuilt from league.teams at the start of each restore_all
+    self._team_cache = {}
+    # signature of the league/tree state at the last completed restore_all
+    self._last_sig = None
+
+  def invalidate(self):
+    """Drop cached teams, logos and the last refresh signature so the next restore_all repaints."""
+    self._team_cache = {}
+    self._logo_cache = {}
+    self._last_sig = None
+
+  def snapshot(self):
+    """Collect the league aggregates restore_all renders; touches no widgets.
+
+    Returns (wl, avg, players_league, teams_by_name). Kept free of Qt calls
+    so it can be assembled away from the view update.
+    """
     wl = self.league.get_all_wl() 
     avg = self.league.get_all_avg()
     players_league = self.league.get_all_players_num()
+    # one pass over the league so get_logo avoids a linear find_team per row
+    teams_by_name = {t.name: t for t in self.league.teams}
+    return wl, avg, players_league, teams_by_name
+
+  def restore_all(self, snapshot=None):
+    """Rebuild players/teams/leaderboard views from league aggregates and stats.
+
+    `snapshot` is a prepared result of snapshot(); taken now when omitted.
+    """
+    wl, avg, players_league, teams_by_name = snapshot if snapshot is not None else self.snapshot()
+
+    # nothing changed in the league or the trees since the last refresh
+    sig = self._signature(wl, avg, players_league)
+    if sig is not None and sig == self._last_sig:
+      return
+
+    self._team_cache = teams_by_name
 
     # all league players in tree widget
-    players_view = [x[0] for x in self.get_widget_view(self.players, 3)] # player name only
+    players_view = self.get_names_only(self.players) # player name only
 
     # all league teams in tree widget 
     # wl tree widget
-    teams_view_wl = [x[0] for x in self.get_widget_view(self.teams_wl, 2)] # team name only
+    teams_view_wl = self.get_names_only(self.teams_wl) # team name only
     # avg tree widget
-    teams_view_avg = [x[0] for x in self.get_widget_view(self.teams_avg, 2)] # team name only
+    teams_view_avg = self.get_names_only(self.teams_avg) # team name only
 
     # restore players view
     self.restore_view(players_league, players_view, self.players, 3)
@@ -42,67 +83,120 @@ class Refresh():
 
     # restore leaderboard
     self.leaderboard.restore_items()
+
+    # trees were populated, so sign against their new row counts
+    self._last_sig = self._signature(wl, avg, players_league)
+
+  def _signature(self, wl, avg, players_league):
+    """Hash the league aggregates plus tree row counts; None if a value is unhashable."""
+    counts = tuple(w.topLevelItemCount() for w in (self.players, self.players_avg, self.teams_wl, self.teams_avg))
+    try:
+      return hash((tuple(map(tuple, wl)), tuple(map(tuple, avg)), tuple(map(tuple, players_league)), counts))
+    except TypeError:
+      return None
   
   def get_logo(self, team):
-    """Return QIcon built from team.logo path if available; None on failure."""
+    """Return QIcon built from team.logo path if available; None on failure.
+
+    Icons are cached per team and reused until the logo path or its
+    modification time changes.
+    """
     logo = None
-    find_team = self.league.find_team(team)
+    find_team = self._team_cache.get(team)
+    if find_team is None:
+      find_team = self.league.find_team(team)
+      if find_team is not None:
+        self._team_cache[team] = find_team
     if find_team and find_team.logo:
+      try:
+        key = (find_team.logo, os.path.getmtime(find_team.logo))
+      except OSError:
+        key = (find_team.logo, None)
+      cached = self._logo_cache.get(team)
+      if cached is not None and cached[0] == key:
+        return cached[1]
       # Convert string path to QIcon for display
       from src.utils.image import Icon
       try:
         icon_obj = Icon(find_team.logo)
         logo = icon_obj.create_icon()
       except Exception as e:
-        print(f"Warning: Could not load team logo from '{find_team.logo}': {e}")
+        log.warning("Could not load team logo from '%s': %s", find_team.logo, e)
         logo = None
+      if logo is not None:
+        self._logo_cache[team] = (key, logo)
     return logo
 
   def restore_view(self, lst, view, widget, num):
-    """Insert missing rows into a QTreeWidget based on target list snapshot."""
+    """Insert missing rows into a QTreeWidget based on target list snapshot.
+
+    `view` is a set of the names already shown in `widget`.
+
+    Rows are built first and inserted in one batch with updates, sorting and
+    signals suspended, so the tree relayouts once instead of per row.
+    """
     ##print('player league:', players_league)
-    for el in lst: # item name only
+    missing = [el for el in lst if el[0] not in view]
+    if not missing:
+      return
+
+    # build in display order: the old per-row insertTopLevelItem(0, ...) left
+    # the last row on top, so walk the snapshot back to front
+    new_items = []
+    append = new_items.append
+    make_item = QTreeWidgetItem
+    has_logo = False
+    for el in reversed(missing): # item name only
       ##print('view el:', el)
-      if el[0] not in view:
-        if num == 3:
-          item = QTreeWidgetItem([el[0], el[1], str(el[2])])
-          item.setTextAlignment(0, Qt.AlignCenter)
-          item.setTextAlignment(1, Qt.AlignCenter)
-          item.setTextAlignment(2, Qt.AlignCenter)
-          widget.insertTopLevelItem(0, item)
-          print('refresh player:', el[0], el[1], el[2])
-        elif num == 2:
-          team = el[0]
-          logo = self.get_logo(team)
-          item = QTreeWidgetItem([el[0], str(el[2])])
-          if logo:
-            item.setIcon(0, logo)
-            widget.setIconSize(QSize(35,35))
-          item.setTextAlignment(0, Qt.AlignCenter)
-          item.setTextAlignment(1, Qt.AlignCenter)
-          item.setTextAlignment(2, Qt.AlignCenter)
-          widget.insertTopLevelItem(0, item)
-          print('refresh team:', el[0], el[1], el[2])
+      if num == 3:
+        item = make_item([el[0], el[1], str(el[2])])
+        item.setTextAlignment(0, _ALIGN_CENTER)
+        item.setTextAlignment(1, _ALIGN_CENTER)
+        item.setTextAlignment(2, _ALIGN_CENTER)
+        append(item)
+        debug("refresh player: %s %s %s", el[0], el[1], el[2])
+      elif num == 2:
+        team = el[0]
+        logo = self.get_logo(team)
+        item = make_item([el[0], str(el[2])])
+        if logo:
+          item.setIcon(0, logo)
+          has_logo = True
+        item.setTextAlignment(0, _ALIGN_CENTER)
+        item.setTextAlignment(1, _ALIGN_CENTER)
+        append(item)
+        debug("refresh team: %s %s %s", el[0], el[1], el[2])
+
+    if has_logo:
+      widget.setIconSize(_ICON_SIZE)
+    sorting = widget.isSortingEnabled()
+    widget.setUpdatesEnabled(False)
+    widget.setSortingEnabled(False)
+    widget.blockSignals(True)
+    try:
+      if widget.topLevelItemCount() == 0:
+        # empty tree (first fill): plain append, nothing to shift
+        widget.addTopLevelItems(new_items)
+      else:
+        widget.insertTopLevelItems(0, new_items)
+    finally:
+      widget.blockSignals(False)
+      widget.setSortingEnabled(sorting)
+      widget.setUpdatesEnabled(True)
           
 
   def get_widget_view(self, tree_widget, num):
     """Return a list of row tuples read from a QTreeWidget (2 or 3 columns)."""
-    ret = []
     count = tree_widget.topLevelItemCount()
-    i = 0 
-    while i < count:
-        if num == 3:
-          item = tree_widget.topLevelItem(i)
-          name = item.text(0)
-          team = item.text(1)
-          avg = item.text(2)
-          ret.append((name, team, avg))
-        elif num == 2:
-          item = tree_widget.topLevelItem(i)
-          team = item.text(0)
-          avg = item.text(1)
-          ret.append((team, avg))
-        i += 1
-    return ret
-  
+    if count == 0:
+      return []
+    top = tree_widget.topLevelItem
+    if num == 3:
+      return [((item := top(i)).text(0), item.text(1), item.text(2)) for i in range(count)]
+    return [((item := top(i)).text(0), item.text(1)) for i in range(count)]
 
+  def get_names_only(self, tree_widget):
+    """Return the set of column-0 names shown in a QTreeWidget."""
+    top = tree_widget.topLevelItem
+    return {top(i).text(0) for i in range(tree_widget.topLevelItemCount())}
+  
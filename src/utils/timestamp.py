@@ -3,18 +3,21 @@ from random import randint
 import os
 from pathlib import Path
 
+_FMT = "_%m%d%Y"
+_FMT_S = "_%m%d%Y_%S"
+
+
+def get_timestamp(flag=False):
+    """Return today's date as "_MMDDYYYY" (with "_SS" seconds when flag is set)."""
+    return datetime.now().strftime(_FMT_S if flag else _FMT)
+
+
 class Timestamp():
-    def __init__(self):
-      pass
+    """Stateless helpers for timestamped export file names; use the class directly."""
 
     @staticmethod
     def get_timestamp(flag=False):
-          now = datetime.now()
-          date = now.strftime("_%m%d%Y")
-          if flag: 
-            date = now.strftime("_%m%d%Y_%S")
-          #print(f"Formatted date: {date}")
-          return date
+          return get_timestamp(flag)
 
     @staticmethod
     def get_rand():
@@ -36,12 +39,20 @@ class Timestamp():
     @staticmethod
     def get_new_ts(ts: str,csv_path: Path, chosen_name: str) -> str:
         ts = Timestamp.get_timestamp()
+        # list the directory once and resolve collisions against the names in memory
+        try:
+          with os.scandir(csv_path) as entries:
+            existing = {e.name for e in entries}
+        except (FileNotFoundError, NotADirectoryError):
+          return ts
+        base = f"_{chosen_name}"
+        if base + ts not in existing:
+          return ts
+        stripped = Timestamp.strip_ts_val(ts)
         i = 0
-        while Timestamp.isPathExist(csv_path / f"_{chosen_name}{ts}"):
-          temp = f"({i})"
-          ts = Timestamp.get_next_int(temp, Timestamp.strip_ts_val(ts))
+        while f"{base}{stripped}({i})" in existing:
           i += 1
-        return ts
+        return Timestamp.get_next_int(f"({i})", stripped)
 
     @staticmethod
     def isPathExist(file_path):
@@ -1,3 +1,5 @@
+from functools import partial
+
 from PySide6.QtCore import QObject, QEvent, QModelIndex
 from PySide6.QtWidgets import QAbstractItemView
 from PySide6.QtWidgets import QTreeView, QTreeWidget
@@ -8,6 +10,9 @@ class TreeEventFilter_1(QObject):
         super().__init__()
         self.trees = trees_lst
         self.tree_obj_names = self.get_obj_name()
+        self.set_selection_mode()
+        for tree in self.trees:
+            tree.itemSelectionChanged.connect(partial(self._on_selection, tree))
     
     def set_selection_mode(self):
         """Set single-selection mode on all tracked tree widgets."""
@@ -29,21 +34,20 @@ class TreeEventFilter_1(QObject):
                             tree.setCurrentIndex(QModelIndex())
         return False
     
+    def _on_selection(self, tree):
+        """Clear the other trees when `tree` gains a selection."""
+        # clearing another tree re-emits its signal; ignore trees left empty
+        if not tree.selectedItems():
+            return
+        for el in self.tree_obj_names[tree.objectName()]:
+            el.clearSelection()
+            el.setCurrentItem(None)
+
     def limit_one_selection(self):
         """Ensure that only one tree has a selection at any time by clearing others."""
         ##print("new selection")
-        self.set_selection_mode()
         for tree in self.trees:
-          selected = tree.selectedItems()
-          if selected:
-            temp = tree.objectName()
-            to_clear = self.tree_obj_names[temp]
-            ##print("temp:", temp)
-            ##print("to clear:", to_clear)
-            for el in to_clear:
-                el.clearSelection()
-                el.setCurrentItem(None)
-                ##print("el:", el)
+          self._on_selection(tree)
         ##print(self.tree_obj_names)
 
     def get_obj_name(self):
@@ -63,38 +67,54 @@ class TreeEventFilter(QObject):
         super().__init__()
         self.trees = trees_lst
         self.parent = parent
+        # viewport -> owning tree, so a press resolves its tree with one lookup
+        self._viewport_map = {tree.viewport(): tree for tree in trees_lst}
+
+    @staticmethod
+    def _holds_selection(tree):
+        """True if tree has selected rows or a current index (e.g. set by keyboard navigation)."""
+        return tree.selectionModel().hasSelection() or tree.currentIndex().isValid()
+
+    @staticmethod
+    def _clear_tree(tree):
+        """Clear selection and current item/index on a single tree."""
+        tree.clearSelection()
+        if isinstance(tree, QTreeWidget):
+            tree.setCurrentItem(None)
+        elif isinstance(tree, QTreeView):
+            tree.setCurrentIndex(QModelIndex())
 
     def eventFilter(self, obj, event):
         """Clear other trees, set selection on click, or clear all on whitespace click."""
-        if event.type() == QEvent.Type.MouseButtonPress:
-            for tree in self.trees:
-                if obj == tree.viewport():
-                    index = tree.indexAt(event.pos())
+        if event.type() != QEvent.Type.MouseButtonPress:
+            return False
+        tree = self._viewport_map.get(obj)
+        if tree is None:
+            return False
 
-                    # Clear selection in all trees first
-                    for other_tree in self.trees:
-                        other_tree.clearSelection()
-                        if isinstance(other_tree, QTreeWidget):
-                            other_tree.setCurrentItem(None)
-                        elif isinstance(other_tree, QTreeView):
-                            other_tree.setCurrentIndex(QModelIndex())
+        index = tree.indexAt(event.pos())
 
-                    # If clicked in whitespace, don't select anything
-                    if not index.isValid():
-                        self.parent.selected = None
-                        return True  # Consume the event
+        # Clear every tree still holding a selection, however it was made (mouse or keyboard);
+        # trees that are already empty are skipped
+        for other in self.trees:
+            if other is tree or self._holds_selection(other):
+                self._clear_tree(other)
+
+        # If clicked in whitespace, don't select anything
+        if not index.isValid():
+            self.parent.selected = None
+            return True  # Consume the event
 
-                    # If clicked on a valid item, select it
-                    if isinstance(tree, QTreeWidget):
-                        item = tree.itemAt(event.pos())
-                        if item:
-                            tree.setCurrentItem(item)
-                            item.setSelected(True)
-                    elif isinstance(tree, QTreeView):
-                        tree.setCurrentIndex(index)
-                        tree.selectionModel().select(
-                            index,
-                            tree.selectionModel().SelectionFlag.ClearAndSelect
-                        )
+        # If clicked on a valid item, select it
+        if isinstance(tree, QTreeWidget):
+            item = tree.itemAt(event.pos())
+            if item:
+                tree.setCurrentItem(item)
+                item.setSelected(True)
+        elif isinstance(tree, QTreeView):
+            tree.setCurrentIndex(index)
+            tree.selectionModel().select(
+                index,
+                tree.selectionModel().SelectionFlag.ClearAndSelect
+            )
         return False
-      
\ No newline at end of file
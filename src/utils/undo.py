@@ -1,3 +1,67 @@
+from src.utils.print_filter import debug
+
+
+def _undo_lineup(obj, stat, prev, message):
+    """Restore one lineup slot from its (key, value) snapshot."""
+    key, value = prev[0], prev[1]
+    obj.lineup[key] = value
+    # print('undo:', obj.lineup)
+    return True
+
+
+def _undo_positions(obj, stat, prev, message):
+    """Restore one position slot from its (key, value) snapshot."""
+    key, value = prev[0], prev[1]
+    obj.positions[key] = value
+    # print('undo:', obj.positions)
+    return True
+
+
+def _undo_counted(obj, stat, prev, message):
+    """Revert a stat recorded with its PA (and AB) increments.
+
+    `stat` is (pa, val, statType) or (pa, ab, val, statType). Returns False
+    without touching `obj` when a counter is already 0, since the undo would
+    drive it negative.
+    """
+    if len(stat) == 3:
+        pa, val, statType = stat
+        counters = (pa,)
+    elif len(stat) == 4:
+        pa, ab, val, statType = stat
+        counters = (pa, ab)
+    else:
+        return True
+
+    current = [getattr(obj, attr) for attr in counters]
+    # Validation: prevent undo if PA or AB is 0 (would make it negative)
+    if 0 in current:
+        if message is not None:
+            message.show_message("Player at bat and pa are 0", btns_flag=False, timeout_ms=2000)
+        return False
+
+    debug("curr pa: %s %s %s", current[0], prev, current[0] - prev)
+    for attr, curr in zip(counters, current):
+        setattr(obj, attr, curr - val)
+    setattr(obj, statType, prev)
+    return True
+
+
+def _undo_attr(obj, stat, prev, message):
+    """Restore a single attribute to its previous value."""
+    if isinstance(stat, tuple):
+        return _undo_counted(obj, stat, prev, message)
+    setattr(obj, stat, prev)
+    return True
+
+
+# stat key -> handler(obj, stat, prev, message); anything else is an attribute
+_DISPATCH = {
+    'lineup': _undo_lineup,
+    'positions': _undo_positions,
+}
+
+
 class Undo:
     def __init__(self, stack, league):
         """Undo helper that reverts the last action recorded in the provided stack."""
@@ -12,61 +76,8 @@ class Undo:
         last_action = self.stack.get_last()
         obj, team, stat, prev, func, flag, player = last_action
 
-        if stat == 'lineup':
-            key = prev[0]
-            value = prev[1]
-            obj.lineup[key] = value
-            # print('undo:', obj.lineup)
-
-        elif stat == 'positions':
-            key = prev[0]
-            value = prev[1]
-            obj.positions[key] = value
-            # print('undo:', obj.positions)
-
-        else:
-            # print('setattr - undo:', obj, stat, prev)
-            if isinstance(stat, list):
-                pa = ab = statType = None
-
-                if len(stat) == 3:
-                    pa, val, statType = stat
-                    # print("len 3: ", pa, statType, prev)
-                    currPA = getattr(obj, pa)
-
-                    # Validation: prevent undo if PA is 0 (would make it negative)
-                    if currPA == 0:
-                        if message is not None:
-                            message.show_message("Player at bat and pa are 0", btns_flag=False, timeout_ms=2000)
-                        return
-
-                    print("curr pa: ", currPA, prev, currPA - prev)
-                    paUpdate = currPA - val
-
-                    setattr(obj, pa, paUpdate)
-                    setattr(obj, statType, prev)
-
-                elif len(stat) == 4:
-                    pa, ab, val, statType = stat
-                    # print("len 4: ", pa, ab, val, statType)
-                    currAB = getattr(obj, ab)
-                    currPA = getattr(obj, pa)
-
-                    # Validation: prevent undo if PA or AB is 0 (would make it negative)
-                    if currPA == 0 or currAB == 0:
-                        if message is not None:
-                            message.show_message("Player at bat and pa are 0", btns_flag=False, timeout_ms=2000)
-                        return
-
-                    paUpdate = currPA - val
-                    abUpdate = currAB - val
-
-                    setattr(obj, pa, paUpdate)
-                    setattr(obj, ab, abUpdate)
-                    setattr(obj, statType, prev)
-
-            else:
-                setattr(obj, stat, prev)
-                # print(team, stat, prev, func, flag, player)
-
-        self.stack.remove_last()
\ No newline at end of file
+        handler = _DISPATCH.get(stat, _undo_attr) if isinstance(stat, str) else _undo_attr
+        if not handler(obj, stat, prev, message):
+            return
+
+        self.stack.remove_last()
@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 """Quick database viewer"""
+import argparse
 import sqlite3
-import sys
+
+parser = argparse.ArgumentParser(description="Quick database viewer")
+parser.add_argument("table", nargs="?", help="table whose contents to print")
+parser.add_argument("--limit", type=int, default=1000,
+                    help="max rows to print for a table (0 for no limit; default 1000)")
+args = parser.parse_args()
+
+
+def _ident(name):
+    """Quote a table name as an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(name):
+    """Quote a table name as an SQL string literal."""
+    return "'" + name.replace("'", "''") + "'"
+
 
 db_path = "data/database/League.db"
-conn = sqlite3.connect(db_path)
+conn = sqlite3.connect(db_path, isolation_level=None)
+conn.execute("PRAGMA query_only=1")  # read-only viewer
 cursor = conn.cursor()
 
 # Get all tables
@@ -14,34 +32,39 @@ tables = [row[0] for row in cursor.fetchall()]
 print(f"📊 Database: {db_path}\n")
 print(f"Tables: {', '.join(tables)}\n")
 
-for table in tables:
-    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-    count = cursor.fetchone()[0]
-    print(f"✓ {table}: {count} rows")
+# Row counts for every table in one query
+if tables:
+    cursor.execute(" UNION ALL ".join(
+        f"SELECT {_literal(t)} AS n, COUNT(*) AS c FROM {_ident(t)}" for t in tables
+    ))
+    for table, count in cursor.fetchall():
+        print(f"✓ {table}: {count} rows")
 
 print("\n" + "="*50)
 print("To view a table, run:")
-print(f"  python view_db.py <table_name>")
+print(f"  python view_db.py <table_name> [--limit N]")
 print("="*50)
 
 # If table name provided, show contents
-if len(sys.argv) > 1:
-    table = sys.argv[1]
+if args.table:
+    table = args.table
     print(f"\n📋 Contents of '{table}':\n")
-    cursor.execute(f"SELECT * FROM {table}")
-    rows = cursor.fetchall()
-    
-    # Get column names
-    cursor.execute(f"PRAGMA table_info({table})")
+
+    # Column names first, so the header precedes the row stream
+    cursor.execute(f"PRAGMA table_info({_ident(table)})")
     columns = [row[1] for row in cursor.fetchall()]
     
     # Print header
     print(" | ".join(columns))
     print("-" * 80)
     
-    # Print rows
-    for row in rows:
-        print(" | ".join(str(val) if val is not None else "NULL" for val in row))
+    # Stream rows in batches
+    sql = f"SELECT * FROM {_ident(table)}"
+    if args.limit > 0:
+        sql += f" LIMIT {args.limit}"
+    cursor.execute(sql)
+    while (batch := cursor.fetchmany(1000)):
+        for row in batch:
+            print(" | ".join(str(val) if val is not None else "NULL" for val in row))
 
 conn.close()
-
@@ -78,19 +78,9 @@ class BarGraphWithDualAxes(QMainWindow):
 
     def set_y1_range(self):
         """Compute left-axis max from bar sets with a small headroom for readability."""
-        lst = dir(self)
-        max = 0
-        for el in lst:
-          if el == '_bar_series':
-            ##print(el)
-            temp = getattr(self, el) 
-            for set in temp.barSets():
-               for i in range(set.count()):
-                  value = set.at(i)
-                  if value > max:
-                    max = value
-                  ##print(f'value {value} at {i}')
-        ret = round(max * 1.25)
+        values = [bs.at(i) for bs in self._bar_series.barSets() for i in range(bs.count())]
+        mx = max(values, default=0)
+        ret = round(mx * 1.25)
         if len(str(ret)) >= 2:
           return round(ret, -1)
         return round(ret)
@@ -99,7 +89,7 @@ class BarGraphWithDualAxes(QMainWindow):
       """Build bar sets (and append AVG) from provided team data when one team selected."""
       # self._bar_series.append(team1)
       # list of tuples - team number and 
-      bar_series = getattr(self, '_bar_series')
+      bar_series = self._bar_series
       if len(self.data_bar) == 1:
         self.categories.append('AVG')
 
@@ -128,7 +118,7 @@ class BarGraphWithDualAxes(QMainWindow):
     def create_line_series(self):
       # self._bar_series.append(team1)
       # list of tuples - team number and 
-      line_series = getattr(self, '_line_series')
+      line_series = self._line_series
       for indx, team in enumerate(self.data_line):
         team, name, val = team
         val_float = float(val)
@@ -185,6 +175,8 @@ class BarGraph(QMainWindow):
 
   def _create_barsets(self):
     self.series_list = []
+    # left-axis max over the first five stats, tracked while building sets
+    self._max_left = 0
 
     for stat_index, stat_name in enumerate(self.stat_names):
         series = QBarSeries()
@@ -200,18 +192,16 @@ class BarGraph(QMainWindow):
 
         for team_stats in self.data_points:
             barset.append(team_stats[stat_index])
+            if stat_index < 5 and team_stats[stat_index] > self._max_left:
+                self._max_left = team_stats[stat_index]
 
         series.append(barset)
         self.chart.addSeries(series)
         self.series_list.append(series)
   
   def get_max_range(self, val):
-    if val % 4 == 0:
-       return val + 4 
-    else:
-      while val % 4 != 0:
-        val += 1
-      return val
+    # next multiple of 4 strictly above val (always 1..4 of headroom)
+    return ((int(val) + 4) // 4) * 4
 
   def _setup_axes(self):
     # Create font for all text elements (12px)
@@ -236,9 +226,7 @@ class BarGraph(QMainWindow):
         series.attachAxis(x_axis)
 
     # Left Y-axis for first 5 stats
-    max_stat_value = max(value for team in self.data_points for value in team[:5])
-
-    max_range = self.get_max_range(max_stat_value)
+    max_range = self.get_max_range(self._max_left)
     y_axis_left = QValueAxis()
     y_axis_left.setRange(0, max_range)
     y_axis_left.setLabelFormat("%.0f")
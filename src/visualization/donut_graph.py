@@ -2,20 +2,62 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 from __future__ import annotations
 import random
+from functools import lru_cache
 
 """PySide6 port of the Donut Chart Breakdown example from Qt v5.x"""
 
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QBrush, QColor, QFont
 from PySide6.QtCharts import QChart, QPieSeries, QPieSlice
 
+@lru_cache(maxsize=64)
+def _font(family: str, size: int) -> QFont:
+    """Return a shared QFont per (family, size); built on first use, after the app exists."""
+    return QFont(family, size)
+
+
+@lru_cache(maxsize=64)
+def _lighter_brush(rgba: int, factor: int) -> QBrush:
+    """Return a shared brush of QColor.fromRgba(rgba).lighter(factor)."""
+    return QBrush(QColor.fromRgba(rgba).lighter(factor))
+
+
+def _label_font() -> QFont:
+    """Return the Arial 14 font used for slice labels and legend markers."""
+    return _font("Arial", 14)
+
+
+def _build_slice_lists(raw_data, r_key, a_key):
+    """Shape graph-view rows into (stat, labels, values) per breakdown series.
+
+    Row n (1-based) holds its stat name under f"{r_key}_{n}" and a list of
+    {label: value} pairs under f"{a_key}_{n}". Zero values are dropped since
+    they get no slice or legend marker. Pure Python, no Qt.
+    """
+    out = []
+    for indx, el in enumerate(raw_data):
+        suffix = f'_{indx+1}'
+        labels = []
+        values = []
+        for pair in el[a_key + suffix]:
+            (type_, num), = pair.items()
+            if not num:
+                continue
+            labels.append(type_)
+            values.append(float(num))
+        out.append((el[r_key + suffix], labels, values))
+    return out
+
+
 class MainSlice(QPieSlice):
     def __init__(self, breakdown_series, parent=None):
         """A central pie slice that mirrors the sum of its breakdown series."""
         super().__init__(parent)
 
         self.breakdown_series = breakdown_series
-        self.name = None
+        self._name = None
+        # text of the current label; None forces the next update
+        self._last_label = None
 
         self.percentageChanged.connect(self.update_label)
 
@@ -25,19 +67,25 @@ class MainSlice(QPieSlice):
 
     def set_name(self, name):
         """Set display name for this main slice (used in labels)."""
-        self.name = name
+        self._name = name
+        self._last_label = None
 
-    def name(self):
-        return self.name
+    def name(self) -> str:
+        """Return the display name set by set_name."""
+        return self._name
 
     @Slot()
     def update_label(self):
         """Update centered label to show name and current percentage."""
-        p = self.percentage() * 100
-        self.setLabel(f"{self.name} {p:.2f}%")
+        label = f"{self._name} {self.percentage() * 100:.2f}%"
+        # skip setLabel (and the repaint) when the formatted text is unchanged
+        if label == self._last_label:
+            return
+        self._last_label = label
+        self.setLabel(label)
 
 class DonutBreakdownChart(QChart):
-    def __init__(self, data, colors=[], parent=None):
+    def __init__(self, data, colors=None, parent=None):
         """Donut chart with outer breakdown rings built from input data series."""
         super().__init__(QChart.ChartTypeCartesian,
                          parent, Qt.WindowFlags())
@@ -45,18 +93,32 @@ class DonutBreakdownChart(QChart):
         self.main_series.setPieSize(0.7)
         self.addSeries(self.main_series)
         self.raw_data = data
-        self.colors = colors
+        # private copy: get_rand_color pops from it, the caller's list stays intact
+        self.colors = list(colors) if colors else []
         self.color = Qt.red
         self.series_dict = {}
+        # breakdown series -> sum of its values, recorded when the series is filled
+        self._series_sums = {}
 
     def add_breakdown_series(self, breakdown_series, color):
         """Add a breakdown series as outer ring and a matching main slice segment."""
-        font = QFont("Arial", 14)
+        self._add_breakdown_series_no_recalc(breakdown_series, color)
+
+        # recalculate breakdown donut segments
+        self.recalculate_angles()
+
+        # update customize legend markers
+        self.update_legend_markers()
+
+    def _add_breakdown_series_no_recalc(self, breakdown_series, color):
+        """Add one breakdown ring and its main slice without recomputing angles or legend."""
+        font = _label_font()
 
         # add breakdown series as a slice to center pie
         main_slice = MainSlice(breakdown_series)
         main_slice.set_name(breakdown_series.name())
-        main_slice.setValue(breakdown_series.sum())
+        total = self._series_sums.get(breakdown_series)
+        main_slice.setValue(breakdown_series.sum() if total is None else total)
         self.main_series.append(main_slice)
 
         # customize the slice
@@ -71,56 +133,58 @@ class DonutBreakdownChart(QChart):
         breakdown_series.setHoleSize(0.7)
         breakdown_series.setLabelsVisible()
 
+        # one lighter shade of the main slice color for every breakdown slice
+        light_brush = _lighter_brush(QColor(color).rgba(), 115)
         for pie_slice in breakdown_series.slices():
             #print("pie slice:", pie_slice, dir(pie_slice), pie_slice.value())
-            slice_val = pie_slice.value()
-            if slice_val == 0.0:
-               pie_slice.setLabelVisible(False)
-            color = QColor(color).lighter(115)
-            pie_slice.setBrush(color)
+            pie_slice.setBrush(light_brush)
             pie_slice.setLabelFont(font)
 
         # add the series to the chart
         self.addSeries(breakdown_series)
 
-        # recalculate breakdown donut segments
-        self.recalculate_angles()
-
-        # update customize legend markers
-        self.update_legend_markers()
-
     def recalculate_angles(self):
         """Recompute start/end angles for each breakdown ring from main slice percents."""
-        angle = 0
+        angle = 0.0
         slices = self.main_series.slices()
+        # one series sum instead of a percentage() round trip per slice
+        total = self.main_series.sum() or 1.0
         for pie_slice in slices:
             #print("pie slice:", pie_slice)
-            breakdown_series = pie_slice.get_breakdown_series()
+            breakdown_series = pie_slice.breakdown_series
             breakdown_series.setPieStartAngle(angle)
-            angle += pie_slice.percentage() * 360.0  # full pie is 360.0
+            angle += (pie_slice.value() / total) * 360.0  # full pie is 360.0
             breakdown_series.setPieEndAngle(angle)
 
     def update_legend_markers(self):
         """Hide main-series legend markers; annotate breakdown markers with percentages."""
+        legend = self.legend()
+        main = self.main_series
+        font = _label_font()
         # go through all markers
         for series in self.series():
-            markers = self.legend().markers(series)
-            for marker in markers:
-                if series == self.main_series:
-                    # hide markers from main series
+            markers = legend.markers(series)
+            if series is main:
+                # hide markers from main series
+                for marker in markers:
                     marker.setVisible(False)
-                else:
-                    # modify markers from breakdown series
-                    label = marker.slice().label()
-                    p = marker.slice().percentage() * 100
-                    marker.setLabel(f"{label} {p:.2f}%")
-                    marker.setFont(QFont("Arial", 14))
+                continue
+            # modify markers from breakdown series; percent of the series total,
+            # taken once per series instead of a percentage() call per marker
+            total = self._series_sums.get(series)
+            if total is None:
+                total = series.sum()
+            scale = 100.0 / total if total else 0.0
+            for marker in markers:
+                sl = marker.slice()
+                p = sl.value() * scale
+                marker.setLabel(f"{sl.label()} {p:.2f}%")
+                marker.setFont(font)
     
     def pop_dict(self):
-      for indx, el in enumerate(self.raw_data):
-        ##print(indx, el)
-        series = QPieSeries()
+      for el in self.raw_data:
         ##print(el)
+        series = QPieSeries()
 
         resource = el['Resource']
         series.setName(resource)
@@ -129,41 +193,30 @@ class DonutBreakdownChart(QChart):
 
         amount = el['Amount']
 
-        for el in amount:
-            ##print(el)
-            type, num = list(el.keys()) + list(el.values()) 
-            ##print(type, num)
-            series.append(type, num)
+        # build the slices first and hand them to the series in one call
+        slices = []
+        for pair in amount:
+            ##print(pair)
+            (type_, num), = pair.items()
+            ##print(type_, num)
+            if num:  # zero stats get no slice or legend marker
+                slices.append(QPieSlice(type_, num))
+        series.append(slices)
         self.series_dict[resource].append(series)
             ##print(series_dic)
     
     # experimental - graph view 
     def pop_dict_exp(self, r_key, a_key):
-      reset_r = r_key 
-      reset_a = a_key
-
-      for indx, el in enumerate(self.raw_data):
-        ##print(indx, el)
+      for stat, labels, values in _build_slice_lists(self.raw_data, r_key, a_key):
         series = QPieSeries()
-
-        r_key = reset_r
-        a_key = reset_a
-
-        r_key = r_key + f'_{str(indx+1)}'
-        stat = el[r_key]
-        
         series.setName(stat)
 
         self.series_dict[stat] = []
 
-        a_key = a_key + f'_{str(indx+1)}'
-        amount = el[a_key]
-
-        for el in amount:
-            #print(el)
-            type, num = list(el.keys()) + list(el.values()) 
-            #print("donut graph:", type, num)
-            series.append(type, num)
+        # hand the series every slice in one call
+        series.append(list(map(QPieSlice, labels, values)))
+        # keep the total so add_breakdown_series needs no QPieSeries.sum() round trip
+        self._series_sums[series] = sum(values)
 
         self.series_dict[stat].append(series)
         #print(series_dic)
@@ -175,32 +228,20 @@ class DonutBreakdownChart(QChart):
         #print("series el:", self.series_dict[el][0], dir(self.series_dict[el][0]))
         for series in series_lst:
           #print("series:", series)
-          color = self.get_rand_color(self.colors, self.series_dict)
-          self.add_breakdown_series(series, color)
-    
-    def get_rand_color(self, colors, dict):
-      if len(colors) == 0:
-        return self.color 
-      
-      for el in dict:
-        ##print(el)
-        rand = random.randint(0, len(colors)-1)
-
-        check = colors[rand]
-
-        if check in colors:
-          indx = colors.index(check)
-          colors.pop(indx)
-          return check
-        
-        rand = random.randint(0, len(colors)-1)
-    
+          color = self.get_rand_color(self.colors)
+          self._add_breakdown_series_no_recalc(series, color)
+      # angles and legend depend on every slice; compute them once for the batch
+      self.recalculate_angles()
+      self.update_legend_markers()
     
-        
-          
-        
-        
-        
+    def get_rand_color(self, colors):
+      """Draw a random color from `colors` without replacement; fallback color when empty."""
+      if not colors:
+        return self.color
+      # swap the pick to the end so removing it is O(1)
+      i = random.randrange(len(colors))
+      colors[i], colors[-1] = colors[-1], colors[i]
+      return colors.pop()
 
 
 '''if __name__ == "__main__":
@@ -1,6 +1,13 @@
 from PySide6.QtWidgets import QMainWindow
 from PySide6.QtCore import Qt
 
+_WINDOW_FLAGS = (
+    Qt.Window |
+    Qt.WindowStaysOnTopHint |
+    Qt.CustomizeWindowHint |
+    Qt.WindowCloseButtonHint
+)
+
 class GraphWindow(QMainWindow):
   def __init__(self, parent, title):
     super().__init__(parent)
@@ -9,10 +16,5 @@ class GraphWindow(QMainWindow):
     self.resize(1500, 750)
     self.setWindowTitle(self.title)
     self.setWindowModality(Qt.NonModal)
-    self.setWindowFlags(
-        Qt.Window |
-        Qt.WindowStaysOnTopHint|
-        Qt.CustomizeWindowHint |
-        Qt.WindowCloseButtonHint
-    )
+    self.setWindowFlags(_WINDOW_FLAGS)
     self.setAttribute(Qt.WA_TranslucentBackground)
\ No newline at end of file
@@ -11,53 +11,186 @@ Also provides build_plot_code_prompt and extract_plot_code for the refactor path
 
 from __future__ import annotations
 
+import copy
 import json
 import re
-from typing import Any, Callable, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
-# Chart types and palettes must match viz_plot_builder / VizOptionsDialog
-CHART_TYPES = ["bar", "line", "scatter", "histogram", "box", "pie"]
-PALETTES = ["default", "viridis", "Set3", "colorblind", "pastel", "muted", "deep"]
+# Optional: orjson serializes sample rows and parses LLM replies faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def compute_data_summary(df: Any, max_sample: int = 3) -> dict[str, dict[str, Any]]:
-    """
-    Compute a short per-column summary for data-aware prompts (min/max/nunique or sample).
+def _dumps(obj: Any) -> str:
+    """json.dumps(obj, default=str), via orjson when available (compact separators)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
 
-    Args:
-        df: DataFrame with .columns and .dtypes.
-        max_sample: Max number of sample values to include for non-numeric columns.
 
-    Returns:
-        Dict mapping column name -> {dtype, ...stats}. Numeric: min, max, nunique.
-        Non-numeric: nunique, sample_values (list).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+# Array item separator _dumps would write, so a bounded dump reads like a whole one
+_ITEM_SEP = "," if orjson is not None else ", "
+
+
+def _bounded_dump(rows: list[Any], limit: int) -> Optional[str]:
+    """
+    JSON array of the leading rows whose dump stays under limit characters.
+
+    Rows are serialized one at a time and the loop stops at the first row that
+    would overflow, so a wide sample costs at most about limit characters of work.
+    Returns None when not even the first row fits.
     """
+    parts = []
+    total = 2  # the enclosing brackets
+    for row in rows:
+        part = _dumps(row)
+        total += len(part) + (len(_ITEM_SEP) if parts else 0)
+        if total >= limit:
+            break
+        parts.append(part)
+    return "[" + _ITEM_SEP.join(parts) + "]" if parts else None
+
+# Chart types and palettes must match viz_plot_builder / VizOptionsDialog
+CHART_TYPES = ["bar", "line", "scatter", "histogram", "box", "pie"]
+PALETTES = ["default", "viridis", "Set3", "colorblind", "pastel", "muted", "deep"]
+_VALID_CHART_TYPES = frozenset(CHART_TYPES)
+_VALID_PALETTES = frozenset(PALETTES)
+_VALID_AGGS = frozenset(("sum", "mean", "count"))
+
+# Parsed options from nl_to_plot_options, keyed on (normalized description, columns, dtypes);
+# most recently used last, oldest evicted past _CONFIG_CACHE_MAX
+_CONFIG_CACHE: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_CONFIG_CACHE_MAX = 256
+# Validated options from parse_chart_config, keyed on (raw response, columns, chart types,
+# palettes), so identical LLM replies skip decode and validation; LRU like _CONFIG_CACHE
+_PARSE_CACHE: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_PARSE_CACHE_MAX = 1024
+# Cosine similarity at which a new description reuses a semantically cached config
+_SEMANTIC_THRESHOLD = 0.92
+
+# Few-shot examples closing the chart config prompt
+_CHART_CONFIG_EXAMPLES = """
+Examples (output only the JSON object, no markdown):
+Example 1 - bar of one metric by category:
+{"chart_type": "bar", "x_col": "name", "y_col": "wins", "title": "Wins by Team", "y_cols": null}
+Example 2 - multiple metrics as grouped bar:
+{"chart_type": "bar", "x_col": "name", "y_cols": ["hit", "so", "bb"], "title": "Hit, SO, BB by Player", "y_col": null}
+Example 3 - pie with multiple wedge values:
+{"chart_type": "pie", "x_col": "name", "y_cols": ["hit", "so", "bb"], "title": "Hit/SO/BB by Player"}
+"""
+
+# Opening lines of build_plot_code_prompt
+_PLOT_CODE_INTRO = "\n".join((
+    "You are a Python code generator for matplotlib plots.",
+    "Given a plot description and the available DataFrame columns, output ONLY Python code (no markdown, no explanation).",
+    "",
+))
+
+# Instructions after the data context in build_plot_code_prompt
+_PLOT_CODE_RULES = "\n".join((
+    "The code will run with a variable `df` (pandas DataFrame) already in scope.",
+    "Allowed: pandas (pd), numpy (np), matplotlib.pyplot (plt), io (BytesIO).",
+    "Do not use open(), file(), os, subprocess, or network.",
+    "",
+    "Requirements:",
+    "1. If the user specifies particular entities (e.g. player names, team names, or 'players: nick, james', 'teams A and B'), you MUST filter df first: keep only rows where the relevant column is in those values. Use only values from the 'Valid values for filtering' list below. Example: df = df[df['name'].astype(str).str.strip().isin(['nick', 'james'])] then plot the filtered df. If no specific entities are named, plot the full df.",
+    "2. Column mapping: when the user says 'players' or 'player names' use the column that holds player names (often 'name'); when they say 'teams' or 'team names' use the column that holds team names (often 'team' or 'name'). Use only column names from the available columns list.",
+    "3. Build a matplotlib figure from the (possibly filtered) df (e.g. bar, line, scatter, pie, histogram).",
+    "4. Save the figure to a buffer: buf = io.BytesIO(); plt.savefig(buf, format='png', bbox_inches='tight', dpi=150); buf.seek(0)",
+    "5. Set the result: plot_png_bytes = buf.getvalue()",
+    "6. Use only column names from the list above.",
+))
+
+# Opening lines of build_plot_code_prompt_from_idea
+_IDEA_CODE_INTRO = "\n".join((
+    "You are a Python code generator for plots. Implement EXACTLY the selected chart below using matplotlib (plt) or seaborn (sns).",
+    "CRITICAL: You MUST implement the selected chart_type and approach. Do NOT substitute a generic bar chart. If the selected type is line, scatter, violin, heatmap, pie, etc., use that exact visualization.",
+    "",
+))
+
+# Instructions after the data context in build_plot_code_prompt_from_idea
+_IDEA_CODE_RULES = "\n".join((
+    "Use ONLY these column names. Do not use column names not in this list.",
+    "The code runs with `df` (pandas DataFrame) in scope. Allowed: pd, np, plt, sns (seaborn), io.",
+    "Do not use open(), file(), os, subprocess, or network.",
+    "",
+    "Requirements:",
+    "1. If the user specifies particular entities (e.g. player names, 'players: nick, james'), filter df first to those rows using the 'Valid values for filtering' list below, then plot the filtered df.",
+    "2. Use only column names from the Available columns list.",
+    "3. Implement the chart_type above: use plt or sns accordingly (e.g. line -> plt.plot or sns.lineplot; violin -> sns.violinplot; heatmap -> sns.heatmap; pie -> plt.pie; scatter -> plt.scatter or sns.scatterplot).",
+    "4. Save the figure to a buffer: buf = io.BytesIO(); plt.savefig(buf, format='png', bbox_inches='tight', dpi=150); buf.seek(0); plot_png_bytes = buf.getvalue()",
+    "5. If using seaborn, get the figure with plt.gcf() after the seaborn call, then plt.savefig(...) to the buffer. End with plot_png_bytes = buf.getvalue().",
+))
+
+# Chart-type diversity and data-driven rules of build_plot_brainstorm_prompt
+_BRAINSTORM_RULES = (
+    "=== RULES ===",
+    "1. Propose exactly 3 ideas with DIFFERENT chart types. Do NOT propose three bar charts or the same type twice.",
+    "2. Vary chart types using the data context above:",
+    "   - Few categories + one numeric column -> bar or pie for one idea.",
+    "   - Many rows + numeric column -> line/trend or histogram for another idea.",
+    "   - Two numeric columns -> scatter. Many numeric columns -> heatmap or pairplot.",
+    "   - Categorical + numeric -> boxplot or violin (e.g. sns.boxplot, sns.violinplot) for another idea.",
+    "3. Use ONLY the column names listed above. Do not invent column names (e.g. no HR, RBI, RUNS unless they appear in Available columns).",
+    "4. Each idea: (a) label, (b) chart_type (e.g. bar, line, scatter, pie, seaborn_violin, seaborn_heatmap), (c) approach (one line: what to plot and how).",
+    "",
+    "Output format (JSON array):",
+    '[{"label": "...", "chart_type": "...", "approach": "..."}, {"label": "...", "chart_type": "...", "approach": "..."}, {"label": "...", "chart_type": "...", "approach": "..."}]',
+    "",
+)
+
+# Fenced ```json ... ``` block anywhere in a response (prose before/after is common)
+_FENCED_BLOCK = re.compile(r"```(?:json)?[ \t]*\n(.*?)\n?[ \t]*```", re.IGNORECASE | re.DOTALL)
+# JS-style // and /* */ comments some models leave inside JSON; string literals are
+# matched first (group 1) and kept, so "http://..." values survive. Only used on a retry.
+_JSON_COMMENT = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*[\s\S]*?\*/')
+
+_DECODER = json.JSONDecoder()
+# Leading idea number in a select reply; letters, "." or ":" before it end the search
+_SELECT_RE = re.compile(r"(?:(?![^\W\d_])[^123.:])*([123])")
+
+
+def _sample_strings(s: Any, max_sample: int) -> list[str]:
+    """First max_sample values of a null-free Series as strings; skips astype when they already are."""
+    head = s.head(max_sample)
+    values = head.tolist()
+    if all(isinstance(v, str) for v in values):
+        return values
+    return head.astype(str).tolist()
+
+
+def _summary_per_column(df: Any, max_sample: int) -> dict[str, dict[str, Any]]:
+    """Column-at-a-time summary; fallback for frames the batched path cannot handle."""
     summary: dict[str, dict[str, Any]] = {}
-    try:
-        cols = list(df.columns)
-    except Exception:
-        return summary
-    for c in cols:
+    for c, s_raw in df.items():
         try:
-            s = df[c].dropna()
-            dtype = str(df.dtypes[c]) if hasattr(df, "dtypes") else "unknown"
+            s = s_raw.dropna()
+            dtype = str(s_raw.dtype)
             entry: dict[str, Any] = {"dtype": dtype}
-            if hasattr(s, "dtype") and (s.dtype.kind in "iufc" or "int" in dtype or "float" in dtype):
+            entry["nunique"] = int(s.nunique())
+            kind = s.dtype.kind
+            if kind in "iufc" or "int" in dtype or "float" in dtype:
                 try:
-                    num = pd.to_numeric(s, errors="coerce").dropna()
+                    # Already-numeric columns skip the to_numeric copy.
+                    num = s if kind in "iuf" else pd.to_numeric(s, errors="coerce").dropna()
                     if len(num):
                         entry["min"] = float(num.min())
                         entry["max"] = float(num.max())
-                    entry["nunique"] = int(s.nunique())
                 except Exception:
-                    entry["nunique"] = int(s.nunique())
+                    pass
             else:
-                entry["nunique"] = int(s.nunique())
                 try:
-                    samples = s.head(max_sample).astype(str).tolist()
-                    entry["sample_values"] = samples
+                    entry["sample_values"] = _sample_strings(s, max_sample)
                 except Exception:
                     pass
             summary[str(c)] = entry
@@ -66,69 +199,124 @@ def compute_data_summary(df: Any, max_sample: int = 3) -> dict[str, dict[str, An
     return summary
 
 
-def build_chart_config_prompt(
-    description: str,
+def compute_data_summary(df: Any, max_sample: int = 3) -> dict[str, dict[str, Any]]:
+    """
+    Compute a short per-column summary for data-aware prompts (min/max/nunique or sample).
+
+    Args:
+        df: DataFrame with .columns and .dtypes.
+        max_sample: Max number of sample values to include for non-numeric columns.
+
+    Returns:
+        Dict mapping column name -> {dtype, ...stats}. Numeric: min, max, nunique.
+        Non-numeric: nunique, sample_values (list).
+    """
+    try:
+        cols = list(df.columns)
+    except Exception:
+        return {}
+    try:
+        if df.columns.has_duplicates:
+            return _summary_per_column(df, max_sample)
+        kinds = {c: t.kind for c, t in df.dtypes.items()}
+        dtype_strs = df.dtypes.astype(str).to_dict()
+        numeric = [
+            c for c in cols
+            if kinds[c] in "iufc" or "int" in dtype_strs[c] or "float" in dtype_strs[c]
+        ]
+        # min/max only for real-valued kinds; complex has no ordering.
+        ranged = [c for c in numeric if kinds[c] in "iuf"]
+        mins: dict[Any, Any] = {}
+        maxs: dict[Any, Any] = {}
+        if ranged:
+            stats = df[ranged].agg(["min", "max"])
+            mins = stats.loc["min"].to_dict()
+            maxs = stats.loc["max"].to_dict()
+        nuniques = df.nunique(dropna=True).to_dict()
+    except Exception:
+        return _summary_per_column(df, max_sample)
+
+    numeric_set = set(numeric)
+    # Labels are almost always str already; only mixed/int labels need converting
+    all_str = all(isinstance(c, str) for c in cols)
+    summary: dict[str, dict[str, Any]] = {}
+    for c, s_raw in df.items():
+        entry: dict[str, Any] = {"dtype": dtype_strs[c]}
+        if c in numeric_set:
+            lo, hi = mins.get(c), maxs.get(c)
+            if lo is not None and hi is not None and pd.notna(lo) and pd.notna(hi):
+                entry["min"] = float(lo)
+                entry["max"] = float(hi)
+        entry["nunique"] = int(nuniques.get(c, 0))
+        if c not in numeric_set:
+            # Samples skip nulls, so they stay per column; head() keeps each one cheap.
+            try:
+                entry["sample_values"] = _sample_strings(s_raw.dropna(), max_sample)
+            except Exception:
+                pass
+        summary[c if all_str else str(c)] = entry
+    return summary
+
+
+def _format_summary_lines(
+    data_summary: dict[str, dict[str, Any]],
     column_names: list[str],
-    column_dtypes: Optional[dict[str, str]] = None,
-    data_summary: Optional[dict[str, dict[str, Any]]] = None,
-    chart_types: Optional[list[str]] = None,
-    palettes: Optional[list[str]] = None,
+    include_range: bool = True,
+    dtype_label: str = "",
 ) -> str:
     """
-    Build a prompt that asks the LLM for a chart config JSON.
+    Format a compute_data_summary() result as one indented line per known column.
 
     Args:
-        description: User's natural-language plot description.
-        column_names: List of column names available in the DataFrame.
-        column_dtypes: Optional map of column name -> dtype string (e.g. "int64", "object").
-        data_summary: Optional per-column summary (min/max/nunique or sample_values) for data-aware prompts.
-        chart_types: Allowed chart_type values; defaults to CHART_TYPES.
-        palettes: Allowed palette values; defaults to PALETTES.
+        data_summary: Per-column summary; columns not in column_names are skipped.
+        column_names: Columns the prompt lists.
+        include_range: Whether to add range=[min,max] for columns that have one.
+        dtype_label: Text placed before the dtype (e.g. "dtype=").
 
     Returns:
-        Prompt string for the LLM.
+        Newline-joined lines, or "" if no summarized column is in column_names.
     """
-    chart_types = chart_types or CHART_TYPES
-    palettes = palettes or PALETTES
-    columns_line = ", ".join(f'"{c}"' for c in column_names)
-    if column_dtypes:
-        dtype_line = "\n".join(f"  - {k}: {v}" for k, v in column_dtypes.items())
-        columns_section = f"Column names and dtypes:\n{dtype_line}\nUse only these columns."
-    else:
-        columns_section = f"Column names (use only these): {columns_line}"
-
-    data_summary_section = ""
-    if data_summary:
-        lines = []
-        for col, stats in data_summary.items():
-            if col not in column_names:
-                continue
-            parts = [f"  {col}: dtype={stats.get('dtype', '?')}"]
-            if "min" in stats and "max" in stats:
-                parts.append(f" range=[{stats['min']},{stats['max']}]")
-            if "nunique" in stats:
-                parts.append(f" nunique={stats['nunique']}")
-            if "sample_values" in stats:
-                parts.append(f" sample={stats['sample_values']}")
-            lines.append("".join(parts))
-        if lines:
-            data_summary_section = "Data summary (use to choose sensible axes/bins):\n" + "\n".join(lines) + "\n\n"
+    col_set = column_names if isinstance(column_names, (set, frozenset)) else set(column_names)
+    lines = []
+    for col, stats in data_summary.items():
+        if col not in col_set:
+            continue
+        parts = [f"  {col}: {dtype_label}{stats.get('dtype', '?')}"]
+        if "nunique" in stats:
+            parts.append(f" nunique={stats['nunique']}")
+        if include_range and "min" in stats and "max" in stats:
+            parts.append(f" range=[{stats['min']},{stats['max']}]")
+        if "sample_values" in stats:
+            parts.append(f" sample={stats['sample_values']}")
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def _format_distinct_values(
+    distinct_values: dict[str, list[str]],
+    column_names: list[str],
+    header: str,
+    cap: int = 20,
+) -> str:
+    """
+    Format distinct filter values under a header, one indented line per known column.
 
-    examples_section = """
-Examples (output only the JSON object, no markdown):
-Example 1 - bar of one metric by category:
-{"chart_type": "bar", "x_col": "name", "y_col": "wins", "title": "Wins by Team", "y_cols": null}
-Example 2 - multiple metrics as grouped bar:
-{"chart_type": "bar", "x_col": "name", "y_cols": ["hit", "so", "bb"], "title": "Hit, SO, BB by Player", "y_col": null}
-Example 3 - pie with multiple wedge values:
-{"chart_type": "pie", "x_col": "name", "y_cols": ["hit", "so", "bb"], "title": "Hit/SO/BB by Player"}
-"""
+    Each column lists at most cap values, with "..." appended when more were cut.
+    """
+    col_set = column_names if isinstance(column_names, (set, frozenset)) else set(column_names)
+    lines = [header]
+    for col, vals in distinct_values.items():
+        if col in col_set and vals:
+            lines.append(f"  {col}: {vals[:cap]}{'...' if len(vals) > cap else ''}")
+    return "\n".join(lines)
 
-    return f"""You are a chart config generator. Given a short plot description and the available columns, output a single JSON object. Use only the column names provided.
 
-{columns_section}
+@lru_cache(maxsize=32)
+def _chart_config_prompt_prefix(chart_types: tuple[str, ...], palettes: tuple[str, ...]) -> str:
+    """Instructions, allowed values, rules and examples; identical for every table."""
+    return f"""You are a chart config generator. Given a short plot description and the available columns (listed after these instructions), output a single JSON object. Use only the column names provided.
 
-{data_summary_section}Allowed chart_type values: {", ".join(chart_types)}
+Allowed chart_type values: {", ".join(chart_types)}
 Allowed palette values: {", ".join(palettes)}
 
 Required keys:
@@ -152,65 +340,192 @@ Rules:
 - For histogram use chart_type "histogram", x_col as the numeric column.
 - For line/scatter you need both x_col and y_col (or y_cols for multiple lines).
 - Output ONLY the JSON object, no markdown, no explanation, no code block wrapper.
-{examples_section}
-User description: "{description}"
+{_CHART_CONFIG_EXAMPLES}
+"""
 
-JSON:"""
 
+@lru_cache(maxsize=256)
+def _chart_config_columns_section(
+    column_names: tuple[str, ...],
+    column_dtypes: Optional[tuple[tuple[str, str], ...]],
+) -> str:
+    """Column list (with dtypes when known) for one table."""
+    if column_dtypes:
+        dtype_line = "\n".join(f"  - {k}: {v}" for k, v in column_dtypes)
+        return f"Column names and dtypes:\n{dtype_line}\nUse only these columns."
+    columns_line = ", ".join(f'"{c}"' for c in column_names)
+    return f"Column names (use only these): {columns_line}"
 
-def _extract_json_from_response(text: str) -> str:
-    """Strip markdown code blocks and return the first JSON object found."""
-    if not text or not text.strip():
-        raise ValueError("Empty LLM response")
-    text = text.strip()
-    # Remove optional ```json ... ``` or ``` ... ```
-    text = re.sub(r"^```\w*\s*\n?", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\n?\s*```\s*$", "", text)
-    text = text.strip()
-    # Find first { ... } block
-    start = text.find("{")
-    if start == -1:
-        raise ValueError("No JSON object found in response")
-    depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : i + 1]
-    raise ValueError("Unbalanced braces in JSON response")
 
+def chart_config_prompt_prefix(
+    chart_types: Optional[list[str]] = None,
+    palettes: Optional[list[str]] = None,
+) -> str:
+    """
+    Return the table-independent start of every build_chart_config_prompt() prompt.
 
-def parse_chart_config(
-    llm_response: str,
-    valid_columns: list[str],
-    valid_chart_types: Optional[list[str]] = None,
-    valid_palettes: Optional[list[str]] = None,
-) -> dict[str, Any]:
+    Provider prompt caches match on a byte-identical prefix; an LLM adapter can use
+    len() of this string to mark the cacheable part of the prompt.
     """
-    Parse and validate chart config from LLM response.
+    return _chart_config_prompt_prefix(tuple(chart_types or CHART_TYPES), tuple(palettes or PALETTES))
+
+
+def build_chart_config_prompt(
+    description: str,
+    column_names: list[str],
+    column_dtypes: Optional[dict[str, str]] = None,
+    data_summary: Optional[dict[str, dict[str, Any]]] = None,
+    chart_types: Optional[list[str]] = None,
+    palettes: Optional[list[str]] = None,
+) -> str:
+    """
+    Build a prompt that asks the LLM for a chart config JSON.
+
+    The prompt starts with chart_config_prompt_prefix() and ends with the
+    per-table columns, data summary and description, so provider-side prompt
+    caching can reuse the instructions across tables and descriptions.
 
     Args:
-        llm_response: Raw string from the LLM (may contain markdown).
-        valid_columns: Allowed column names (e.g. list(df.columns)).
-        valid_chart_types: Allowed chart_type values; defaults to CHART_TYPES.
-        valid_palettes: Allowed palette values; defaults to PALETTES.
+        description: User's natural-language plot description.
+        column_names: List of column names available in the DataFrame.
+        column_dtypes: Optional map of column name -> dtype string (e.g. "int64", "object").
+        data_summary: Optional per-column summary (min/max/nunique or sample_values) for data-aware prompts.
+        chart_types: Allowed chart_type values; defaults to CHART_TYPES.
+        palettes: Allowed palette values; defaults to PALETTES.
 
     Returns:
-        Options dict suitable for build_figure(df, options). May include
-        y_cols (list), chart_type_fallback_message (str) if fallback was applied,
-        and optional keys passed through (unsupported ones ignored by renderer).
+        Prompt string for the LLM.
+    """
+    prefix = chart_config_prompt_prefix(chart_types, palettes)
+    columns_section = _chart_config_columns_section(
+        tuple(column_names),
+        tuple(column_dtypes.items()) if column_dtypes else None,
+    )
+
+    data_summary_section = ""
+    if data_summary:
+        lines = _format_summary_lines(data_summary, column_names, dtype_label="dtype=")
+        if lines:
+            data_summary_section = "Data summary (use to choose sensible axes/bins):\n" + lines + "\n\n"
+
+    return f'{prefix}\n{columns_section}\n\n{data_summary_section}User description: "{description}"\n\nJSON:'
+
+
+def _strip_fence(text: str) -> str:
+    """Drop a leading ```lang fence and a trailing ``` from text; plain string checks, no regex."""
+    if text.startswith("```"):
+        i = 3
+        while i < len(text) and (text[i].isalnum() or text[i] == "_"):
+            i += 1
+        text = text[i:]
+    text = text.rstrip()
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def _decode_first(text: str, opener: str) -> Any:
+    """Decode the first JSON value starting at an `opener` ("{" or "[") in text.
+
+    Tries each opener position in turn, so prose such as "use {x} here" before
+    the real payload does not hide it. Raises ValueError if none decodes.
+    """
+    start = text.find(opener)
+    if start == -1:
+        raise ValueError("No JSON object found in response")
+    err: Optional[json.JSONDecodeError] = None
+    while start != -1:
+        try:
+            obj, _end = _DECODER.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError as e:
+            err = err or e
+        start = text.find(opener, start + 1)
+    raise ValueError(f"Invalid JSON from LLM: {err}")
+
+
+def _extract_json_from_response(text: str, opener: str = "{") -> Any:
+    """
+    Return the JSON value (object by default, array with opener="[") in an LLM response, parsed.
+
+    Fallback ladder, first success wins:
+      0. the whole response, when it is exactly one JSON value;
+      1. the last fenced ```json ... ``` block;
+      2. the response with a leading/trailing fence stripped, first decodable value;
+      3. either of those with // and /* */ comments removed.
     """
+    if not text or not text.strip():
+        raise ValueError("Empty LLM response")
+    text = text.strip()
+    # Fast path: a well-behaved model returns nothing but the JSON value.
+    if text[0] == opener:
+        try:
+            value = _loads(text)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(value, dict if opener == "{" else list):
+                return value
+    candidates = []
+    fenced = _FENCED_BLOCK.findall(text)
+    if fenced:
+        candidates.append(fenced[-1])
+    # Remove optional ```json ... ``` or ``` ... ```
+    stripped = _strip_fence(text)
+    candidates.append(stripped)
+    for candidate in candidates[:]:
+        uncommented = _JSON_COMMENT.sub(lambda m: m.group(1) or "", candidate)
+        if uncommented != candidate:
+            candidates.append(uncommented)
+
+    first_err: Optional[ValueError] = None
+    for candidate in candidates:
+        try:
+            return _decode_first(candidate, opener)
+        except ValueError as e:
+            first_err = first_err or e
+    raise first_err
+
+
+def _get_str(config: dict[str, Any], key: str, default: Any = None) -> Any:
+    """Return config[key] stripped if it is a non-blank string, else default."""
+    value = config.get(key)
+    if isinstance(value, str):
+        return value.strip() or default
+    return default
+
+
+def _get_col(
+    config: dict[str, Any],
+    key: str,
+    valid_col_set: Union[set[str], frozenset[str]],
+    valid_columns: Any,
+    check: bool = True,
+) -> Optional[str]:
+    """_get_str for a column key; raise ValueError if check and the name is not a valid column."""
+    name = _get_str(config, key)
+    if check and name and name not in valid_col_set:
+        raise ValueError(f"{key} must be one of {valid_columns}, got {name!r}")
+    return name
+
+
+def _validate_chart_config(
+    llm_response: str,
+    valid_columns: Union[list[str], frozenset[str]],
+    valid_chart_types: Optional[list[str]],
+    valid_palettes: Optional[list[str]],
+    valid_col_set: Optional[frozenset[str]],
+) -> dict[str, Any]:
+    """Uncached body of parse_chart_config: decode, validate and normalize one response."""
+    chart_type_set = frozenset(valid_chart_types) if valid_chart_types else _VALID_CHART_TYPES
     valid_chart_types = valid_chart_types or CHART_TYPES
-    valid_palettes = valid_palettes or PALETTES
-    valid_col_set = set(valid_columns)
+    palette_set = frozenset(valid_palettes) if valid_palettes else _VALID_PALETTES
+    if valid_col_set is None:
+        valid_col_set = (
+            valid_columns if isinstance(valid_columns, (set, frozenset)) else frozenset(valid_columns)
+        )
 
-    raw = _extract_json_from_response(llm_response)
-    try:
-        config = json.loads(raw)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON from LLM: {e}") from e
+    config = _extract_json_from_response(llm_response)
 
     if not isinstance(config, dict):
         raise ValueError("Config must be a JSON object")
@@ -220,61 +535,36 @@ def parse_chart_config(
     if isinstance(chart_type, str):
         chart_type = chart_type.lower().strip()
     chart_type_fallback_message: Optional[str] = None
-    if chart_type not in valid_chart_types:
-        if chart_type == "pie" and "bar" in valid_chart_types:
+    # isinstance first: a non-string (e.g. a JSON list) is unhashable for the set lookup
+    if not isinstance(chart_type, str) or chart_type not in chart_type_set:
+        if chart_type == "pie" and "bar" in chart_type_set:
             chart_type_fallback_message = "Pie not available; showing as bar."
             chart_type = "bar"
         else:
-            chart_type = "bar" if "bar" in valid_chart_types else valid_chart_types[0]
+            chart_type = "bar" if "bar" in chart_type_set else valid_chart_types[0]
             chart_type_fallback_message = f"Chart type not supported; using {chart_type}."
 
-    x_col = config.get("x_col")
-    if x_col is not None and isinstance(x_col, str):
-        x_col = x_col.strip() or None
-    if chart_type != "box" and x_col and x_col not in valid_col_set:
-        raise ValueError(f"x_col must be one of {valid_columns}, got {x_col!r}")
-
-    y_col = config.get("y_col")
-    if y_col is not None and isinstance(y_col, str):
-        y_col = y_col.strip() or None
-    if y_col and y_col not in valid_col_set:
-        raise ValueError(f"y_col must be one of {valid_columns}, got {y_col!r}")
+    x_col = _get_col(config, "x_col", valid_col_set, valid_columns, check=chart_type != "box")
+    y_col = _get_col(config, "y_col", valid_col_set, valid_columns)
 
     # y_cols: array of column names for multi-metric plots
     y_cols: Optional[list[str]] = None
-    if "y_cols" in config and config["y_cols"] is not None:
-        if isinstance(config["y_cols"], list):
-            y_cols = []
-            for v in config["y_cols"]:
-                if isinstance(v, str):
-                    v = v.strip()
-                    if v and v in valid_col_set:
-                        y_cols.append(v)
-            if not y_cols:
-                y_cols = None
-
-    series_col = config.get("series_col")
-    if series_col is not None and isinstance(series_col, str):
-        series_col = series_col.strip() or None
-    if series_col and series_col not in valid_col_set:
-        raise ValueError(f"series_col must be one of {valid_columns}, got {series_col!r}")
-
-    group_by = config.get("group_by")
-    if group_by is not None and isinstance(group_by, str):
-        group_by = group_by.strip() or None
-    if group_by and group_by not in valid_col_set:
-        raise ValueError(f"group_by must be one of {valid_columns}, got {group_by!r}")
-
-    palette = config.get("palette") or "default"
-    if isinstance(palette, str):
-        palette = palette.strip() or "default"
-    if palette not in valid_palettes:
+    raw_y_cols = config.get("y_cols")
+    if isinstance(raw_y_cols, list):
+        y_cols = [
+            name for v in raw_y_cols if isinstance(v, str)
+            for name in (v.strip(),) if name and name in valid_col_set
+        ] or None
+
+    series_col = _get_col(config, "series_col", valid_col_set, valid_columns)
+    group_by = _get_col(config, "group_by", valid_col_set, valid_columns)
+
+    palette = _get_str(config, "palette", "default")
+    if palette not in palette_set:
         palette = "default"
 
-    agg = (config.get("agg") or "mean")
-    if isinstance(agg, str):
-        agg = agg.lower().strip()
-    if agg not in ("sum", "mean", "count"):
+    agg = _get_str(config, "agg", "mean").lower()
+    if agg not in _VALID_AGGS:
         agg = "mean"
 
     options: dict[str, Any] = {
@@ -283,9 +573,9 @@ def parse_chart_config(
         "y_col": y_col,
         "y_cols": y_cols,
         "series_col": series_col,
-        "title": (config.get("title") or "").strip() if config.get("title") else "",
-        "x_label": (config.get("x_label") or "").strip() if config.get("x_label") else "",
-        "y_label": (config.get("y_label") or "").strip() if config.get("y_label") else "",
+        "title": _get_str(config, "title", ""),
+        "x_label": _get_str(config, "x_label", ""),
+        "y_label": _get_str(config, "y_label", ""),
         "palette": palette,
         "group_by": group_by,
         "agg": agg,
@@ -295,6 +585,178 @@ def parse_chart_config(
     return options
 
 
+def parse_chart_config(
+    llm_response: str,
+    valid_columns: Union[list[str], frozenset[str]],
+    valid_chart_types: Optional[list[str]] = None,
+    valid_palettes: Optional[list[str]] = None,
+    valid_col_set: Optional[frozenset[str]] = None,
+) -> dict[str, Any]:
+    """
+    Parse and validate chart config from LLM response.
+
+    Args:
+        llm_response: Raw string from the LLM (may contain markdown).
+        valid_columns: Allowed column names (e.g. list(df.columns)); a set or
+            frozenset is used as-is for membership checks.
+        valid_chart_types: Allowed chart_type values; defaults to CHART_TYPES.
+        valid_palettes: Allowed palette values; defaults to PALETTES.
+        valid_col_set: Optional frozenset(valid_columns) built once by a caller
+            that parses several responses against the same columns.
+
+    Returns:
+        Options dict suitable for build_figure(df, options). May include
+        y_cols (list), chart_type_fallback_message (str) if fallback was applied,
+        and optional keys passed through (unsupported ones ignored by renderer).
+        Repeated identical responses against the same columns are answered from
+        _PARSE_CACHE; the returned dict is always a fresh copy.
+    """
+    key = (
+        llm_response,
+        tuple(valid_columns),
+        tuple(valid_chart_types) if valid_chart_types else None,
+        tuple(valid_palettes) if valid_palettes else None,
+    )
+    options = _PARSE_CACHE.get(key)
+    if options is None:
+        options = _validate_chart_config(
+            llm_response, valid_columns, valid_chart_types, valid_palettes, valid_col_set
+        )
+        _PARSE_CACHE[key] = options
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        _PARSE_CACHE.move_to_end(key)
+    options = dict(options)
+    if options["y_cols"] is not None:
+        options["y_cols"] = list(options["y_cols"])
+    return options
+
+
+class _ObjectStreamScanner:
+    """
+    Incremental scanner for the first top-level JSON object in streamed LLM text.
+
+    Tracks brace depth outside strings, records top-level "key": "string" pairs as
+    they complete, and notes where the object closes. It does not validate JSON;
+    parse_chart_config does that on the finished text.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.end: Optional[int] = None  # index just past the closing brace
+        self.fields: dict[str, str] = {}
+        self._pos = 0
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+        self._str_start = 0
+        self._last_str: Optional[str] = None  # last complete top-level string
+        self._key: Optional[str] = None  # key awaiting its value
+
+    def feed(self, chunk: str) -> None:
+        """Append chunk and scan it; no-op once the object has closed."""
+        self.text += chunk
+        text = self.text
+        i = self._pos
+        n = len(text)
+        while i < n and self.end is None:
+            ch = text[i]
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+                    if self._depth == 1:
+                        self._string_done(text[self._str_start:i + 1])
+            elif ch == '"':
+                if self._depth:
+                    self._in_str = True
+                    self._str_start = i
+            elif ch == "{" or (ch == "[" and self._depth):
+                self._depth += 1
+                self._key = None if self._depth > 1 else self._key
+            elif ch == "}" or ch == "]":
+                if self._depth:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        self.end = i + 1
+            elif self._depth == 1:
+                if ch == ":":
+                    self._key, self._last_str = self._last_str, None
+                elif ch == ",":
+                    self._key = self._last_str = None
+            i += 1
+        self._pos = i
+
+    def _string_done(self, raw: str) -> None:
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = None
+        if self._key is not None and isinstance(value, str):
+            self.fields[self._key] = value.strip()
+            self._key = None
+        else:
+            self._last_str = value
+
+
+def parse_chart_config_stream(
+    chunks: Iterable[str],
+    valid_columns: Union[list[str], frozenset[str]],
+    valid_chart_types: Optional[list[str]] = None,
+    valid_palettes: Optional[list[str]] = None,
+    on_early_fields: Optional[Callable[[dict[str, str]], None]] = None,
+) -> dict[str, Any]:
+    """
+    parse_chart_config for a streamed LLM response (e.g. text deltas of a stream=True call).
+
+    Chunks are scanned as they arrive. Once chart_type and x_col (chart_type alone for
+    box) are complete, on_early_fields is called once with the top-level string fields
+    seen so far, so the caller can start DataFrame preflight (dtype checks, groupby prep)
+    while the rest of the reply streams in; these fields are raw and unvalidated. When
+    the first JSON object closes, the rest of the stream is not awaited (a generator is
+    closed) if that object parses; otherwise the whole stream is read and parsed as
+    parse_chart_config would.
+
+    Returns:
+        Options dict as from parse_chart_config.
+
+    Raises:
+        ValueError: If the response is empty or not a valid chart config.
+    """
+    scanner = _ObjectStreamScanner()
+    it = iter(chunks)
+    notified = on_early_fields is None
+    for chunk in it:
+        scanner.feed(chunk)
+        if not notified and "chart_type" in scanner.fields and (
+            "x_col" in scanner.fields or scanner.fields["chart_type"].lower() == "box"
+        ):
+            notified = True
+            on_early_fields(dict(scanner.fields))
+        if scanner.end is not None:
+            break
+    if scanner.end is not None:
+        try:
+            options = parse_chart_config(
+                scanner.text[:scanner.end], valid_columns, valid_chart_types, valid_palettes
+            )
+        except ValueError:
+            # Brace in prose or a comment, or a later fenced block: fall back to the full reply
+            text = scanner.text + "".join(it)
+        else:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+            return options
+    else:
+        text = scanner.text
+    return parse_chart_config(text, valid_columns, valid_chart_types, valid_palettes)
+
+
 def build_plot_code_prompt(
     description: str,
     column_names: list[str],
@@ -323,62 +785,48 @@ def build_plot_code_prompt(
         Prompt string for the LLM.
     """
     columns_line = ", ".join(f'"{c}"' for c in column_names)
-    sections = [
-        "You are a Python code generator for matplotlib plots.",
-        "Given a plot description and the available DataFrame columns, output ONLY Python code (no markdown, no explanation).",
-        "",
-        "Available columns: " + columns_line + ".",
-        "The code will run with a variable `df` (pandas DataFrame) already in scope.",
-        "Allowed: pandas (pd), numpy (np), matplotlib.pyplot (plt), io (BytesIO).",
-        "Do not use open(), file(), os, subprocess, or network.",
-        "",
-        "Requirements:",
-        "1. If the user specifies particular entities (e.g. player names, team names, or 'players: nick, james', 'teams A and B'), you MUST filter df first: keep only rows where the relevant column is in those values. Use only values from the 'Valid values for filtering' list below. Example: df = df[df['name'].astype(str).str.strip().isin(['nick', 'james'])] then plot the filtered df. If no specific entities are named, plot the full df.",
-        "2. Column mapping: when the user says 'players' or 'player names' use the column that holds player names (often 'name'); when they say 'teams' or 'team names' use the column that holds team names (often 'team' or 'name'). Use only column names from the available columns list.",
-        "3. Build a matplotlib figure from the (possibly filtered) df (e.g. bar, line, scatter, pie, histogram).",
-        "4. Save the figure to a buffer: buf = io.BytesIO(); plt.savefig(buf, format='png', bbox_inches='tight', dpi=150); buf.seek(0)",
-        "5. Set the result: plot_png_bytes = buf.getvalue()",
-        "6. Use only column names from the list above.",
-        "",
-        "User description: \"" + description + "\"",
-        "",
-        "Python code:",
-    ]
 
+    # Data-context blocks, each None when the input is absent; placed right after the column list
+    dtypes_block = None
     if column_dtypes:
-        sections.insert(4, "Column dtypes: " + ", ".join(f"{k}={v}" for k, v in column_dtypes.items()) + ".")
+        dtypes_block = "Column dtypes: " + ", ".join(f"{k}={v}" for k, v in column_dtypes.items()) + "."
+    summary_block = None
     if data_summary:
-        lines = []
-        for col, stats in data_summary.items():
-            if col not in column_names:
-                continue
-            parts = [f"  {col}: {stats.get('dtype', '?')}"]
-            if "nunique" in stats:
-                parts.append(f" nunique={stats['nunique']}")
-            if "sample_values" in stats:
-                parts.append(f" sample={stats['sample_values']}")
-            lines.append("".join(parts))
+        lines = _format_summary_lines(data_summary, column_names, include_range=False)
         if lines:
-            sections.insert(5, "Data summary:\n" + "\n".join(lines) + "\n")
-    if row_count is not None:
-        sections.insert(6, f"The DataFrame has {row_count} rows.")
+            summary_block = "Data summary:\n" + lines + "\n"
+    rowcount_block = f"The DataFrame has {row_count} rows." if row_count is not None else None
+    distinct_block = None
     if distinct_values:
-        lines = [
-            "Valid values for filtering (use only these). When the user names specific entities, filter df to rows where the column is in these values before plotting:"
-        ]
-        for col, vals in distinct_values.items():
-            if col in column_names and vals:
-                lines.append(f"  {col}: {vals[:20]}{'...' if len(vals) > 20 else ''}")
-        sections.insert(7, "\n".join(lines) + "\n")
+        distinct_block = _format_distinct_values(
+            distinct_values,
+            column_names,
+            "Valid values for filtering (use only these). When the user names specific entities, filter df to rows where the column is in these values before plotting:",
+        ) + "\n"
+    sample_block = None
     if data_sample:
         try:
-            sample_str = json.dumps(data_sample[:10], default=str)
-            if len(sample_str) < 1500:
-                sections.insert(8, "Sample rows (first few): " + sample_str + "\n")
+            sample_str = _bounded_dump(data_sample[:10], 1500)
+            if sample_str:
+                sample_block = "Sample rows (first few): " + sample_str + "\n"
         except Exception:
             pass
 
-    return "\n".join(sections)
+    sections = [
+        _PLOT_CODE_INTRO,
+        "Available columns: " + columns_line + ".",
+        dtypes_block,
+        summary_block,
+        rowcount_block,
+        distinct_block,
+        sample_block,
+        _PLOT_CODE_RULES,
+        "",
+        "User description: \"" + description + "\"",
+        "",
+        "Python code:",
+    ]
+    return "\n".join(x for x in sections if x is not None)
 
 
 def build_plot_prompt_generator_prompt(
@@ -408,33 +856,19 @@ def build_plot_prompt_generator_prompt(
     if row_count is not None:
         sections.append(f"Row count: {row_count}.")
     if data_summary:
-        lines = []
-        for col, stats in data_summary.items():
-            if col not in column_names:
-                continue
-            parts = [f"  {col}: {stats.get('dtype', '?')}"]
-            if "nunique" in stats:
-                parts.append(f" nunique={stats['nunique']}")
-            if "min" in stats and "max" in stats:
-                parts.append(f" range=[{stats['min']},{stats['max']}]")
-            if "sample_values" in stats:
-                parts.append(f" sample={stats['sample_values']}")
-            lines.append("".join(parts))
+        lines = _format_summary_lines(data_summary, column_names)
         if lines:
-            sections.append("Data summary:\n" + "\n".join(lines))
+            sections.append("Data summary:\n" + lines)
     if distinct_values:
-        sections.append("Valid values for filtering (use only these when user names entities):")
-        for col, vals in distinct_values.items():
-            if col in column_names and vals:
-                sections.append(f"  {col}: {vals[:20]}{'...' if len(vals) > 20 else ''}")
+        sections.append(_format_distinct_values(
+            distinct_values, column_names, "Valid values for filtering (use only these when user names entities):"
+        ))
     if data_sample:
         try:
-            sample_str = json.dumps(data_sample[:10], default=str)
-            if len(sample_str) < 2000:
+            sample_str = _bounded_dump(data_sample[:10], 2000)
+            if sample_str:
                 sections.append("Sample rows (first rows of the DataFrame):")
                 sections.append(sample_str)
-            else:
-                sections.append("Sample rows (truncated): " + sample_str[:1500] + "...")
         except Exception:
             pass
     sections.append("")
@@ -477,86 +911,79 @@ def build_plot_brainstorm_prompt(
     if row_count is not None:
         data_context.append(f"Row count: {row_count}.")
     if data_summary:
-        lines = []
-        for col, stats in data_summary.items():
-            if col not in column_names:
-                continue
-            parts = [f"  {col}: {stats.get('dtype', '?')}"]
-            if "nunique" in stats:
-                parts.append(f" nunique={stats['nunique']}")
-            if "min" in stats and "max" in stats:
-                parts.append(f" range=[{stats['min']},{stats['max']}]")
-            if "sample_values" in stats:
-                parts.append(f" sample={stats['sample_values']}")
-            lines.append("".join(parts))
+        lines = _format_summary_lines(data_summary, column_names)
         if lines:
-            data_context.append("Data summary:\n" + "\n".join(lines))
+            data_context.append("Data summary:\n" + lines)
     if distinct_values:
-        data_context.append("Valid values for filtering:")
-        for col, vals in distinct_values.items():
-            if col in column_names and vals:
-                data_context.append(f"  {col}: {vals[:15]}{'...' if len(vals) > 15 else ''}")
+        data_context.append(_format_distinct_values(
+            distinct_values, column_names, "Valid values for filtering:", cap=15
+        ))
     if data_sample:
         try:
-            sample_str = json.dumps(data_sample[:5], default=str)
-            if len(sample_str) < 1000:
+            sample_str = _bounded_dump(data_sample[:5], 1000)
+            if sample_str:
                 data_context.append("Sample rows: " + sample_str)
         except Exception:
             pass
     data_context.append("")
 
     # Chart-type diversity and data-driven rules
-    rules = [
-        "=== RULES ===",
-        "1. Propose exactly 3 ideas with DIFFERENT chart types. Do NOT propose three bar charts or the same type twice.",
-        "2. Vary chart types using the data context above:",
-        "   - Few categories + one numeric column -> bar or pie for one idea.",
-        "   - Many rows + numeric column -> line/trend or histogram for another idea.",
-        "   - Two numeric columns -> scatter. Many numeric columns -> heatmap or pairplot.",
-        "   - Categorical + numeric -> boxplot or violin (e.g. sns.boxplot, sns.violinplot) for another idea.",
-        "3. Use ONLY the column names listed above. Do not invent column names (e.g. no HR, RBI, RUNS unless they appear in Available columns).",
-        "4. Each idea: (a) label, (b) chart_type (e.g. bar, line, scatter, pie, seaborn_violin, seaborn_heatmap), (c) approach (one line: what to plot and how).",
-        "",
-        "Output format (JSON array):",
-        '[{"label": "...", "chart_type": "...", "approach": "..."}, {"label": "...", "chart_type": "...", "approach": "..."}, {"label": "...", "chart_type": "...", "approach": "..."}]',
-        "",
-        "User description: \"" + description + "\"",
-    ]
+    rules = list(_BRAINSTORM_RULES)
     if chart_type_suggestion and chart_type_suggestion.strip():
-        rules.insert(-1, f"User suggested chart type (hint only; still propose 3 varied types): {chart_type_suggestion.strip()}.")
-        rules.insert(-1, "")
+        rules.append(f"User suggested chart type (hint only; still propose 3 varied types): {chart_type_suggestion.strip()}.")
+        rules.append("")
+    rules.append("User description: \"" + description + "\"")
     sections = data_context + rules
     sections.append("")
     sections.append("JSON array of 3 ideas (different chart_type values):")
     return "\n".join(sections)
 
 
+def _ideas_from_object(obj: Any) -> Optional[list[Any]]:
+    """Ideas in a decoded object: its list of dicts if it wraps one ({"ideas": [...]}), else [obj]."""
+    if not isinstance(obj, dict):
+        return None
+    for value in obj.values():
+        if isinstance(value, list) and any(isinstance(v, dict) for v in value):
+            return value
+    return [obj]
+
+
 def parse_brainstorm_ideas(llm_response: str) -> list[dict[str, Any]]:
     """
     Parse LLM response into a list of idea dicts with label, chart_type, approach.
     Returns at most 3 ideas; empty list on parse failure.
+
+    A reply that is a single object (after any fence) is decoded as an object first,
+    so an array field inside it is not mistaken for the idea list:
+
+    >>> parse_brainstorm_ideas('{"label": "Hits by team", "chart_type": "bar", '
+    ...                        '"approach": "group by team", "columns": ["team", "hits"]}')
+    [{'label': 'Hits by team', 'chart_type': 'bar', 'approach': 'group by team'}]
     """
     if not llm_response or not llm_response.strip():
         return []
-    text = llm_response.strip()
-    # Strip markdown code block if present
-    if "```" in text:
-        start = text.find("[")
-        end = text.rfind("]") + 1
-        if start >= 0 and end > start:
-            text = text[start:end]
-        else:
-            for line in text.split("\n"):
-                line = line.strip()
-                if line.startswith("["):
-                    end = line.rfind("]") + 1
-                    if end > 0:
-                        text = line[:end]
-                    break
+    # Same fence/comment fallback ladder as chart configs; a lone object counts as one idea
+    raw = None
+    if _strip_fence(llm_response.strip()).lstrip().startswith("{"):
+        try:
+            raw = _ideas_from_object(_extract_json_from_response(llm_response, "{"))
+        except ValueError:
+            pass
+    if raw is None:
+        try:
+            raw = _extract_json_from_response(llm_response, "[")
+        except ValueError:
+            raw = None
+        # A list without dicts is an array field of some object (or prose), not the ideas
+        if not isinstance(raw, list) or not any(isinstance(item, dict) for item in raw):
+            try:
+                raw = _ideas_from_object(_extract_json_from_response(llm_response, "{"))
+            except ValueError:
+                return []
+            if raw is None:
+                return []
     try:
-        raw = json.loads(text)
-        if not isinstance(raw, list):
-            raw = [raw] if isinstance(raw, dict) else []
         ideas = []
         for item in raw[:3]:
             if isinstance(item, dict):
@@ -566,7 +993,7 @@ def parse_brainstorm_ideas(llm_response: str) -> list[dict[str, Any]]:
                     "approach": str(item.get("approach", "")).strip() or "",
                 })
         return ideas
-    except (json.JSONDecodeError, TypeError):
+    except TypeError:
         return []
 
 
@@ -612,17 +1039,9 @@ def parse_selected_idea(llm_response: str, ideas: list[dict[str, Any]]) -> Optio
     """
     if not llm_response or not ideas:
         return ideas[0] if ideas else None
-    text = llm_response.strip()
-    # Extract leading number
-    for i, c in enumerate(text):
-        if c in "123":
-            num = int(c)
-            if 1 <= num <= len(ideas):
-                return ideas[num - 1]
-            return ideas[0] if ideas else None
-        if c.isalpha() or c in ".:":
-            break
-    return ideas[0] if ideas else None
+    m = _SELECT_RE.match(llm_response)
+    num = int(m.group(1)) if m else 0
+    return ideas[num - 1] if 1 <= num <= len(ideas) else ideas[0]
 
 
 def build_plot_code_prompt_from_idea(
@@ -644,61 +1063,46 @@ def build_plot_code_prompt_from_idea(
     approach = selected_idea.get("approach", "")
     columns_line = ", ".join(f'"{c}"' for c in column_names)
     idea_line = f"Selected chart: {label} (type: {chart_type}). Approach: {approach}."
+
+    # Data-context blocks, each None when the input is absent; placed right after the column list
+    dtypes_block = None
+    if column_dtypes:
+        dtypes_block = "Column dtypes: " + ", ".join(f"{k}={v}" for k, v in column_dtypes.items()) + "."
+    summary_block = None
+    if data_summary:
+        lines = _format_summary_lines(data_summary, column_names, include_range=False)
+        if lines:
+            summary_block = "Data summary:\n" + lines + "\n"
+    rowcount_block = f"The DataFrame has {row_count} rows." if row_count is not None else None
+    distinct_block = None
+    if distinct_values:
+        distinct_block = _format_distinct_values(distinct_values, column_names, "Valid values for filtering (use only these when user names entities):") + "\n"
+    sample_block = None
+    if data_sample:
+        try:
+            sample_str = _bounded_dump(data_sample[:10], 1500)
+            if sample_str:
+                sample_block = "Sample rows: " + sample_str + "\n"
+        except Exception:
+            pass
+
     sections = [
-        "You are a Python code generator for plots. Implement EXACTLY the selected chart below using matplotlib (plt) or seaborn (sns).",
-        "CRITICAL: You MUST implement the selected chart_type and approach. Do NOT substitute a generic bar chart. If the selected type is line, scatter, violin, heatmap, pie, etc., use that exact visualization.",
-        "",
+        _IDEA_CODE_INTRO,
         idea_line,
         "",
         "Available columns: " + columns_line + ".",
-        "Use ONLY these column names. Do not use column names not in this list.",
-        "The code runs with `df` (pandas DataFrame) in scope. Allowed: pd, np, plt, sns (seaborn), io.",
-        "Do not use open(), file(), os, subprocess, or network.",
-        "",
-        "Requirements:",
-        "1. If the user specifies particular entities (e.g. player names, 'players: nick, james'), filter df first to those rows using the 'Valid values for filtering' list below, then plot the filtered df.",
-        "2. Use only column names from the Available columns list.",
-        "3. Implement the chart_type above: use plt or sns accordingly (e.g. line -> plt.plot or sns.lineplot; violin -> sns.violinplot; heatmap -> sns.heatmap; pie -> plt.pie; scatter -> plt.scatter or sns.scatterplot).",
-        "4. Save the figure to a buffer: buf = io.BytesIO(); plt.savefig(buf, format='png', bbox_inches='tight', dpi=150); buf.seek(0); plot_png_bytes = buf.getvalue()",
-        "5. If using seaborn, get the figure with plt.gcf() after the seaborn call, then plt.savefig(...) to the buffer. End with plot_png_bytes = buf.getvalue().",
+        dtypes_block,
+        summary_block,
+        rowcount_block,
+        distinct_block,
+        sample_block,
+        _IDEA_CODE_RULES,
         "",
         "User description: \"" + description + "\"",
         "",
         "Python code:",
     ]
-    if column_dtypes:
-        sections.insert(6, "Column dtypes: " + ", ".join(f"{k}={v}" for k, v in column_dtypes.items()) + ".")
-    if data_summary:
-        lines = []
-        for col, stats in data_summary.items():
-            if col not in column_names:
-                continue
-            parts = [f"  {col}: {stats.get('dtype', '?')}"]
-            if "nunique" in stats:
-                parts.append(f" nunique={stats['nunique']}")
-            if "sample_values" in stats:
-                parts.append(f" sample={stats['sample_values']}")
-            lines.append("".join(parts))
-        if lines:
-            sections.insert(7, "Data summary:\n" + "\n".join(lines) + "\n")
-    if row_count is not None:
-        sections.insert(8, f"The DataFrame has {row_count} rows.")
-    if distinct_values:
-        lines = [
-            "Valid values for filtering (use only these when user names entities):"
-        ]
-        for col, vals in distinct_values.items():
-            if col in column_names and vals:
-                lines.append(f"  {col}: {vals[:20]}{'...' if len(vals) > 20 else ''}")
-        sections.insert(9, "\n".join(lines) + "\n")
-    if data_sample:
-        try:
-            sample_str = json.dumps(data_sample[:10], default=str)
-            if len(sample_str) < 1500:
-                sections.insert(10, "Sample rows: " + sample_str + "\n")
-        except Exception:
-            pass
-    return "\n".join(sections)
+    return "\n".join(x for x in sections if x is not None)
 
 
 def extract_plot_code(llm_response: str) -> str:
@@ -724,18 +1128,255 @@ def extract_plot_code(llm_response: str) -> str:
     return text.strip()
 
 
+class _SemanticConfigCache:
+    """
+    Parsed options of past descriptions for one schema, matched by embedding similarity.
+
+    Embeddings are stored unit-normalized as rows of one matrix, so a lookup is a
+    single matrix-vector product. Each row also keeps the set of column names its
+    description mentions; a hit requires the same set, so "wins by team" never
+    answers "losses by team" however close the embeddings are. Oldest entries are
+    dropped past max_entries.
+    """
+
+    def __init__(self, threshold: float = _SEMANTIC_THRESHOLD, max_entries: int = _CONFIG_CACHE_MAX):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._options: list[dict[str, Any]] = []
+        self._mentions: list[frozenset[str]] = []
+
+    @staticmethod
+    def normalize(embedding: Any) -> Optional[np.ndarray]:
+        """Embedding as a unit float32 vector, or None if it is empty or all zeros."""
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec)) if vec.size else 0.0
+        return vec / norm if norm else None
+
+    def lookup(self, vec: np.ndarray, mentions: frozenset[str]) -> Optional[dict[str, Any]]:
+        """
+        Options of the most similar stored description that mentions exactly the same
+        columns, if its similarity is at or above threshold; else None.
+        """
+        if self._vectors is None or self._vectors.shape[1] != vec.shape[0]:
+            return None
+        same = np.fromiter((m == mentions for m in self._mentions), dtype=bool, count=len(self._mentions))
+        if not same.any():
+            return None
+        sims = np.where(same, self._vectors @ vec, -np.inf)
+        best = int(sims.argmax())
+        return self._options[best] if sims[best] >= self.threshold else None
+
+    def add(self, vec: np.ndarray, options: dict[str, Any], mentions: frozenset[str]) -> None:
+        if self._vectors is None or self._vectors.shape[1] != vec.shape[0]:
+            self._vectors = vec[np.newaxis, :]
+            self._options = [options]
+            self._mentions = [mentions]
+            return
+        keep = max(0, len(self._options) + 1 - self.max_entries)
+        self._vectors = np.vstack((self._vectors[keep:], vec))
+        self._options = self._options[keep:] + [options]
+        self._mentions = self._mentions[keep:] + [mentions]
+
+
+# One semantic cache per (columns, dtypes) schema, so similar wording never crosses schemas;
+# most recently used schema last, oldest evicted past _SEMANTIC_CACHES_MAX
+_SEMANTIC_CACHES: OrderedDict[tuple, _SemanticConfigCache] = OrderedDict()
+_SEMANTIC_CACHES_MAX = 16
+
+
+# Description templates learned from past LLM answers: pattern string -> _DescriptionTemplate.
+# A template stands for "same wording, different columns" and lets nl_to_plot_options build
+# options for a new column set without calling the LLM.
+_TEMPLATE_CACHE: OrderedDict[str, "_DescriptionTemplate"] = OrderedDict()
+_TEMPLATE_CACHE_MAX = 128
+_TEMPLATE_STATS = {"hits": 0, "misses": 0}
+_TEMPLATE_COLUMN_FIELDS = ("x_col", "y_col", "series_col", "group_by")
+_TEMPLATE_TEXT_FIELDS = ("title", "x_label", "y_label")
+
+
+def _is_numeric_dtype_str(dtype: str) -> bool:
+    return "int" in dtype or "float" in dtype or "number" in dtype
+
+
+def _column_mention_re(names: Any) -> Optional[re.Pattern]:
+    """Case-insensitive whole-word match for any of names, longest first; None if names is empty."""
+    alternatives = sorted({str(n).lower() for n in names if str(n)}, key=len, reverse=True)
+    if not alternatives:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, alternatives)) + r")(?!\w)", re.IGNORECASE)
+
+
+class _DescriptionTemplate:
+    """
+    A normalized description with its column mentions replaced by capture groups,
+    plus where each mentioned column went in the parsed options.
+    """
+
+    def __init__(
+        self,
+        pattern: re.Pattern,
+        columns: list[str],
+        numeric: list[Optional[bool]],
+        options: dict[str, Any],
+    ):
+        self.pattern = pattern
+        self.columns = columns  # original column per capture group
+        self.numeric = numeric  # original column numeric-ness per group (None if unknown)
+        self.options = options
+
+    @classmethod
+    def induce(
+        cls,
+        description: str,
+        options: dict[str, Any],
+        column_names: list[str],
+        column_dtypes: Optional[dict[str, str]],
+    ) -> Optional["_DescriptionTemplate"]:
+        """
+        Build a template from an answered description, or None if any column in the
+        options is not named in the description (it could not be substituted).
+        """
+        mention = _column_mention_re(column_names)
+        if mention is None:
+            return None
+        by_lower = {str(c).lower(): c for c in column_names}
+        parts: list[str] = []
+        order: list[str] = []
+        pos = 0
+        for m in mention.finditer(description):
+            parts.append(re.escape(description[pos:m.start()]))
+            name = m.group(0).lower()
+            if name in order:
+                parts.append(f"(?P=c{order.index(name)})")
+            else:
+                parts.append(f"(?P<c{len(order)}>.+?)")
+                order.append(name)
+            pos = m.end()
+        parts.append(re.escape(description[pos:]))
+        if not order:
+            return None
+        used = [options.get(f) for f in _TEMPLATE_COLUMN_FIELDS] + list(options.get("y_cols") or [])
+        if any(c is not None and str(c).lower() not in order for c in used):
+            return None
+        columns = [by_lower[name] for name in order]
+        numeric = [
+            _is_numeric_dtype_str(column_dtypes.get(str(c), "")) if column_dtypes else None
+            for c in columns
+        ]
+        return cls(re.compile("".join(parts)), columns, numeric, options)
+
+    def synthesize(
+        self,
+        description: str,
+        column_names: list[str],
+        column_dtypes: Optional[dict[str, str]],
+    ) -> Optional[dict[str, Any]]:
+        """Options for description on a new column set, or None if it does not fit this template."""
+        m = self.pattern.fullmatch(description)
+        if m is None:
+            return None
+        by_lower = {str(c).lower(): c for c in column_names}
+        renamed: dict[str, str] = {}
+        for i, old in enumerate(self.columns):
+            new = by_lower.get(m.group(f"c{i}").lower())
+            if new is None:
+                return None
+            if column_dtypes and self.numeric[i] is not None:
+                if _is_numeric_dtype_str(column_dtypes.get(str(new), "")) != self.numeric[i]:
+                    return None
+            renamed[str(old).lower()] = new
+
+        options = copy.deepcopy(self.options)
+        for field in _TEMPLATE_COLUMN_FIELDS:
+            if options.get(field) is not None:
+                options[field] = renamed[str(options[field]).lower()]
+        if options.get("y_cols"):
+            options["y_cols"] = [renamed[str(c).lower()] for c in options["y_cols"]]
+        mention = _column_mention_re(self.columns)
+
+        def _rename(t: re.Match) -> str:
+            new = str(renamed[t.group(0).lower()])
+            # Keep "Wins by Team" title-cased when it becomes "Losses by Team"
+            return new[:1].upper() + new[1:] if t.group(0)[:1].isupper() else new
+
+        for field in _TEMPLATE_TEXT_FIELDS:
+            if options.get(field):
+                options[field] = mention.sub(_rename, options[field])
+        return options
+
+
+def _template_lookup(
+    description: str,
+    column_names: list[str],
+    column_dtypes: Optional[dict[str, str]],
+) -> Optional[dict[str, Any]]:
+    for key, template in reversed(_TEMPLATE_CACHE.items()):
+        options = template.synthesize(description, column_names, column_dtypes)
+        if options is not None:
+            _TEMPLATE_CACHE.move_to_end(key)
+            _TEMPLATE_STATS["hits"] += 1
+            return options
+    _TEMPLATE_STATS["misses"] += 1
+    return None
+
+
+def _template_store(
+    description: str,
+    options: dict[str, Any],
+    column_names: list[str],
+    column_dtypes: Optional[dict[str, str]],
+) -> None:
+    template = _DescriptionTemplate.induce(description, options, column_names, column_dtypes)
+    if template is None:
+        return
+    _TEMPLATE_CACHE[template.pattern.pattern] = template
+    _TEMPLATE_CACHE.move_to_end(template.pattern.pattern)
+    while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_MAX:
+        _TEMPLATE_CACHE.popitem(last=False)
+
+
+def template_cache_stats() -> dict[str, Any]:
+    """
+    Report how often nl_to_plot_options answered from a learned description template.
+
+    Returns:
+        Dict with hits, misses, hit_rate (hits / lookups, 0.0 before any lookup)
+        and size (templates currently held).
+    """
+    hits = _TEMPLATE_STATS["hits"]
+    lookups = hits + _TEMPLATE_STATS["misses"]
+    return {
+        "hits": hits,
+        "misses": _TEMPLATE_STATS["misses"],
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "size": len(_TEMPLATE_CACHE),
+    }
+
+
 def get_heuristic_config(
     column_names: list[str],
     column_dtypes: Optional[dict[str, str]] = None,
+    numeric_columns: Optional[set[str]] = None,
 ) -> dict[str, Any]:
     """
     Return a minimal valid chart config when LLM parsing fails (first categorical as x_col, first numeric as y_col).
+
+    numeric_columns, when given (e.g. set(df.select_dtypes(include="number").columns)),
+    decides which columns are numeric instead of scanning the column_dtypes strings.
     """
+    if numeric_columns is not None:
+        is_numeric = numeric_columns.__contains__
+    else:
+        dtypes = column_dtypes or {}
+
+        def is_numeric(c: Any) -> bool:
+            return _is_numeric_dtype_str(dtypes.get(str(c), ""))
+
     x_col = None
     y_col = None
     for c in column_names:
-        dtype = (column_dtypes or {}).get(str(c), "")
-        if "int" in dtype or "float" in dtype or "number" in dtype:
+        if is_numeric(c):
             if y_col is None:
                 y_col = c
         else:
@@ -761,23 +1402,43 @@ def get_heuristic_config(
     }
 
 
+# Computes the data summary while nl_to_plot_options waits on the embed callback
+# (threads start on first use)
+_SUMMARY_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nl-plot-summary")
+
+
 def nl_to_plot_options(
     description: str,
     df: Any,
     llm_callback: Callable[[str], str],
     data_summary: Optional[dict[str, dict[str, Any]]] = None,
+    bypass_cache: bool = False,
+    embed: Optional[Callable[[str], Any]] = None,
 ) -> dict[str, Any]:
     """
     Run the NL → chart config pipeline: prompt, LLM call, parse, validate.
 
+    Results are cached per (description, column names, dtypes), so repeating a
+    description against the same schema skips the summary, the LLM call and the parse.
+    A description that differs from an answered one only in the column names it
+    mentions (e.g. "bar chart of wins by team" -> "bar chart of losses by team") is
+    answered from a learned template when the new columns exist with the same
+    numeric/non-numeric dtypes.
+
     Args:
         description: Natural-language plot description.
         df: DataFrame with the data (must have .columns and optionally .dtypes).
         llm_callback: Function that takes the prompt string and returns the raw LLM response.
-        data_summary: Optional per-column summary; if None, computed from df via compute_data_summary.
+        data_summary: Optional per-column summary; if None, computed from df via compute_data_summary
+            (on a worker thread, overlapping the embed call, when embed is given).
+        bypass_cache: If True, always call the LLM (the fresh result still replaces the cached one).
+        embed: Optional function returning an embedding vector for a description. When given,
+            a description whose embedding has cosine similarity >= 0.92 to an earlier one on
+            the same schema, and that names the same columns, reuses that result. None
+            (default) disables the semantic cache.
 
     Returns:
-        Options dict for build_figure(df, options).
+        Options dict for build_figure(df, options); a copy the caller may modify.
 
     Raises:
         ValueError: If df is empty, has no columns, or LLM response is invalid.
@@ -796,7 +1457,49 @@ def nl_to_plot_options(
     except Exception:
         pass
 
-    if data_summary is None and hasattr(df, "select_dtypes"):
+    schema_key = (
+        tuple(column_names),
+        tuple(sorted(column_dtypes.items())) if column_dtypes else None,
+    )
+    normalized = " ".join(description.split()).lower()
+    cache_key = (normalized,) + schema_key
+    if not bypass_cache:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            _CONFIG_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+    summary_future = None
+    semantic_vec = None
+    mentions: frozenset[str] = frozenset()
+    if embed is not None:
+        if data_summary is None and hasattr(df, "select_dtypes"):
+            summary_future = _SUMMARY_EXECUTOR.submit(compute_data_summary, df)
+        semantic_vec = _SemanticConfigCache.normalize(embed(description))
+        mention = _column_mention_re(column_names)
+        if mention is not None:
+            mentions = frozenset(m.group(0).lower() for m in mention.finditer(normalized))
+    if semantic_vec is not None and not bypass_cache:
+        semantic = _SEMANTIC_CACHES.get(schema_key)
+        cached = None
+        if semantic is not None:
+            _SEMANTIC_CACHES.move_to_end(schema_key)
+            cached = semantic.lookup(semantic_vec, mentions)
+        if cached is not None:
+            if summary_future is not None:
+                summary_future.cancel()
+            return copy.deepcopy(cached)
+
+    if not bypass_cache:
+        synthesized = _template_lookup(normalized, column_names, column_dtypes)
+        if synthesized is not None:
+            if summary_future is not None:
+                summary_future.cancel()
+            return synthesized
+
+    if summary_future is not None:
+        data_summary = summary_future.result()
+    elif data_summary is None and hasattr(df, "select_dtypes"):
         data_summary = compute_data_summary(df)
 
     prompt = build_chart_config_prompt(
@@ -804,4 +1507,19 @@ def nl_to_plot_options(
         data_summary=data_summary,
     )
     response = llm_callback(prompt)
-    return parse_chart_config(response, column_names)
+    options = parse_chart_config(response, column_names)
+    _CONFIG_CACHE[cache_key] = options
+    _CONFIG_CACHE.move_to_end(cache_key)
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+    if semantic_vec is not None:
+        semantic = _SEMANTIC_CACHES.get(schema_key)
+        if semantic is None:
+            semantic = _SEMANTIC_CACHES[schema_key] = _SemanticConfigCache()
+            while len(_SEMANTIC_CACHES) > _SEMANTIC_CACHES_MAX:
+                _SEMANTIC_CACHES.popitem(last=False)
+        else:
+            _SEMANTIC_CACHES.move_to_end(schema_key)
+        semantic.add(semantic_vec, options, mentions)
+    _template_store(normalized, options, column_names, column_dtypes)
+    return copy.deepcopy(options)
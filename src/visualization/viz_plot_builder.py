@@ -6,21 +6,89 @@ Used by the NL Query Dialog visualization flow (Approach 1: Python/pandas + plot
 from __future__ import annotations
 
 import logging
+import threading
+from functools import lru_cache
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use("QtAgg")
 import matplotlib.pyplot as plt
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure
 import seaborn as sns
 
 logger = logging.getLogger(__name__)
 
+# Fixed viridis fills for the count-bar fallback and histograms
+_BAR_COLOR = plt.cm.viridis(0.4)
+_HIST_COLOR = plt.cm.viridis(0.5)
+_HIST_MAX_BINS = 100
 
-def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
+
+# Released figures kept for reuse by build_figure; per thread because Qt canvases are
+# bound to the thread that created them
+_figure_pool = threading.local()
+_FIGURE_POOL_MAX = 4
+_FIGSIZE = (10, 6)
+
+
+def _acquire_figure() -> Figure:
+    """A cleared pooled Figure if one was released on this thread, else a new one."""
+    pool = getattr(_figure_pool, "figures", None)
+    if pool:
+        fig = pool.pop()
+        fig.clear()
+        fig.set_size_inches(*_FIGSIZE)
+        return fig
+    # Not a pyplot figure: its lifetime follows the caller (canvas or pool), not pyplot's registry
+    return Figure(figsize=_FIGSIZE)
+
+
+def release_figure(fig: Optional[Figure]) -> None:
+    """
+    Hand a figure from build_figure back for reuse once it is no longer displayed.
+
+    The figure is cleared and detached from its (possibly deleted) GUI canvas; it must
+    not be used by the caller afterwards.
+    """
+    if fig is None:
+        return
+    pool = getattr(_figure_pool, "figures", None)
+    if pool is None:
+        pool = _figure_pool.figures = []
+    fig.clear()
+    FigureCanvasBase(fig)
+    if len(pool) < _FIGURE_POOL_MAX and fig not in pool:
+        pool.append(fig)
+
+
+@lru_cache(maxsize=64)
+def _viridis_colors(n: int) -> tuple[tuple[float, float, float, float], ...]:
+    """n evenly spaced viridis colors (i / n for i in range(n)), as used for pie wedges."""
+    return tuple(map(tuple, plt.cm.viridis([i / max(1, n) for i in range(n)])))
+
+
+def _series_groups(series: pd.Series):
+    """
+    Yield (value, row positions) per distinct non-null value of series, in first-appearance
+    order (as groupby(sort=False, dropna=True)). One factorize and one stable argsort
+    instead of building a sub-DataFrame per group.
+    """
+    codes, uniques = pd.factorize(series)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    for i, val in enumerate(uniques):
+        yield val, order[bounds[i]:bounds[i + 1]]
+
+
+def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> Figure:
     """
     Build a matplotlib Figure from a DataFrame and options dict.
 
+    The figure may be a reused one; pass it to release_figure() when done showing it.
+
     Options expected:
         chart_type: str - one of "bar", "line", "scatter", "histogram", "box", "pie"
         x_col: str - column name for X axis (or single numeric for histogram)
@@ -56,23 +124,29 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
 
     # Optional aggregation
     plot_df = df
+    aggregated = False  # True once plot_df holds one row per group_by value
     if group_by and group_by in df.columns and y_col and y_col in df.columns:
         try:
+            # observed=True: a categorical group_by yields only the categories present
+            # instead of a row for every declared category
+            grouped = df.groupby(group_by, dropna=False, observed=True)[y_col]
             if agg == "sum":
-                plot_df = df.groupby(group_by, dropna=False)[y_col].sum().reset_index()
+                plot_df = grouped.sum().reset_index()
             elif agg == "count":
-                plot_df = df.groupby(group_by, dropna=False)[y_col].count().reset_index()
+                plot_df = grouped.count().reset_index()
             else:
-                plot_df = df.groupby(group_by, dropna=False)[y_col].mean().reset_index()
+                plot_df = grouped.mean().reset_index()
             # Use group_by as X when we aggregated
             x_col = group_by
+            aggregated = True
         except Exception as e:
             logger.warning(f"Aggregation failed, using raw data: {e}")
 
     # Numeric columns for type checks
     numeric_cols = list(plot_df.select_dtypes(include=["number"]).columns)
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _acquire_figure()
+    ax = fig.add_subplot(111)
     fig.patch.set_facecolor("white")
     ax.set_facecolor("white")
 
@@ -87,28 +161,35 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
         if y_cols and all(c in plot_df.columns for c in y_cols):
             # Grouped bar: multiple metrics per x
             x_vals = plot_df[x_col].astype(str).tolist()
-            x_pos = list(range(len(x_vals)))
+            x_pos = np.arange(len(x_vals))
             n_series = len(y_cols)
             width = 0.8 / max(1, n_series)
+            offsets = (np.arange(n_series) - 0.5 * (n_series - 1)) * width
             for i, col in enumerate(y_cols):
-                bars_x = [p + (i - 0.5 * (n_series - 1)) * width for p in x_pos]
-                vals = plot_df[col].values
-                ax.bar(bars_x, vals, width=width * 0.95, label=col)
+                ax.bar(x_pos + offsets[i], plot_df[col].to_numpy(), width=width * 0.95, label=col)
             ax.set_xticks(x_pos)
             ax.set_xticklabels(x_vals, rotation=45, ha="right")
             ax.legend()
         elif not y_col or y_col not in plot_df.columns:
             # Count by x_col
             counts = plot_df[x_col].value_counts().sort_index()
-            x_vals = counts.index.tolist()
-            y_vals = counts.values.tolist()
-            ax.bar(range(len(x_vals)), y_vals, color=plt.cm.viridis(0.4), edgecolor="gray", linewidth=0.5)
-            ax.set_xticks(range(len(x_vals)))
-            ax.set_xticklabels([str(v) for v in x_vals], rotation=45, ha="right")
+            x_pos = np.arange(len(counts))
+            ax.bar(x_pos, counts.to_numpy(), color=_BAR_COLOR, edgecolor="gray", linewidth=0.5)
+            ax.set_xticks(x_pos)
+            ax.set_xticklabels(list(map(str, counts.index)), rotation=45, ha="right")
         elif series_col and series_col in plot_df.columns:
-            sns.barplot(data=plot_df, x=x_col, y=y_col, hue=series_col, ax=ax, palette=palette)
+            sns.barplot(data=plot_df, x=x_col, y=y_col, hue=series_col, ax=ax, palette=palette, errorbar=None)
+        elif aggregated:
+            # One row per bar already: no estimator or error bars needed, so skip seaborn.
+            # groupby(dropna=False) keeps a missing-key row; seaborn dropped it, so do the same
+            bars = plot_df[plot_df[x_col].notna()]
+            x_pos = np.arange(len(bars))
+            colors = sns.color_palette(palette, len(bars)) if palette else None
+            ax.bar(x_pos, bars[y_col].to_numpy(), color=colors)
+            ax.set_xticks(x_pos)
+            ax.set_xticklabels(list(map(str, bars[x_col])))
         else:
-            sns.barplot(data=plot_df, x=x_col, y=y_col, ax=ax, palette=palette)
+            sns.barplot(data=plot_df, x=x_col, y=y_col, ax=ax, palette=palette, errorbar=None)
         ax.tick_params(axis="x", rotation=45)
         plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
 
@@ -116,9 +197,10 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
         if not y_col or y_col not in plot_df.columns:
             raise ValueError("y_col is required for line chart")
         if series_col and series_col in plot_df.columns:
-            for val in plot_df[series_col].dropna().unique():
-                sub = plot_df[plot_df[series_col] == val]
-                ax.plot(sub[x_col].astype(str), sub[y_col], marker="o", label=str(val), markersize=4)
+            x_arr = plot_df[x_col].astype(str).to_numpy()
+            y_arr = plot_df[y_col].to_numpy()
+            for val, idx in _series_groups(plot_df[series_col]):
+                ax.plot(x_arr[idx], y_arr[idx], marker="o", label=str(val), markersize=4)
             ax.legend()
         else:
             plot_df = plot_df.sort_values(x_col)
@@ -131,18 +213,23 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
             raise ValueError("y_col is required for scatter chart")
         x_series = plot_df[x_col]
         y_series = plot_df[y_col]
-        if pd.api.types.is_numeric_dtype(x_series) and pd.api.types.is_numeric_dtype(y_series):
+        x_is_num = pd.api.types.is_numeric_dtype(x_series)
+        y_is_num = pd.api.types.is_numeric_dtype(y_series)
+        if x_is_num and y_is_num:
+            x_arr = x_series.to_numpy()
+            y_arr = y_series.to_numpy()
             if series_col and series_col in plot_df.columns:
-                for val in plot_df[series_col].dropna().unique():
-                    sub = plot_df[plot_df[series_col] == val]
-                    ax.scatter(sub[x_col], sub[y_col], label=str(val), alpha=0.7)
+                for val, idx in _series_groups(plot_df[series_col]):
+                    ax.scatter(x_arr[idx], y_arr[idx], label=str(val), alpha=0.7)
                 ax.legend()
             else:
-                ax.scatter(x_series, y_series, alpha=0.7)
+                ax.scatter(x_arr, y_arr, alpha=0.7)
         else:
-            ax.scatter(range(len(plot_df)), y_series if pd.api.types.is_numeric_dtype(y_series) else range(len(plot_df)), alpha=0.7)
-            ax.set_xticks(range(len(plot_df)))
-            ax.set_xticklabels([str(x_series.iloc[i]) for i in range(len(plot_df))], rotation=45, ha="right")
+            x_pos = np.arange(len(plot_df))
+            ax.scatter(x_pos, y_series if y_is_num else x_pos, alpha=0.7)
+            ax.set_xticks(x_pos)
+            # str() per value rather than astype(str), which keeps NaN/NaT as missing
+            ax.set_xticklabels(list(map(str, x_series)), rotation=45, ha="right")
 
     elif chart_type == "histogram":
         col = x_col if x_col in plot_df.columns else (numeric_cols[0] if numeric_cols else None)
@@ -151,7 +238,12 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
         series = plot_df[col].dropna()
         if not pd.api.types.is_numeric_dtype(series):
             series = pd.to_numeric(series, errors="coerce").dropna()
-        ax.hist(series, bins=min(30, max(10, len(series) // 5)), color=plt.cm.viridis(0.5), edgecolor="gray")
+        vals = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+        # Freedman-Diaconis/Sturges ("auto") edges, capped so a long tail cannot explode the bin count
+        edges = np.histogram_bin_edges(vals, bins="auto")
+        if len(edges) - 1 > _HIST_MAX_BINS:
+            edges = np.histogram_bin_edges(vals, bins=_HIST_MAX_BINS)
+        ax.hist(vals, bins=edges, color=_HIST_COLOR, edgecolor="gray")
 
     elif chart_type == "box":
         if y_col and y_col in plot_df.columns:
@@ -168,18 +260,18 @@ def build_figure(df: pd.DataFrame, options: dict[str, Any]) -> plt.Figure:
     elif chart_type == "pie":
         if y_cols and all(c in plot_df.columns for c in y_cols):
             # One pie: wedge labels = y_cols, sizes = sum per column (or mean)
-            sizes = [plot_df[c].sum() for c in y_cols]
-            if sum(sizes) == 0:
-                sizes = [plot_df[c].mean() for c in y_cols]
+            sizes = plot_df[list(y_cols)].sum().to_numpy()
+            if sizes.sum() == 0:
+                sizes = plot_df[list(y_cols)].mean().to_numpy()
             labels = list(y_cols)
-            colors = plt.cm.viridis([i / max(1, len(y_cols)) for i in range(len(y_cols))])
+            colors = _viridis_colors(len(y_cols))
             ax.pie(sizes, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90)
         elif y_col and y_col in plot_df.columns and x_col and x_col in plot_df.columns:
             # One pie: x_col as labels, y_col as sizes
             plot_agg = plot_df.groupby(x_col, dropna=False)[y_col].sum().reset_index()
             labels = plot_agg[x_col].astype(str).tolist()
             sizes = plot_agg[y_col].tolist()
-            colors = plt.cm.viridis([i / max(1, len(sizes)) for i in range(len(sizes))])
+            colors = _viridis_colors(len(sizes))
             ax.pie(sizes, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90)
         else:
             raise ValueError("Pie chart requires y_cols (list) or x_col and y_col")
@@ -198,6 +198,7 @@ a = Analysis(
         'PySide6.QtCore',
         'PySide6.QtWidgets',
         'PySide6.QtGui',
+        'PySide6.QtNetwork',  # NLServerManager readiness probes
         'PySide6.QtCharts',  # Used in stat_dialog_ui
         'PySide6.QtOpenGL',  # Often needed for Qt apps
         'sqlite3',